@@ -14,29 +14,87 @@ APP_COPYRIGHT = "\u00a9 2026 BigLinux Team"
 BASE_DIR = os.path.dirname(os.path.realpath(__file__))
 
 
-class BackendType(enum.Enum):
-    V4L2 = "v4l2"
-    GPHOTO2 = "gphoto2"
-    LIBCAMERA = "libcamera"
-    PIPEWIRE = "pipewire"
-    IP = "ip"
-    PHONE = "phone"
-    SCRCPY = "scrcpy"
-
-
-class ControlCategory(enum.Enum):
-    IMAGE = "image"
-    EXPOSURE = "exposure"
-    FOCUS = "focus"
-    WHITE_BALANCE = "wb"
-    CAPTURE = "capture"
-    STATUS = "status"
-    ADVANCED = "advanced"
-
-
-class ControlType(enum.Enum):
-    INTEGER = "int"
-    BOOLEAN = "bool"
-    MENU = "menu"
-    BUTTON = "button"
-    STRING = "string"
+class _LabeledIntEnum(enum.IntEnum):
+    """Int-valued enum (cheap compare/hash) that keeps a short string label.
+
+    The label is what the string-valued enums used to hold; use it for
+    logging and serialization, and ``from_label()`` to parse it back.
+    """
+
+    @property
+    def label(self) -> str:
+        return _LABELS[type(self)][self]
+
+    @classmethod
+    def from_label(cls, label: str) -> "_LabeledIntEnum":
+        return _BY_LABEL[cls][label]
+
+    def __str__(self) -> str:
+        return self.label
+
+
+@enum.unique
+class BackendType(_LabeledIntEnum):
+    V4L2 = enum.auto()
+    GPHOTO2 = enum.auto()
+    LIBCAMERA = enum.auto()
+    PIPEWIRE = enum.auto()
+    IP = enum.auto()
+    PHONE = enum.auto()
+    SCRCPY = enum.auto()
+
+
+@enum.unique
+class ControlCategory(_LabeledIntEnum):
+    IMAGE = enum.auto()
+    EXPOSURE = enum.auto()
+    FOCUS = enum.auto()
+    WHITE_BALANCE = enum.auto()
+    CAPTURE = enum.auto()
+    STATUS = enum.auto()
+    ADVANCED = enum.auto()
+
+
+@enum.unique
+class ControlType(_LabeledIntEnum):
+    INTEGER = enum.auto()
+    BOOLEAN = enum.auto()
+    MENU = enum.auto()
+    BUTTON = enum.auto()
+    STRING = enum.auto()
+
+
+# Per-class tables: IntEnum members of different classes compare (and hash)
+# equal when their values match, so they must not share one dict.
+_LABELS: dict[type, dict[_LabeledIntEnum, str]] = {
+    BackendType: {
+        BackendType.V4L2: "v4l2",
+        BackendType.GPHOTO2: "gphoto2",
+        BackendType.LIBCAMERA: "libcamera",
+        BackendType.PIPEWIRE: "pipewire",
+        BackendType.IP: "ip",
+        BackendType.PHONE: "phone",
+        BackendType.SCRCPY: "scrcpy",
+    },
+    ControlCategory: {
+        ControlCategory.IMAGE: "image",
+        ControlCategory.EXPOSURE: "exposure",
+        ControlCategory.FOCUS: "focus",
+        ControlCategory.WHITE_BALANCE: "wb",
+        ControlCategory.CAPTURE: "capture",
+        ControlCategory.STATUS: "status",
+        ControlCategory.ADVANCED: "advanced",
+    },
+    ControlType: {
+        ControlType.INTEGER: "int",
+        ControlType.BOOLEAN: "bool",
+        ControlType.MENU: "menu",
+        ControlType.BUTTON: "button",
+        ControlType.STRING: "string",
+    },
+}
+
+_BY_LABEL: dict[type, dict[str, _LabeledIntEnum]] = {
+    cls: {label: member for member, label in labels.items()}
+    for cls, labels in _LABELS.items()
+}
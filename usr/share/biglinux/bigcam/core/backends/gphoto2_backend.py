@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
+import hashlib
 import logging
 import os
 import re
+import select
+import shutil
 import signal
 import subprocess
 import threading
 import time
 from typing import Any
 
+try:
+    import gphoto2 as gp
+
+    _HAS_GPHOTO2 = True
+except ImportError:
+    _HAS_GPHOTO2 = False
+
 from constants import BackendType, ControlCategory, ControlType, BASE_DIR
 from core.camera_backend import CameraBackend, CameraControl, CameraInfo, VideoFormat
+from utils import spawn
 from utils.i18n import _
 
 log = logging.getLogger(__name__)
@@ -20,74 +34,269 @@ log = logging.getLogger(__name__)
 # Unique UDP port per process instance (avoids conflicts with multi-instance)
 _UDP_PORT = 5000 + (os.getpid() % 1000)
 
+# Field lines of a gphoto2 config entry ("Label: ISO Speed", "Choice: 0 Auto"),
+# scanned over the whole entry at once
+_FIELD_RE = re.compile(
+    r"^(Label|Type|Current|Choice|Bottom|Top|Step|Readonly):[ \t]*(.*)$", re.MULTILINE
+)
+# Config paths in ``list-config`` output, one per line
+_CONFIG_PATH_RE = re.compile(r"^[ \t]*(/[^\n]*?)\s*$", re.MULTILINE)
+# One camera row of ``gphoto2 --auto-detect`` ("Canon EOS 600D   usb:001,005");
+# the header and separator rows never match
+_CAM_RE = re.compile(r"^(?P<name>.+?)\s+(?P<port>usb:[0-9,]+)\s*$", re.MULTILINE)
+_USB_PORT_RE = re.compile(r"usb:(\d+),(\d+)")
+# Prompt printed by ``gphoto2 --shell`` after each command, e.g.
+# "gphoto2: {/home/user} /> "
+_SHELL_PROMPT_RE = re.compile(rb"gphoto2: \{[^}]*\}[^\n>]*> ")
+_SHELL_TIMEOUT = 15
+_SAVED_FILE_RE = re.compile(r"Saving file as (.+)$", re.MULTILINE)
+# Result cache lifetime (seconds) for detect_cameras()
+_DETECT_TTL = 4.0
+# Parsed-control cache bound (entries are dropped wholesale past this)
+_CTRL_CACHE_MAX = 4096
+# Streaming helpers (any port) swept when stopping all sessions
+_STALE_STREAM_PATTERN = "gphoto2 --|ffmpeg.*mpegts|ffmpeg.*v4l2"
+# GVFS processes that grab PTP cameras as soon as they appear
+_GVFS_PROCS = (b"gvfs-gphoto2-volume-monitor", b"gvfsd-gphoto2")
+# Seconds a clean /proc sweep is trusted once the GVFS unit is masked
+_GVFS_RECHECK = 10.0
+_FIELD_KEYS = {
+    "Label": "label",
+    "Type": "type",
+    "Current": "current",
+    "Bottom": "min",
+    "Top": "max",
+    "Step": "step",
+    "Readonly": "readonly",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_script() -> str | None:
+    """Locate the streaming script once and make sure it is executable."""
+    script = os.path.join(BASE_DIR, "script", "run_webcam_gphoto2.sh")
+    if not os.path.isfile(script):
+        script = os.path.join(BASE_DIR, "script", "run_webcam.sh")
+    if not os.path.isfile(script):
+        log.error("GPhoto2 streaming script not found: %s", script)
+        return None
+    if not os.access(script, os.X_OK):
+        try:
+            os.chmod(script, 0o755)
+        except OSError:
+            pass
+    return script
+
+
+@functools.lru_cache(maxsize=1)
+def _seed_gphoto_settings() -> None:
+    """Raise libgphoto2's PTP cache lifetime unless the user already set one.
+
+    The ptp2 driver re-reads device info and property lists once its cache
+    expires (2 s by default), which slows down back-to-back captures and
+    config reads.
+    """
+    path = os.path.expanduser("~/.gphoto/settings")
+    try:
+        with open(path) as f:
+            if any(line.startswith("ptp2=cachetime=") for line in f):
+                return
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a") as f:
+            f.write("ptp2=cachetime=20\n")
+        log.debug("Seeded %s with ptp2=cachetime=20", path)
+    except OSError as exc:
+        log.debug("Could not seed %s: %s", path, exc)
+
+
+# gPhoto2 config leaf names per control category
+_EXPOSURE_KEYS = frozenset({
+    "iso", "shutterspeed", "aperture", "f-number", "exposurecompensation",
+    "autoexposuremode", "autoexposuremodedial", "expprogram", "meteringmode", "aeb",
+    "bracketmode", "exposuremetermode", "exposureiso", "aebracket",
+    "manualexposurecompensation",
+})
+# Flash settings are listed under exposure
+_FLASH_KEYS = frozenset({
+    "flashmode", "flashcompensation", "internalflashmode", "flashopen", "flashcharge",
+})
+_FOCUS_KEYS = frozenset({
+    "focusmode", "manualfocusdrive", "autofocusdrive", "focusarea", "focuspoints",
+    "continuousaf", "cancelautofocus", "afbeam", "afmethod", "focuslock", "afoperation",
+})
+_WHITE_BALANCE_KEYS = frozenset({
+    "whitebalance", "whitebalanceadjust", "whitebalanceadjusta", "whitebalancexa",
+    "whitebalancexb", "colortemperature", "wb_adjust",
+})
+_IMAGE_KEYS = frozenset({
+    "imageformat", "imageformatsd", "imageformatcf", "imageformatexthd", "imagesize",
+    "imagequality", "picturestyle", "colorspace", "contrast", "saturation", "sharpness",
+    "hue", "colormodel", "highlighttonepr", "shadowtonepr", "highisonr", "longexpnr",
+    "aspectratio",
+})
+_CAPTURE_KEYS = frozenset({
+    "drivemode", "capturemode", "capturetarget", "eosremoterelease", "viewfinder",
+    "reviewtime", "eoszoomposition", "eoszoom", "eosvfmode", "output", "movieservoaf",
+    "liveviewsize", "remotemode",
+})
+# Read-only info
+_STATUS_KEYS = frozenset({
+    "batterylevel", "lensname", "serialnumber", "cameramodel", "deviceversion",
+    "availableshots", "eosserialnumber", "firmwareversion", "model", "ptpversion",
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _gphoto2_available() -> bool:
+    """Whether the gphoto2 CLI is on $PATH (checked once per process).
+
+    Set BIGCAM_STRICT_AVAILABILITY=1 to also run ``gphoto2 --version``.
+    """
+    if shutil.which("gphoto2") is None:
+        return False
+    if not os.environ.get("BIGCAM_STRICT_AVAILABILITY"):
+        return True
+    try:
+        spawn.run(["gphoto2", "--version"], capture_output=True, check=True, timeout=5)
+    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return False
+    return True
+
 
 class GPhoto2Backend(CameraBackend):
     """Backend for DSLR / mirrorless cameras via libgphoto2."""
 
     _streaming_process: subprocess.Popen | None = None
     # Track active streaming sessions per camera port
-    # port -> {"udp_port": str, "launch_port": str}
-    _active_streams: dict[str, dict[str, str]] = {}
+    # port -> {"udp_port": str, "launch_port": str, "pgid": int}
+    _active_streams: dict[str, dict[str, Any]] = {}
     _streams_lock = threading.Lock()
     _streaming_active: bool = False
     _last_detected: list[CameraInfo] = []
+    # Long-lived ``gphoto2 --shell`` coprocess (avoids libgphoto2 startup
+    # and camera re-enumeration on every config read/write or capture)
+    _shell: subprocess.Popen | None = None
+    _shell_port: str = ""
+    _shell_buf: bytes = b""
+    _shell_lock = threading.Lock()
+    # In-process libgphoto2 session (python-gphoto2), preferred over the
+    # shell for config reads/writes; guarded by _shell_lock as well
+    _gp_camera: Any = None
+    _gp_port: str = ""
+    _gvfs_masked: bool = False
+    _gvfs_cleared_at: float = 0.0
+    # (timestamp, value) caches so repeated UI refreshes don't re-probe USB
+    _cam_cache: tuple[float, list[CameraInfo]] | None = None
+    # /dev/bus/usb snapshot taken with the cached detection result; only
+    # kept when that detection ran to completion
+    _cam_cache_topology: tuple[str, ...] | None = None
+    # Whether the last gphoto2 --auto-detect run succeeded
+    _detect_ok: bool = False
+    # (port, config path, digest of its text) -> parsed control; most
+    # entries come back byte-identical on every control refresh
+    _ctrl_cache: dict[tuple[str, str, bytes], CameraControl] = {}
+    # MPEG-TS stream the streaming script sends to the local UDP port
+    _TEMPLATE_UDP_MPEGTS = (
+        "udpsrc port={port} address=127.0.0.1 "
+        'caps="video/mpegts,packetsize=(int)1316" ! '
+        "queue max-size-bytes=2097152 leaky=downstream ! tsdemux ! decodebin ! videoconvert"
+    )
 
     def get_backend_type(self) -> BackendType:
         return BackendType.GPHOTO2
 
-    @staticmethod
-    def _kill_gvfs() -> None:
+    @classmethod
+    def _kill_gvfs(cls) -> None:
         """Kill GVFS processes that interfere with gphoto2 USB access."""
-        subprocess.run(
-            ["systemctl", "--user", "stop", "gvfs-gphoto2-volume-monitor.service"],
-            capture_output=True,
-            timeout=5,
-        )
-        subprocess.run(
-            ["systemctl", "--user", "mask", "gvfs-gphoto2-volume-monitor.service"],
-            capture_output=True,
-            timeout=5,
-        )
-        subprocess.run(
-            ["pkill", "-9", "-f", "gvfs-gphoto2-volume-monitor"],
-            capture_output=True,
-            timeout=5,
-        )
-        subprocess.run(
-            ["pkill", "-9", "-f", "gvfsd-gphoto2"],
-            capture_output=True,
-            timeout=5,
-        )
-        subprocess.run(
-            ["gio", "mount", "-u", "gphoto2://"],
-            capture_output=True,
-            timeout=5,
-        )
+        if cls._gvfs_masked and time.monotonic() - cls._gvfs_cleared_at < _GVFS_RECHECK:
+            # Unit is masked and the last sweep found the bus clear
+            return
+        if not cls._gvfs_masked:
+            # A stopped + masked unit stays down for the whole session, so
+            # the systemctl/gio round-trips only need to happen once.
+            for cmd in (
+                ["systemctl", "--user", "stop", "gvfs-gphoto2-volume-monitor.service"],
+                ["systemctl", "--user", "mask", "gvfs-gphoto2-volume-monitor.service"],
+                ["gio", "mount", "-u", "gphoto2://"],
+            ):
+                try:
+                    spawn.run(cmd, capture_output=True, timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+            cls._gvfs_masked = True
+        cls._release_usb()
+        cls._gvfs_cleared_at = time.monotonic()
 
     @staticmethod
-    def _release_usb_device(port: str) -> None:
+    def _release_usb(timeout: float = 0.5) -> None:
+        """Kill lingering GVFS gphoto2 processes and wait until they exit.
+
+        Returns immediately when nothing is running instead of sleeping a
+        fixed interval.
+        """
+        pids: list[int] = []
+        try:
+            entries = os.listdir("/proc")
+        except OSError:
+            return
+        for name in entries:
+            if not name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{name}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            if any(p in cmdline for p in _GVFS_PROCS):
+                pid = int(name)
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                    pids.append(pid)
+                except (ProcessLookupError, PermissionError):
+                    pass
+        deadline = time.monotonic() + timeout
+        while pids and time.monotonic() < deadline:
+            time.sleep(0.05)
+            alive = []
+            for pid in pids:
+                try:
+                    os.kill(pid, 0)
+                    alive.append(pid)
+                except (ProcessLookupError, PermissionError):
+                    pass
+            pids = alive
+
+    def _release_usb_device(self, port: str) -> None:
         """Kill GVFS processes holding the USB device so gphoto2 can open it."""
         _GVFS_PATTERNS = ("gvfs", "gphoto")
+        own_pids = {os.getpid()}
+        if self._shell is not None:
+            own_pids.add(self._shell.pid)
         try:
             bus, dev = port.replace("usb:", "").split(",")
             usb_path = f"/dev/bus/usb/{bus}/{dev}"
             if not os.path.exists(usb_path):
                 return
-            result = subprocess.run(
+            result = spawn.run(
                 ["fuser", usb_path],
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
             pids = result.stdout.strip().split()
-            killed = False
+            killed: list[int] = []
             for pid_str in pids:
                 pid_str = pid_str.strip().rstrip(":")
                 if not pid_str.isdigit():
                     continue
                 pid = int(pid_str)
-                # Skip our own process
-                if pid == os.getpid():
+                # Skip our own process and our gphoto2 shell
+                if pid in own_pids:
                     continue
                 try:
                     cmdline_path = f"/proc/{pid}/cmdline"
@@ -98,32 +307,85 @@ class GPhoto2Backend(CameraBackend):
                     if any(p in cmdline for p in _GVFS_PATTERNS):
                         os.kill(pid, signal.SIGKILL)
                         log.debug("Killed GVFS PID %d", pid)
-                        killed = True
+                        killed.append(pid)
                     else:
                         log.info("PID %d on %s is not GVFS — skipping", pid, usb_path)
                 except (ProcessLookupError, FileNotFoundError, PermissionError):
                     pass
-            if killed:
-                time.sleep(3)
+            # The USB claim goes away with the holder's descriptors: wait for
+            # that (bounded by the old fixed 3 s) instead of always sleeping
+            deadline = time.monotonic() + 3.0
+            while killed and time.monotonic() < deadline:
+                time.sleep(0.05)
+                killed = [pid for pid in killed if self._holds_fds(pid)]
         except Exception:
             pass
 
+    @staticmethod
+    def _holds_fds(pid: int) -> bool:
+        """Whether *pid* still has open descriptors (False once exited/zombie)."""
+        try:
+            return bool(os.listdir(f"/proc/{pid}/fd"))
+        except PermissionError:
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _sysfs_usb_info(bus: str, dev: str) -> str:
+        """Return "vendor:product name" for a USB bus/device pair via sysfs."""
+        root = "/sys/bus/usb/devices"
+        try:
+            entries = os.listdir(root)
+        except OSError:
+            return ""
+        want = (int(bus), int(dev))
+        for entry in entries:
+            # Interfaces ("1-2:1.0") have no busnum/devnum
+            if ":" in entry:
+                continue
+            base = os.path.join(root, entry)
+            try:
+                with open(os.path.join(base, "busnum")) as f:
+                    busnum = int(f.read())
+                with open(os.path.join(base, "devnum")) as f:
+                    devnum = int(f.read())
+                if (busnum, devnum) != want:
+                    continue
+                fields = []
+                for attr in ("idVendor", "idProduct", "product"):
+                    try:
+                        with open(os.path.join(base, attr)) as f:
+                            fields.append(f.read().strip())
+                    except OSError:
+                        fields.append("")
+            except (OSError, ValueError):
+                continue
+            return f"{fields[0]}:{fields[1]} {fields[2]}".strip()
+        return ""
+
     @staticmethod
     def _diagnose_usb(port: str) -> None:
-        """Print diagnostic info about a USB device for debugging."""
+        """Print diagnostic info about a USB device for debugging.
+
+        Runs fuser, gphoto2 and dmesg purely for the log, so it does
+        nothing unless debug logging is on.
+        """
+        if not log.isEnabledFor(logging.DEBUG):
+            return
         try:
             bus, dev = port.replace("usb:", "").split(",")
             usb_path = f"/dev/bus/usb/{bus}/{dev}"
 
             # Check device existence and permissions
             exists = os.path.exists(usb_path)
-            log.debug(f"USB diag: {usb_path} exists={exists}")
+            log.debug("USB diag: %s exists=%s", usb_path, exists)
             if not exists:
                 # Show what devices ARE on this bus
                 bus_dir = f"/dev/bus/usb/{bus}"
                 if os.path.isdir(bus_dir):
                     devs = sorted(os.listdir(bus_dir))
-                    log.debug(f"USB diag: devices on bus {bus}: {devs}")
+                    log.debug("USB diag: devices on bus %s: %s", bus, devs)
                 return
 
             # Check file permissions
@@ -132,44 +394,34 @@ class GPhoto2Backend(CameraBackend):
             st = os.stat(usb_path)
             mode = stat.filemode(st.st_mode)
             log.debug(
-                f"USB diag: {usb_path} mode={mode} uid={st.st_uid} gid={st.st_gid}"
+                "USB diag: %s mode=%s uid=%d gid=%d", usb_path, mode, st.st_uid, st.st_gid
             )
 
-            # Check lsusb for this specific device
-            result = subprocess.run(
-                ["lsusb", "-s", f"{bus}:{dev}"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            log.debug(f"USB diag lsusb: {result.stdout.strip()}")
+            # Vendor/product of this specific device straight from sysfs
+            log.debug("USB diag sysfs: %s", GPhoto2Backend._sysfs_usb_info(bus, dev))
 
             # Check fuser
-            result = subprocess.run(
+            result = spawn.run(
                 ["fuser", usb_path],
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
             holders = result.stdout.strip()
-            log.debug(f"USB diag fuser: '{holders}'")
+            log.debug("USB diag fuser: '%s'", holders)
 
             # Check gphoto2 --auto-detect
-            result = subprocess.run(
+            result = spawn.run(
                 ["gphoto2", "--auto-detect"],
                 capture_output=True,
                 text=True,
                 timeout=10,
             )
-            lines = [
-                ln.strip()
-                for ln in result.stdout.strip().splitlines()[2:]
-                if ln.strip()
-            ]
-            log.debug(f"USB diag auto-detect: {lines}")
+            lines = [m.group(0).strip() for m in _CAM_RE.finditer(result.stdout)]
+            log.debug("USB diag auto-detect: %s", lines)
 
             # Check dmesg for recent USB errors on this bus
-            result = subprocess.run(
+            result = spawn.run(
                 ["dmesg", "--time-format=reltime"],
                 capture_output=True,
                 text=True,
@@ -183,16 +435,17 @@ class GPhoto2Backend(CameraBackend):
                 and "usb" in ln.lower()
             ]
             if usb_errors:
-                log.debug(f"USB diag dmesg errors: {usb_errors[-5:]}")
+                log.debug("USB diag dmesg errors: %s", usb_errors[-5:])
         except Exception as exc:
-            log.debug(f"USB diag error: {exc}")
+            log.debug("USB diag error: %s", exc)
 
     def is_available(self) -> bool:
-        try:
-            subprocess.run(["gphoto2", "--version"], capture_output=True, check=True, timeout=5)
-            return True
-        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            return False
+        return _gphoto2_available()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached detection results (USB topology or streaming changed)."""
+        self._cam_cache = None
+        self._cam_cache_topology = None
 
     @staticmethod
     def _check_capture_support(port: str) -> bool:
@@ -205,7 +458,7 @@ class GPhoto2Backend(CameraBackend):
             ["gphoto2", "--port", port, "--abilities"],
         ):
             try:
-                result = subprocess.run(
+                result = spawn.run(
                     cmd, capture_output=True, text=True, timeout=15, env=env,
                 )
                 if result.returncode != 0:
@@ -228,7 +481,7 @@ class GPhoto2Backend(CameraBackend):
         """
         env = {**os.environ, "LANG": "C", "LC_ALL": "C"}
         try:
-            result = subprocess.run(
+            result = spawn.run(
                 ["gphoto2", "--port", port, "--list-config"],
                 capture_output=True, text=True, timeout=15, env=env,
             )
@@ -251,42 +504,364 @@ class GPhoto2Backend(CameraBackend):
         except Exception:
             return True  # assume OK on error
 
+    # -- gphoto2 shell -------------------------------------------------------
+
+    def _read_until_prompt(self, shell: subprocess.Popen, timeout: float) -> str | None:
+        """Read shell output up to the next prompt; None on EOF or timeout.
+
+        Output after the prompt (replies to pipelined commands) is kept in
+        ``_shell_buf`` for the next call.
+        """
+        fd = shell.stdout.fileno()
+        buf = self._shell_buf
+        deadline = time.monotonic() + timeout
+        while True:
+            # Match on bytes and decode only this reply: with pipelined
+            # commands the buffer holds many replies at once.
+            m = _SHELL_PROMPT_RE.search(buf)
+            if m:
+                self._shell_buf = buf[m.end() :]
+                return buf[: m.start()].decode("utf-8", errors="replace")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return None
+            buf += chunk
+            self._shell_buf = buf
+
+    def _ensure_shell(self, port: str) -> subprocess.Popen | None:
+        """Return a running ``gphoto2 --shell`` bound to *port*, spawning it lazily."""
+        shell = self._shell
+        if shell is not None and shell.poll() is None and self._shell_port == port:
+            return shell
+        self._close_shell()
+        # Only one of the shell and the binding can hold the camera
+        self._close_gp_camera()
+        _seed_gphoto_settings()
+        try:
+            shell = subprocess.Popen(
+                ["gphoto2", "--port", port, "--keep", "--force-overwrite", "--shell"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env={**os.environ, "LANG": "C", "LC_ALL": "C"},
+            )
+        except OSError as exc:
+            log.debug("Failed to start gphoto2 shell: %s", exc)
+            return None
+        self._shell = shell
+        self._shell_port = port
+        self._shell_buf = b""
+        if self._read_until_prompt(shell, _SHELL_TIMEOUT) is None:
+            log.debug("gphoto2 shell on %s did not become ready", port)
+            self._close_shell()
+            return None
+        log.debug("gphoto2 shell started on %s (pid %d)", port, shell.pid)
+        return shell
+
+    def _shell_cmd(
+        self, port: str, cmd: str, timeout: float = _SHELL_TIMEOUT
+    ) -> str | None:
+        """Run one shell command and return its output (None if the shell failed)."""
+        outputs = self._shell_cmds(port, [cmd], timeout)
+        return outputs[0] if outputs else None
+
+    def _shell_cmds(
+        self, port: str, cmds: list[str], timeout: float = _SHELL_TIMEOUT
+    ) -> list[str] | None:
+        """Pipeline *cmds* into the shell and return one output per command.
+
+        All commands are written up front so gphoto2 never waits on a
+        Python round-trip between them.  Returns None if the shell failed.
+        """
+        with self._shell_lock:
+            shell = self._ensure_shell(port)
+            if shell is None:
+                return None
+            try:
+                shell.stdin.write("".join(f"{c}\n" for c in cmds).encode())
+                shell.stdin.flush()
+            except (BrokenPipeError, OSError):
+                self._close_shell()
+                return None
+            outputs: list[str] = []
+            for cmd in cmds:
+                output = self._read_until_prompt(shell, timeout)
+                if output is None:
+                    log.debug("gphoto2 shell command %r failed, closing shell", cmd)
+                    self._close_shell()
+                    return None
+                outputs.append(output)
+            return outputs
+
+    def _close_shell(self) -> None:
+        """Quit the gphoto2 shell, releasing the USB device."""
+        shell = self._shell
+        self._shell = None
+        self._shell_port = ""
+        self._shell_buf = b""
+        if shell is None:
+            return
+        try:
+            if shell.poll() is None:
+                shell.stdin.write(b"quit\n")
+                shell.stdin.flush()
+                shell.wait(timeout=2)
+        except (BrokenPipeError, OSError, subprocess.TimeoutExpired):
+            shell.kill()
+            shell.wait()
+
+    def close(self) -> None:
+        """Release the persistent gphoto2 shell / libgphoto2 session (if any)."""
+        with self._shell_lock:
+            self._close_shell()
+            self._close_gp_camera()
+
+    def _shell_get_controls(self, port: str) -> list[CameraControl]:
+        """Read every config entry through the shell (no process spawns)."""
+        listing = self._shell_cmd(port, "list-config")
+        if not listing:
+            return []
+        paths = _CONFIG_PATH_RE.findall(listing)
+        outputs = self._shell_cmds(port, [f"get-config {p}" for p in paths])
+        if outputs is None:
+            return []
+        controls: list[CameraControl] = []
+        for cfg_path, out in zip(paths, outputs):
+            ctrl = self._parse_config_cached(port, cfg_path, out)
+            if ctrl:
+                controls.append(ctrl)
+        return controls
+
+    # -- libgphoto2 binding ----------------------------------------------------
+
+    def _gp_camera_for(self, port: str) -> Any:
+        """Return an initialised ``gp.Camera`` on *port*; caller holds the lock."""
+        cam = self._gp_camera
+        if cam is not None and self._gp_port == port:
+            return cam
+        self._close_gp_camera()
+        self._close_shell()
+        _seed_gphoto_settings()
+        try:
+            port_list = gp.PortInfoList()
+            port_list.load()
+            cam = gp.Camera()
+            cam.set_port_info(port_list[port_list.lookup_path(port)])
+            cam.init()
+        except gp.GPhoto2Error as exc:
+            log.debug("libgphoto2 could not open %s: %s", port, exc)
+            return None
+        self._gp_camera = cam
+        self._gp_port = port
+        return cam
+
+    def _close_gp_camera(self) -> None:
+        cam = self._gp_camera
+        self._gp_camera = None
+        self._gp_port = ""
+        if cam is not None:
+            try:
+                cam.exit()
+            except gp.GPhoto2Error:
+                pass
+
+    def _gp_get_controls(self, port: str) -> list[CameraControl] | None:
+        """Read the whole config tree in-process; None if the binding failed."""
+        with self._shell_lock:
+            cam = self._gp_camera_for(port)
+            if cam is None:
+                return None
+            try:
+                root = cam.get_config()
+            except gp.GPhoto2Error as exc:
+                log.debug("libgphoto2 get_config failed: %s", exc)
+                self._close_gp_camera()
+                return None
+        controls: list[CameraControl] = []
+        self._collect_gp_controls(root, "", controls)
+        return controls
+
+    @classmethod
+    def _collect_gp_controls(
+        cls, widget: Any, parent: str, out: list[CameraControl]
+    ) -> None:
+        path = f"{parent}/{widget.get_name()}"
+        wtype = widget.get_type()
+        if wtype in (gp.GP_WIDGET_WINDOW, gp.GP_WIDGET_SECTION):
+            for child in widget.get_children():
+                cls._collect_gp_controls(child, path, out)
+            return
+        ctrl = cls._gp_widget_control(path, widget, wtype)
+        if ctrl:
+            out.append(ctrl)
+
+    @classmethod
+    def _gp_widget_control(cls, cfg_path: str, widget: Any, wtype: int) -> CameraControl | None:
+        """Build the same CameraControl _parse_config makes from CLI output."""
+        if wtype in (gp.GP_WIDGET_RADIO, gp.GP_WIDGET_MENU):
+            ctype = ControlType.MENU
+        elif wtype == gp.GP_WIDGET_TOGGLE:
+            ctype = ControlType.BOOLEAN
+        elif wtype == gp.GP_WIDGET_RANGE:
+            ctype = ControlType.INTEGER
+        elif wtype in (gp.GP_WIDGET_TEXT, gp.GP_WIDGET_DATE):
+            ctype = ControlType.STRING
+        else:
+            return None
+        try:
+            current = widget.get_value()
+        except gp.GPhoto2Error:
+            current = ""
+        ctrl = CameraControl(
+            id=cfg_path,
+            name=widget.get_label(),
+            category=cls._categorize(cfg_path),
+            control_type=ctype,
+            value=current,
+            default=current,
+            flags="read-only" if widget.get_readonly() else "",
+        )
+        if ctype == ControlType.INTEGER:
+            lo, hi, step = widget.get_range()
+            ctrl.minimum, ctrl.maximum, ctrl.step = int(lo), int(hi), int(step)
+            ctrl.value = ctrl.default = int(current or 0)
+        elif ctype == ControlType.MENU:
+            choices = list(widget.get_choices())
+            if choices:
+                ctrl.choices = choices
+            ctrl.value = ctrl.default = "" if current is None else str(current)
+        elif ctype == ControlType.BOOLEAN:
+            ctrl.value = ctrl.default = bool(current)
+        else:
+            ctrl.value = ctrl.default = "" if current is None else str(current)
+        return ctrl
+
+    def _gp_set_controls(
+        self, port: str, items: list[tuple[str, Any]]
+    ) -> dict[str, bool] | None:
+        """Write configs in-process with one set_config; None if the binding failed."""
+        with self._shell_lock:
+            cam = self._gp_camera_for(port)
+            if cam is None:
+                return None
+            try:
+                cfg = cam.get_config()
+                results: dict[str, bool] = {}
+                for cid, value in items:
+                    try:
+                        widget = cfg.get_child_by_name(cid.rpartition("/")[2])
+                        wtype = widget.get_type()
+                        if wtype == gp.GP_WIDGET_RANGE:
+                            value = float(value)
+                        elif wtype == gp.GP_WIDGET_TOGGLE:
+                            value = int(str(value).lower() in ("1", "true", "on"))
+                        else:
+                            value = str(value)
+                        widget.set_value(value)
+                        results[cid] = True
+                    except (gp.GPhoto2Error, ValueError):
+                        results[cid] = False
+                cam.set_config(cfg)
+            except gp.GPhoto2Error as exc:
+                log.debug("libgphoto2 set_config failed: %s", exc)
+                self._close_gp_camera()
+                return None
+        return results
+
+    def _shell_capture(self, port: str, output_path: str) -> bool:
+        """Capture and download a photo through the shell into *output_path*."""
+        out_dir = os.path.dirname(output_path) or "."
+        if self._shell_cmd(port, f"lcd {out_dir}") is None:
+            return False
+        out = self._shell_cmd(port, "capture-image-and-download", timeout=30)
+        if not out:
+            return False
+        saved = _SAVED_FILE_RE.findall(out)
+        if not saved:
+            log.debug("Shell capture produced no file: %s", out[:200])
+            return False
+        # RAW+JPEG modes download two files; prefer the JPEG
+        name = next((n for n in saved if n.lower().endswith((".jpg", ".jpeg"))), saved[0])
+        src = os.path.join(out_dir, name.strip())
+        try:
+            if os.path.abspath(src) != os.path.abspath(output_path):
+                os.replace(src, output_path)
+        except OSError as exc:
+            log.debug("Shell capture rename failed: %s", exc)
+            return False
+        return os.path.isfile(output_path)
+
     # -- detection -----------------------------------------------------------
 
     def detect_cameras(self) -> list[CameraInfo]:
+        cached = self._cam_cache
+        if cached is not None and time.monotonic() - cached[0] < _DETECT_TTL:
+            return list(cached[1])
+        # Nothing was plugged or unplugged since the last run: the camera
+        # list cannot have changed, skip gphoto2 --auto-detect entirely.
+        topology = self._usb_topology()
+        if (
+            cached is not None
+            and topology is not None
+            and topology == self._cam_cache_topology
+        ):
+            self._cam_cache = (time.monotonic(), cached[1])
+            return list(cached[1])
+        cameras = self._detect_cameras()
+        self._cam_cache = (time.monotonic(), cameras)
+        # A timed out or still-claimed probe must be retried even if
+        # nothing is replugged
+        self._cam_cache_topology = topology if self._detect_ok else None
+        return list(cameras)
+
+    @staticmethod
+    def _usb_topology() -> tuple[str, ...] | None:
+        """Snapshot of USB device nodes ("001/005", ...); None if unavailable."""
+        try:
+            nodes = []
+            with os.scandir("/dev/bus/usb") as buses:
+                for bus in buses:
+                    with os.scandir(bus.path) as devs:
+                        nodes.extend(f"{bus.name}/{d.name}" for d in devs)
+        except OSError:
+            return None
+        return tuple(sorted(nodes))
+
+    def _detect_cameras(self) -> list[CameraInfo]:
         cameras: list[CameraInfo] = []
+        self._detect_ok = False
         try:
             # Kill GVFS to release the camera (skip if already streaming
             # to avoid disrupting an active session)
             if not self._streaming_active:
-                subprocess.run(
-                    ["pkill", "-f", "gvfs-gphoto2-volume-monitor"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                time.sleep(1)
+                self._release_usb()
 
-            # Retry up to 2 times in case GVFS hasn't released the device yet
-            max_attempts = 1 if self._streaming_active else 2
+            # Retry (with backoff) only while GVFS still holds the device;
+            # an empty listing otherwise just means no camera is attached.
+            max_attempts = 1 if self._streaming_active else 3
             for attempt in range(max_attempts):
-                result = subprocess.run(
+                if attempt:
+                    time.sleep(0.1 * 2 ** (attempt - 1))
+                result = spawn.run(
                     ["gphoto2", "--auto-detect"],
                     capture_output=True,
                     text=True,
                     timeout=15,
                 )
-                if result.returncode != 0:
+                claim_failed = "claim" in (result.stdout + result.stderr).lower()
+                self._detect_ok = result.returncode == 0 and not claim_failed
+                if result.returncode != 0 and not claim_failed:
                     break
 
-                for line in result.stdout.strip().splitlines()[2:]:
-                    line = line.strip()
-                    if not line or "usb:" not in line:
-                        continue
-                    parts = line.split("usb:")
-                    if len(parts) < 2:
-                        continue
-                    name = parts[0].strip() or _("Generic Camera")
-                    port = "usb:" + parts[1].strip()
+                for m in _CAM_RE.finditer(result.stdout):
+                    name = m.group("name").strip() or _("Generic Camera")
+                    port = m.group("port")
                     cam = CameraInfo(
                         id=f"gphoto2:{port}",
                         name=name,
@@ -297,10 +872,10 @@ class GPhoto2Backend(CameraBackend):
                     )
                     cameras.append(cam)
 
-                if cameras:
+                if cameras or not claim_failed:
                     break
                 if not self._streaming_active:
-                    time.sleep(1)
+                    self._release_usb()
         except Exception:
             pass
         if cameras:
@@ -311,7 +886,7 @@ class GPhoto2Backend(CameraBackend):
             still_connected = False
             for cam in self._last_detected:
                 port = cam.extra.get("port", cam.device_path)
-                m = re.match(r"usb:(\d+),(\d+)", port)
+                m = _USB_PORT_RE.match(port)
                 if m:
                     usb_path = f"/dev/bus/usb/{m.group(1)}/{m.group(2)}"
                     if os.path.exists(usb_path):
@@ -332,7 +907,7 @@ class GPhoto2Backend(CameraBackend):
         """Re-detect the current USB port for a camera (device number may change)."""
         old_port = camera.extra.get("port", camera.device_path)
         try:
-            result = subprocess.run(
+            result = spawn.run(
                 ["gphoto2", "--auto-detect"],
                 capture_output=True,
                 text=True,
@@ -341,25 +916,19 @@ class GPhoto2Backend(CameraBackend):
             if result.returncode != 0:
                 return old_port
 
-            for line in result.stdout.strip().splitlines()[2:]:
-                line = line.strip()
-                if not line or "usb:" not in line:
-                    continue
-                parts = line.split("usb:")
-                if len(parts) < 2:
-                    continue
-                name = parts[0].strip()
-                port = "usb:" + parts[1].strip()
+            for m in _CAM_RE.finditer(result.stdout):
+                name = m.group("name").strip()
+                port = m.group("port")
                 # Match by camera model name
                 if name and name in camera.name:
                     if port != old_port:
-                        log.debug(f"Port changed: {old_port} -> {port}")
+                        log.debug("Port changed: %s -> %s", old_port, port)
                         # Update _active_streams key if camera was streaming
                         with cls._streams_lock:
                             if old_port in cls._active_streams:
                                 stream_info = cls._active_streams.pop(old_port)
                                 cls._active_streams[port] = stream_info
-                                log.debug(f"Updated _active_streams: {old_port} -> {port}")
+                                log.debug("Updated _active_streams: %s -> %s", old_port, port)
                         camera.extra["port"] = port
                         camera.device_path = port
                         camera.id = f"gphoto2:{port}"
@@ -368,95 +937,22 @@ class GPhoto2Backend(CameraBackend):
             pass
         return old_port
 
-    # Keyword-to-category mapping for individual config names
-    _CONTROL_CATEGORY: dict[str, ControlCategory] = {
-        # Exposure
-        "iso": ControlCategory.EXPOSURE,
-        "shutterspeed": ControlCategory.EXPOSURE,
-        "aperture": ControlCategory.EXPOSURE,
-        "f-number": ControlCategory.EXPOSURE,
-        "exposurecompensation": ControlCategory.EXPOSURE,
-        "autoexposuremode": ControlCategory.EXPOSURE,
-        "autoexposuremodedial": ControlCategory.EXPOSURE,
-        "expprogram": ControlCategory.EXPOSURE,
-        "meteringmode": ControlCategory.EXPOSURE,
-        "aeb": ControlCategory.EXPOSURE,
-        "bracketmode": ControlCategory.EXPOSURE,
-        "exposuremetermode": ControlCategory.EXPOSURE,
-        "exposureiso": ControlCategory.EXPOSURE,
-        "aebracket": ControlCategory.EXPOSURE,
-        "manualexposurecompensation": ControlCategory.EXPOSURE,
-        # Flash (under exposure)
-        "flashmode": ControlCategory.EXPOSURE,
-        "flashcompensation": ControlCategory.EXPOSURE,
-        "internalflashmode": ControlCategory.EXPOSURE,
-        "flashopen": ControlCategory.EXPOSURE,
-        "flashcharge": ControlCategory.EXPOSURE,
-        # Focus
-        "focusmode": ControlCategory.FOCUS,
-        "manualfocusdrive": ControlCategory.FOCUS,
-        "autofocusdrive": ControlCategory.FOCUS,
-        "focusarea": ControlCategory.FOCUS,
-        "focuspoints": ControlCategory.FOCUS,
-        "continuousaf": ControlCategory.FOCUS,
-        "cancelautofocus": ControlCategory.FOCUS,
-        "afbeam": ControlCategory.FOCUS,
-        "afmethod": ControlCategory.FOCUS,
-        "focuslock": ControlCategory.FOCUS,
-        "afoperation": ControlCategory.FOCUS,
-        # White balance
-        "whitebalance": ControlCategory.WHITE_BALANCE,
-        "whitebalanceadjust": ControlCategory.WHITE_BALANCE,
-        "whitebalanceadjusta": ControlCategory.WHITE_BALANCE,
-        "whitebalancexa": ControlCategory.WHITE_BALANCE,
-        "whitebalancexb": ControlCategory.WHITE_BALANCE,
-        "colortemperature": ControlCategory.WHITE_BALANCE,
-        "wb_adjust": ControlCategory.WHITE_BALANCE,
-        # Image quality / processing
-        "imageformat": ControlCategory.IMAGE,
-        "imageformatsd": ControlCategory.IMAGE,
-        "imageformatcf": ControlCategory.IMAGE,
-        "imageformatexthd": ControlCategory.IMAGE,
-        "imagesize": ControlCategory.IMAGE,
-        "imagequality": ControlCategory.IMAGE,
-        "picturestyle": ControlCategory.IMAGE,
-        "colorspace": ControlCategory.IMAGE,
-        "contrast": ControlCategory.IMAGE,
-        "saturation": ControlCategory.IMAGE,
-        "sharpness": ControlCategory.IMAGE,
-        "hue": ControlCategory.IMAGE,
-        "colormodel": ControlCategory.IMAGE,
-        "highlighttonepr": ControlCategory.IMAGE,
-        "shadowtonepr": ControlCategory.IMAGE,
-        "highisonr": ControlCategory.IMAGE,
-        "longexpnr": ControlCategory.IMAGE,
-        "aspectratio": ControlCategory.IMAGE,
-        # Capture settings
-        "drivemode": ControlCategory.CAPTURE,
-        "capturemode": ControlCategory.CAPTURE,
-        "capturetarget": ControlCategory.CAPTURE,
-        "eosremoterelease": ControlCategory.CAPTURE,
-        "viewfinder": ControlCategory.CAPTURE,
-        "reviewtime": ControlCategory.CAPTURE,
-        "eoszoomposition": ControlCategory.CAPTURE,
-        "eoszoom": ControlCategory.CAPTURE,
-        "eosvfmode": ControlCategory.CAPTURE,
-        "output": ControlCategory.CAPTURE,
-        "movieservoaf": ControlCategory.CAPTURE,
-        "liveviewsize": ControlCategory.CAPTURE,
-        "remotemode": ControlCategory.CAPTURE,
-        # Status (read-only info)
-        "batterylevel": ControlCategory.STATUS,
-        "lensname": ControlCategory.STATUS,
-        "serialnumber": ControlCategory.STATUS,
-        "cameramodel": ControlCategory.STATUS,
-        "deviceversion": ControlCategory.STATUS,
-        "availableshots": ControlCategory.STATUS,
-        "eosserialnumber": ControlCategory.STATUS,
-        "firmwareversion": ControlCategory.STATUS,
-        "model": ControlCategory.STATUS,
-        "ptpversion": ControlCategory.STATUS,
-    }
+    # Keyword-to-category mapping for individual config names, merged from
+    # the per-category key sets
+    _CONTROL_CATEGORY: dict[str, ControlCategory] = (
+        {k: ControlCategory.EXPOSURE for k in _EXPOSURE_KEYS}
+        | {k: ControlCategory.EXPOSURE for k in _FLASH_KEYS}
+        | {k: ControlCategory.FOCUS for k in _FOCUS_KEYS}
+        | {k: ControlCategory.WHITE_BALANCE for k in _WHITE_BALANCE_KEYS}
+        | {k: ControlCategory.IMAGE for k in _IMAGE_KEYS}
+        | {k: ControlCategory.CAPTURE for k in _CAPTURE_KEYS}
+        | {k: ControlCategory.STATUS for k in _STATUS_KEYS}
+    )
+    # Any known key inside a vendor variant of a leaf name
+    # ("aperture" in "aperturevalue"); longest keys are tried first
+    _KEYWORD_RE = re.compile(
+        "|".join(map(re.escape, sorted(_CONTROL_CATEGORY, key=len, reverse=True)))
+    )
 
     # Broader fallback: map by gPhoto2 config section
     _SECTION_CATEGORY: dict[str, ControlCategory] = {
@@ -467,15 +963,17 @@ class GPhoto2Backend(CameraBackend):
         "actions": ControlCategory.ADVANCED,
         "other": ControlCategory.ADVANCED,
     }
-
-    _BATCH_SIZE = 50
+    # First path component naming a known section, e.g. "main/capturesettings/x"
+    _SECTION_RE = re.compile(
+        r"(?:^|/)(%s)(?:/|$)" % "|".join(map(re.escape, _SECTION_CATEGORY))
+    )
 
     def get_controls(self, camera: CameraInfo) -> list[CameraControl]:
         controls: list[CameraControl] = []
 
         # Refresh USB port first (device number changes after GVFS kill)
         port = self._refresh_port(camera)
-        log.debug(f"get_controls: port={port}")
+        log.debug("get_controls: port=%s", port)
 
         # Check if the USB device actually exists
         try:
@@ -483,7 +981,7 @@ class GPhoto2Backend(CameraBackend):
             usb_path = f"/dev/bus/usb/{bus}/{dev}"
             if not os.path.exists(usb_path):
                 log.debug(
-                    f"get_controls: {usb_path} does not exist, camera disconnected?"
+                    "get_controls: %s does not exist, camera disconnected?", usb_path
                 )
                 return controls
         except (ValueError, OSError):
@@ -496,162 +994,175 @@ class GPhoto2Backend(CameraBackend):
         # Diagnostic: check USB device accessibility
         self._diagnose_usb(port)
 
+        if not self._streaming_active:
+            controls = self._gp_get_controls(port) if _HAS_GPHOTO2 else None
+            if not controls:
+                controls = self._shell_get_controls(port)
+            if controls:
+                return controls
+            # Free the device for the one-shot gphoto2 fallback below
+            self.close()
+
         delays = [0, 3, 5]
         try:
             for attempt, delay in enumerate(delays, 1):
                 if delay:
-                    log.debug(f"get_controls: waiting {delay}s before retry...")
+                    log.debug("get_controls: waiting %ds before retry...", delay)
                     time.sleep(delay)
                     self._kill_gvfs()
                     self._release_usb_device(port)
                     # Re-diagnose after wait
                     self._diagnose_usb(port)
 
-                log.debug(f"get_controls attempt {attempt}/{len(delays)}")
-                result = subprocess.run(
-                    ["gphoto2", "--port", port, "--list-all-config"],
-                    capture_output=True,
-                    text=True,
-                    timeout=15,
-                )
-                stdout_preview = result.stdout[:300] if result.returncode != 0 else ""
-                log.debug(
-                    f"--list-all-config rc={result.returncode}, "
-                    f"stdout_lines={len(result.stdout.splitlines())}, "
-                    f"stderr={result.stderr.strip()[:200]}"
-                )
-                if result.returncode != 0 and stdout_preview:
-                    log.debug(f"stdout preview: {stdout_preview}")
+                log.debug("get_controls attempt %d/%d", attempt, len(delays))
+                result, controls = self._list_all_config(port)
+                if result.returncode != 0 and result.stdout:
+                    log.debug("stdout preview: %s", result.stdout)
                 if result.returncode == 0 and result.stdout.strip():
                     break
             else:
                 # Last resort: re-detect port and try once more
                 port = self._refresh_port(camera)
-                log.debug(f"get_controls fallback port={port}")
+                log.debug("get_controls fallback port=%s", port)
                 self._release_usb_device(port)
                 self._diagnose_usb(port)
-                result = subprocess.run(
-                    ["gphoto2", "--port", port, "--list-all-config"],
-                    capture_output=True,
-                    text=True,
-                    timeout=15,
-                )
+                result, controls = self._list_all_config(port)
                 if result.returncode != 0 or not result.stdout.strip():
                     log.debug("get_controls: all attempts failed")
-                    return controls
+                    return []
 
             if result.returncode != 0:
-                return controls
-            config_paths = [
-                line.strip()
-                for line in result.stdout.splitlines()
-                if line.strip().startswith("/")
-            ]
-            if not config_paths:
-                return controls
-
-            # Batch-read configs to avoid one subprocess per control
-            for start in range(0, len(config_paths), self._BATCH_SIZE):
-                batch = config_paths[start : start + self._BATCH_SIZE]
-                cmd = ["gphoto2", "--port", port]
-                for cfg in batch:
-                    cmd.extend(["--get-config", cfg])
-                res = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                if res.returncode != 0:
-                    # Fallback: try one-by-one for this batch
-                    for cfg in batch:
-                        ctrl = self._read_single_config(port, cfg)
-                        if ctrl:
-                            controls.append(ctrl)
-                    continue
-                controls.extend(self._parse_batch_output(batch, res.stdout))
+                return []
         except Exception as exc:
             log.warning("get_controls failed: %s", exc)
+            return []
         return controls
 
-    def _read_single_config(self, port: str, cfg_path: str) -> CameraControl | None:
-        try:
-            result = subprocess.run(
-                ["gphoto2", "--port", port, "--get-config", cfg_path],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                return None
-            return self._parse_config(cfg_path, result.stdout)
-        except Exception:
-            return None
+    def _list_all_config(
+        self, port: str, timeout: float = 30
+    ) -> tuple[subprocess.CompletedProcess, list[CameraControl]]:
+        """Run ``gphoto2 --list-all-config`` and parse entries as they stream.
+
+        ``stdout`` of the returned result only holds the first 300
+        characters of output, for diagnostics.
+        """
+        return asyncio.run(self._stream_all_config(port, timeout))
 
     @classmethod
-    def _parse_batch_output(
-        cls,
-        paths: list[str],
-        output: str,
-    ) -> list[CameraControl]:
-        """Split combined gphoto2 output into per-config blocks and parse."""
+    async def _stream_all_config(
+        cls, port: str, timeout: float
+    ) -> tuple[subprocess.CompletedProcess, list[CameraControl]]:
+        args = ["gphoto2", "--port", port, "--list-all-config"]
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # Drain stderr alongside stdout so neither pipe can fill up and stall
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
         controls: list[CameraControl] = []
-        blocks: list[list[str]] = []
-        current: list[str] = []
-        for line in output.splitlines():
-            if line.startswith("Label:") and current:
-                blocks.append(current)
-                current = []
-            current.append(line)
-        if current:
-            blocks.append(current)
-
-        for idx, block in enumerate(blocks):
-            if idx >= len(paths):
-                break
-            ctrl = cls._parse_config(paths[idx], "\n".join(block))
-            if ctrl:
-                controls.append(ctrl)
-        return controls
+        head: list[str] = []
+        head_len = 0
+        n_lines = 0
+        cfg_path = ""
+        body: list[str] = []
+
+        def flush() -> None:
+            if cfg_path:
+                ctrl = cls._parse_config_cached(port, cfg_path, "".join(body))
+                if ctrl:
+                    controls.append(ctrl)
+
+        async def consume() -> None:
+            nonlocal cfg_path, head_len, n_lines
+            # Each entry starts with its path line: parse the previous block
+            # while gphoto2 is still querying the camera for the next one.
+            async for raw in proc.stdout:
+                line = raw.decode(errors="replace")
+                n_lines += 1
+                if head_len < 300:
+                    head.append(line)
+                    head_len += len(line)
+                if line.startswith("/"):
+                    flush()
+                    cfg_path = line.strip()
+                    body.clear()
+                else:
+                    body.append(line)
+            flush()
+            await proc.wait()
 
-    @classmethod
-    def _categorize(cls, cfg_path: str) -> ControlCategory:
-        """Map a gPhoto2 config path to a ControlCategory."""
-        parts = cfg_path.strip("/").lower().split("/")
-        # Check leaf name first (most specific)
-        leaf = parts[-1] if parts else ""
-        if leaf in cls._CONTROL_CATEGORY:
-            return cls._CONTROL_CATEGORY[leaf]
+        try:
+            await asyncio.wait_for(consume(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            stderr_task.cancel()
+            raise subprocess.TimeoutExpired(args, timeout) from None
+        stderr = (await stderr_task).decode(errors="replace")
+        log.debug(
+            "--list-all-config rc=%s, stdout_lines=%d, stderr=%s",
+            proc.returncode, n_lines, stderr.strip()[:200],
+        )
+        result = subprocess.CompletedProcess(
+            args, proc.returncode, "".join(head)[:300], stderr
+        )
+        return result, controls
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _categorize(cfg_path: str) -> ControlCategory:
+        """Map a gPhoto2 config path to a ControlCategory.
+
+        Cached: the same paths come back on every control refresh.
+        """
+        cls = GPhoto2Backend
+        path = cfg_path.strip("/").lower()
+        # Check leaf name first (most specific) — one dict probe, no split
+        leaf = path.rpartition("/")[2]
+        cat = cls._CONTROL_CATEGORY.get(leaf)
+        if cat is not None:
+            return cat
+        # Vendor variants of a known name (e.g. "aperturevalue")
+        m = cls._KEYWORD_RE.search(leaf)
+        if m:
+            return cls._CONTROL_CATEGORY[m.group()]
         # Check section (e.g. /main/capturesettings/...)
-        for part in parts:
-            if part in cls._SECTION_CATEGORY:
-                return cls._SECTION_CATEGORY[part]
+        m = cls._SECTION_RE.search(path)
+        if m:
+            return cls._SECTION_CATEGORY[m.group(1)]
         return ControlCategory.ADVANCED
 
+    @classmethod
+    def _parse_config_cached(
+        cls, port: str, cfg_path: str, output: str
+    ) -> CameraControl | None:
+        """_parse_config, skipped when this entry's text hasn't changed."""
+        digest = hashlib.blake2b(output.encode(), digest_size=16).digest()
+        key = (port, cfg_path, digest)
+        ctrl = cls._ctrl_cache.get(key)
+        if ctrl is None:
+            ctrl = cls._parse_config(cfg_path, output)
+            if ctrl is None:
+                return None
+            if len(cls._ctrl_cache) >= _CTRL_CACHE_MAX:
+                cls._ctrl_cache.clear()
+            cls._ctrl_cache[key] = ctrl
+        # Callers update value in place; keep the cached entry pristine
+        return copy.copy(ctrl)
+
     @classmethod
     def _parse_config(cls, cfg_path: str, output: str) -> CameraControl | None:
-        lines = output.strip().splitlines()
         info: dict[str, str] = {}
         choices: list[str] = []
-        for line in lines:
-            if line.startswith("Label:"):
-                info["label"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Type:"):
-                info["type"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Current:"):
-                info["current"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Choice:"):
-                parts = line.split(" ", 2)
-                if len(parts) >= 3:
-                    choices.append(parts[2].strip())
-            elif line.startswith("Bottom:"):
-                info["min"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Top:"):
-                info["max"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Step:"):
-                info["step"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Readonly:"):
-                info["readonly"] = line.split(":", 1)[1].strip()
+        for field, value in _FIELD_RE.findall(output):
+            if field == "Choice":
+                # "0 Auto": index, then the label
+                index, sep, label = value.partition(" ")
+                if sep and index.isdigit():
+                    choices.append(label.strip())
+            else:
+                info[_FIELD_KEYS[field]] = value.strip()
 
         if "label" not in info:
             return None
@@ -702,30 +1213,56 @@ class GPhoto2Backend(CameraBackend):
         return ctrl
 
     def set_control(self, camera: CameraInfo, control_id: str, value: Any) -> bool:
+        return self.set_controls(camera, [(control_id, value)]).get(control_id, False)
+
+    def set_controls(
+        self, camera: CameraInfo, items: list[tuple[str, Any]]
+    ) -> dict[str, bool]:
+        """Write several configs in one shell round-trip or one gphoto2 run."""
+        if not items:
+            return {}
         port = camera.extra.get("port", camera.device_path)
+        if not self._streaming_active and _HAS_GPHOTO2:
+            results = self._gp_set_controls(port, items)
+            if results is not None:
+                return results
+        if not self._streaming_active:
+            outputs = self._shell_cmds(
+                port, [f"set-config {cid}={value}" for cid, value in items]
+            )
+            if outputs is not None:
+                return {
+                    cid: "error" not in out.lower()
+                    for (cid, _value), out in zip(items, outputs)
+                }
+        cmd = ["gphoto2", "--port", port]
+        for cid, value in items:
+            cmd.extend(["--set-config", f"{cid}={value}"])
         try:
-            subprocess.run(
-                ["gphoto2", "--port", port, "--set-config", f"{control_id}={value}"],
+            spawn.run(
+                cmd,
                 capture_output=True,
                 check=True,
-                timeout=10,
+                timeout=10 + 2 * len(items),
             )
-            return True
+            ok = True
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            ok = False
+        return {cid: ok for cid, _value in items}
 
     # -- gstreamer -----------------------------------------------------------
 
     def get_gst_source(self, camera: CameraInfo, fmt: VideoFormat | None = None) -> str:
-        udp_port = camera.extra.get("udp_port", 5000)
-        return (
-            f"udpsrc port={udp_port} address=127.0.0.1 "
-            f'caps="video/mpegts,packetsize=(int)1316" ! '
-            f"queue max-size-bytes=2097152 leaky=downstream ! tsdemux ! decodebin ! videoconvert"
+        return self._TEMPLATE_UDP_MPEGTS.format_map(
+            {"port": camera.extra.get("udp_port", 5000)}
         )
 
     def start_streaming(self, camera: CameraInfo) -> bool:
         """Launch the gphoto2 streaming script (persistent session per camera)."""
+        # The streaming script needs exclusive access to the camera
+        self.close()
+        self.invalidate_cache()
+
         # Refresh USB port (device number may change after GVFS kill)
         port = self._refresh_port(camera)
 
@@ -758,25 +1295,16 @@ class GPhoto2Backend(CameraBackend):
         # If this camera is already streaming, just return success
         with self._streams_lock:
             if port in self._active_streams:
-                log.debug(f"Camera {camera.name} already streaming on port {port}")
+                log.debug("Camera %s already streaming on port %s", camera.name, port)
                 return True
 
         # Release USB device before streaming (GVFS already killed above)
         self._release_usb_device(port)
 
-        script = os.path.join(BASE_DIR, "script", "run_webcam_gphoto2.sh")
-        if not os.path.isfile(script):
-            script = os.path.join(BASE_DIR, "script", "run_webcam.sh")
-        if not os.path.isfile(script):
-            log.error("GPhoto2 streaming script not found: %s", script)
+        script = _resolve_script()
+        if script is None:
             return False
 
-        if not os.access(script, os.X_OK):
-            try:
-                os.chmod(script, 0o755)
-            except OSError:
-                pass
-
         port_arg = port if port else ""
         # Do NOT let ffmpeg write directly to v4l2loopback — BigCam's
         # appsrc pipeline handles v4l2loopback output so that OpenCV
@@ -788,41 +1316,40 @@ class GPhoto2Backend(CameraBackend):
             port_arg, udp_port, v4l2_dev,
         )
         try:
-            import tempfile
-
-            with tempfile.TemporaryFile() as f:
-                res = subprocess.run(
-                    [script, port_arg, udp_port, camera.name, v4l2_dev],
-                    stdout=f,
-                    stderr=subprocess.STDOUT,
-                    timeout=60,
-                )
-                f.seek(0)
-                raw = f.read()
-                output = raw.decode("utf-8", errors="replace").strip()
-            log.info("gphoto2 script output:\n%s", output)
-
-            if res.returncode == 0:
-                for line in output.split("\n"):
-                    if line.startswith("SUCCESS:"):
-                        dev = line.split("SUCCESS:")[1].strip()
-                        log.info("GPhoto2 streaming started on %s", dev)
-                        with self._streams_lock:
-                            self._active_streams[port] = {
-                                "udp_port": udp_port,
-                                "launch_port": port,
-                                "vcam_device": v4l2_dev,
-                            }
-                        return True
-                log.info("GPhoto2 script exited 0 (no explicit SUCCESS)")
+            # Own session: the backgrounded gphoto2 | ffmpeg pipeline stays
+            # in this process group, so stop_streaming() can take it down
+            # with a single killpg().  Output is consumed as it arrives, so
+            # we return on the SUCCESS line without waiting for the script.
+            res = subprocess.Popen(
+                [script, port_arg, udp_port, camera.name, v4l2_dev],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+            self._streaming_process = res
+            lines, dev = self._read_script_output(res, timeout=60)
+            output = "\n".join(lines)
+
+            if dev is not None or res.wait(timeout=5) == 0:
+                if dev is not None:
+                    log.info("GPhoto2 streaming started on %s", dev)
+                    # The script exits right after SUCCESS; reap it so no
+                    # zombie leader keeps the process group looking alive
+                    threading.Thread(
+                        target=res.wait, daemon=True, name="gphoto2-script-reaper"
+                    ).start()
+                else:
+                    log.info("GPhoto2 script exited 0 (no explicit SUCCESS)")
                 with self._streams_lock:
                     self._active_streams[port] = {
                         "udp_port": udp_port,
                         "launch_port": port,
                         "vcam_device": v4l2_dev,
+                        "pgid": res.pid,
                     }
                 return True
 
+            self._streaming_process = None
             log.error("GPhoto2 script failed (code %d): %s", res.returncode, output)
             # Detect PTP-level failures (camera doesn't really support streaming)
             out_lower = output.lower()
@@ -841,78 +1368,175 @@ class GPhoto2Backend(CameraBackend):
             return False
         except Exception as exc:
             log.error("Failed to start gphoto2 streaming: %s", exc)
+            self._streaming_process = None
             self._streaming_active = False
             return False
 
+    def _read_script_output(
+        self, proc: subprocess.Popen, timeout: float
+    ) -> tuple[list[str], str | None]:
+        """Collect the streaming script's output line by line.
+
+        Returns ``(lines, device)`` as soon as a ``SUCCESS:`` line is seen,
+        leaving *proc* running, or ``(lines, None)`` once the script closes
+        its stdout.  The process group is killed if *timeout* expires first.
+        """
+        fd = proc.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        lines: list[str] = []
+        pending = b""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._kill_group(proc.pid)
+                proc.wait()
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                if pending.strip():
+                    lines.append(pending.decode("utf-8", errors="replace").rstrip())
+                return lines, None
+            *complete, pending = (pending + chunk).split(b"\n")
+            for raw in complete:
+                line = raw.decode("utf-8", errors="replace").rstrip()
+                log.info("gphoto2 script: %s", line)
+                lines.append(line)
+                if line.startswith("SUCCESS:"):
+                    return lines, line.split("SUCCESS:")[1].strip()
+
+    @staticmethod
+    def _kill_group(pgid: int, timeout: float = 2.0) -> bool:
+        """SIGTERM a streaming process group, SIGKILL it if it outlives *timeout*.
+
+        Returns False if the group no longer existed.
+        """
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            if not GPhoto2Backend._group_alive(pgid):
+                return True
+        try:
+            os.killpg(pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        return True
+
     def stop_streaming(self, camera: CameraInfo | None = None) -> None:
         """Stop gphoto2/ffmpeg processes for a specific camera, or all if None."""
         self._streaming_active = False
+        self.close()
+        self.invalidate_cache()
         try:
             if camera:
                 port = camera.extra.get("port", camera.device_path)
                 udp_port = str(camera.extra.get("udp_port", 5000))
                 with self._streams_lock:
                     stream_info = self._active_streams.pop(port, None)
-                launch_port = stream_info["launch_port"] if stream_info else port
-
-                safe_lp = re.escape(launch_port)
-                safe_port = re.escape(port)
-                safe_udp = re.escape(udp_port)
-
-                # Graceful SIGTERM first
-                subprocess.run(
-                    ["pkill", "-f", f"gphoto2.*--port {safe_lp}"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                if launch_port != port:
-                    subprocess.run(
-                        ["pkill", "-f", f"gphoto2.*--port {safe_port}"],
-                        capture_output=True,
-                        timeout=5,
-                    )
-                subprocess.run(
-                    ["pkill", "-f", f"ffmpeg.*udp://127\\.0\\.0\\.1:{safe_udp}"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                time.sleep(2)
-                # Force-kill survivors
-                subprocess.run(
-                    ["pkill", "-9", "-f", f"gphoto2.*--port {safe_lp}"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                if launch_port != port:
-                    subprocess.run(
-                        ["pkill", "-9", "-f", f"gphoto2.*--port {safe_port}"],
-                        capture_output=True,
-                        timeout=5,
-                    )
-                subprocess.run(
-                    ["pkill", "-9", "-f", f"ffmpeg.*udp://127\\.0\\.0\\.1:{safe_udp}"],
-                    capture_output=True,
-                    timeout=5,
-                )
+                pgid = stream_info.get("pgid") if stream_info else None
+                if pgid is None or not self._kill_group(pgid):
+                    launch_port = stream_info["launch_port"] if stream_info else port
+                    self._pkill_stream(launch_port, port, udp_port)
             else:
                 with self._streams_lock:
+                    streams = list(self._active_streams.values())
                     self._active_streams.clear()
-                subprocess.run(["pkill", "-f", "gphoto2 --"], capture_output=True, timeout=5)
-                time.sleep(1)
-                subprocess.run(["pkill", "-9", "-f", "gphoto2 --"], capture_output=True, timeout=5)
-                subprocess.run(
-                    ["pkill", "-9", "-f", "ffmpeg.*mpegts"], capture_output=True, timeout=5
-                )
-                subprocess.run(
-                    ["pkill", "-9", "-f", "ffmpeg.*v4l2"], capture_output=True, timeout=5
+                for info in streams:
+                    if "pgid" in info:
+                        self._kill_group(info["pgid"])
+                # Sweep sessions left over from a previous BigCam instance
+                spawn.run(
+                    ["pkill", "-9", "-f", _STALE_STREAM_PATTERN], capture_output=True, timeout=5
                 )
         except Exception:
             log.warning("stop_streaming cleanup error", exc_info=True)
+        proc = self._streaming_process
+        if proc is not None:
+            proc.stdout.close()
+            proc.poll()
         self._streaming_process = None
 
-        # Kill GVFS immediately after stopping — prevents it from re-grabbing cameras
+        # Kill GVFS immediately after stopping — prevents it from re-grabbing
+        # cameras (returns as soon as no GVFS process is left)
         self._kill_gvfs()
-        time.sleep(1)
+
+    @staticmethod
+    def _pkill_stream(launch_port: str, port: str, udp_port: str) -> None:
+        """Fallback teardown by command line for streams without a known group."""
+        safe_lp = re.escape(launch_port)
+        safe_port = re.escape(port)
+        safe_udp = re.escape(udp_port)
+        patterns = [f"gphoto2.*--port {safe_lp}"]
+        if launch_port != port:
+            patterns.append(f"gphoto2.*--port {safe_port}")
+        patterns.append(f"ffmpeg.*udp://127\\.0\\.0\\.1:{safe_udp}")
+        pattern = "|".join(patterns)
+
+        # Graceful SIGTERM first, one pkill for every pattern
+        spawn.run(["pkill", "-f", pattern], capture_output=True, timeout=5)
+        # Wait for the processes to exit instead of a fixed 2 s sleep; scan
+        # /proc directly rather than forking pgrep on every poll
+        matcher = re.compile(pattern.encode())
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            if not GPhoto2Backend._cmdline_matches(matcher):
+                return
+            time.sleep(0.1)
+        # Force-kill survivors
+        spawn.run(["pkill", "-9", "-f", pattern], capture_output=True, timeout=5)
+
+    @staticmethod
+    def _group_alive(pgid: int) -> bool:
+        """Whether process group *pgid* still has a running (non-zombie) member.
+
+        ``killpg(pgid, 0)`` also succeeds for a group whose members are all
+        zombies waiting to be reaped, so read the state from /proc instead.
+        """
+        try:
+            entries = os.listdir("/proc")
+        except OSError:
+            return False
+        for name in entries:
+            if not name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{name}/stat", "rb") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # Fields after the parenthesised command name: state ppid pgrp
+            fields = stat[stat.rfind(b")") + 2:].split()
+            if len(fields) > 2 and fields[0] != b"Z" and int(fields[2]) == pgid:
+                return True
+        return False
+
+    @staticmethod
+    def _cmdline_matches(matcher: re.Pattern[bytes]) -> bool:
+        """Whether any process command line matches, as ``pgrep -f`` would."""
+        try:
+            entries = os.listdir("/proc")
+        except OSError:
+            return False
+        own = str(os.getpid())
+        for name in entries:
+            if not name.isdigit() or name == own:
+                continue
+            try:
+                with open(f"/proc/{name}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            if matcher.search(cmdline.replace(b"\0", b" ")):
+                return True
+        return False
 
     def needs_streaming_setup(self) -> bool:
         """GPhoto2 requires an external streaming process."""
@@ -925,16 +1549,25 @@ class GPhoto2Backend(CameraBackend):
             if port not in self._active_streams:
                 return False
             stream_info = self._active_streams[port].copy()
+        pgid = stream_info.get("pgid")
+        if pgid is not None:
+            # Judged by the gphoto2/ffmpeg members, not the script that
+            # started them and has exited
+            if self._group_alive(pgid):
+                return True
+            with self._streams_lock:
+                self._active_streams.pop(port, None)
+            return False
         # Verify the process is actually alive using the launch port
         launch_port = stream_info.get("launch_port", port)
-        result = subprocess.run(
+        result = spawn.run(
             ["pgrep", "-f", f"gphoto2.*--port {launch_port}"],
             capture_output=True,
         )
         if result.returncode != 0:
             # Also try current port (in case it matches)
             if launch_port != port:
-                result = subprocess.run(
+                result = spawn.run(
                     ["pgrep", "-f", f"gphoto2.*--port {port}"],
                     capture_output=True,
                 )
@@ -955,6 +1588,14 @@ class GPhoto2Backend(CameraBackend):
         port = camera.extra.get("port", camera.device_path)
         camera_arg = ["--port", port] if port else []
         debug_log = "/tmp/gphoto2_capture_debug.log"
+        _seed_gphoto_settings()
+
+        if port and not self._streaming_active:
+            self._kill_gvfs()
+            if self._shell_capture(port, output_path):
+                return True
+            # Free the device for the one-shot gphoto2 fallback below
+            self.close()
 
         for attempt in range(2):
             try:
@@ -967,7 +1608,7 @@ class GPhoto2Backend(CameraBackend):
                     "capture_photo attempt %d: starting gphoto2 on port %s",
                     attempt + 1, port,
                 )
-                result = subprocess.run(
+                result = spawn.run(
                     [
                         "gphoto2",
                         *camera_arg,
@@ -1002,7 +1643,7 @@ class GPhoto2Backend(CameraBackend):
                 # Kill the timed-out process
                 if port:
                     safe_port = re.escape(port)
-                    subprocess.run(
+                    spawn.run(
                         ["pkill", "-9", "-f", f"gphoto2.*{safe_port}"],
                         capture_output=True,
                     )
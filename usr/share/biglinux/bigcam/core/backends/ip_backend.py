@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import logging
 import os
-import subprocess
 from typing import Any
 
 from constants import BackendType
 from core.camera_backend import CameraBackend, CameraControl, CameraInfo, VideoFormat
+from utils import spawn
 
 log = logging.getLogger(__name__)
 
@@ -16,6 +16,15 @@ log = logging.getLogger(__name__)
 class IPBackend(CameraBackend):
     """Backend for RTSP / HTTP network cameras (manual configuration)."""
 
+    # Source pipelines, filled in with the camera URL
+    _TEMPLATE_RTSP = 'rtspsrc location="{url}" latency=300 ! decodebin ! videoconvert'
+    _TEMPLATE_HTTP = 'souphttpsrc location="{url}" ! decodebin ! videoconvert'
+    # gst-launch argv for one-frame snapshots; jpegenc's snapshot mode sends
+    # EOS after the first frame, so live sources don't run until the timeout
+    _SNAPSHOT_RTSP_ARGS = ("latency=300", "!", "decodebin")
+    _SNAPSHOT_HTTP_ARGS = ("!", "decodebin")
+    _SNAPSHOT_TAIL_ARGS = ("!", "videoconvert", "!", "jpegenc", "snapshot=true", "!", "filesink")
+
     def get_backend_type(self) -> BackendType:
         return BackendType.IP
 
@@ -62,9 +71,9 @@ class IPBackend(CameraBackend):
     def get_gst_source(self, camera: CameraInfo, fmt: VideoFormat | None = None) -> str:
         url = camera.extra.get("url", camera.device_path)
         if url.startswith("rtsp://"):
-            return f'rtspsrc location="{url}" latency=300 ! decodebin ! videoconvert'
+            return self._TEMPLATE_RTSP.format_map({"url": url})
         # HTTP / MJPEG stream
-        return f'souphttpsrc location="{url}" ! decodebin ! videoconvert'
+        return self._TEMPLATE_HTTP.format_map({"url": url})
 
     # -- photo ---------------------------------------------------------------
 
@@ -75,21 +84,16 @@ class IPBackend(CameraBackend):
         """Snapshot via GStreamer one-frame pipeline."""
         url = camera.extra.get("url", camera.device_path)
         if url.startswith("rtsp://"):
-            src_args = ["rtspsrc", f"location={url}", "latency=300", "!", "decodebin"]
+            src_args = ("rtspsrc", f"location={url}", *self._SNAPSHOT_RTSP_ARGS)
         else:
-            src_args = ["souphttpsrc", f"location={url}", "!", "decodebin"]
+            src_args = ("souphttpsrc", f"location={url}", *self._SNAPSHOT_HTTP_ARGS)
         try:
-            subprocess.run(
+            spawn.run(
                 [
                     "gst-launch-1.0",
                     "-e",
                     *src_args,
-                    "!",
-                    "videoconvert",
-                    "!",
-                    "jpegenc",
-                    "!",
-                    "filesink",
+                    *self._SNAPSHOT_TAIL_ARGS,
                     f"location={output_path}",
                 ],
                 capture_output=True,
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import shutil
 import subprocess
 from typing import Any
 
 from constants import BackendType, ControlCategory, ControlType
 from core.camera_backend import CameraBackend, CameraControl, CameraInfo, VideoFormat
+from utils import spawn
 from utils.i18n import _
 
 
+@functools.lru_cache(maxsize=1)
+def _libcamera_available() -> bool:
+    return any(shutil.which(cmd) for cmd in ("cam", "libcamera-hello"))
+
+
 class LibcameraBackend(CameraBackend):
     """Backend for libcamera-supported cameras."""
 
@@ -18,24 +26,14 @@ class LibcameraBackend(CameraBackend):
         return BackendType.LIBCAMERA
 
     def is_available(self) -> bool:
-        for cmd in ("cam", "libcamera-hello"):
-            try:
-                subprocess.run([cmd, "--version"], capture_output=True, timeout=5)
-                return True
-            except (
-                FileNotFoundError,
-                subprocess.CalledProcessError,
-                subprocess.TimeoutExpired,
-            ):
-                continue
-        return False
+        return _libcamera_available()
 
     # -- detection -----------------------------------------------------------
 
     def detect_cameras(self) -> list[CameraInfo]:
         cameras: list[CameraInfo] = []
         try:
-            result = subprocess.run(
+            result = spawn.run(
                 ["cam", "--list"],
                 capture_output=True,
                 text=True,
@@ -145,9 +143,8 @@ class LibcameraBackend(CameraBackend):
         src = f"libcamerasrc camera-name={cam_name}"
         if fmt:
             caps = f"video/x-raw,width={fmt.width},height={fmt.height}"
-            if fmt.fps:
-                best = int(max(fmt.fps))
-                caps += f",framerate={best}/1"
+            if fmt.best_fps:
+                caps += f",framerate={fmt.best_fps}/1"
             return f"{src} ! {caps}"
         return src
 
@@ -158,7 +155,7 @@ class LibcameraBackend(CameraBackend):
 
     def capture_photo(self, camera: CameraInfo, output_path: str) -> bool:
         try:
-            subprocess.run(
+            spawn.run(
                 ["libcamera-still", "-o", output_path, "--nopreview", "-t", "1"],
                 capture_output=True,
                 check=True,
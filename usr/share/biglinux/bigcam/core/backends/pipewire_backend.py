@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import re
-import subprocess
+import shutil
 from typing import Any
 
 from constants import BackendType
 from core.camera_backend import CameraBackend, CameraControl, CameraInfo, VideoFormat
+from utils import spawn
+
+
+@functools.lru_cache(maxsize=1)
+def _pw_cli_available() -> bool:
+    return shutil.which("pw-cli") is not None
 
 
 class PipeWireBackend(CameraBackend):
@@ -17,22 +24,14 @@ class PipeWireBackend(CameraBackend):
         return BackendType.PIPEWIRE
 
     def is_available(self) -> bool:
-        try:
-            subprocess.run(["pw-cli", "info", "0"], capture_output=True, timeout=5)
-            return True
-        except (
-            FileNotFoundError,
-            subprocess.CalledProcessError,
-            subprocess.TimeoutExpired,
-        ):
-            return False
+        return _pw_cli_available()
 
     # -- detection -----------------------------------------------------------
 
     def detect_cameras(self) -> list[CameraInfo]:
         cameras: list[CameraInfo] = []
         try:
-            result = subprocess.run(
+            result = spawn.run(
                 ["pw-cli", "list-objects"],
                 capture_output=True,
                 text=True,
@@ -129,7 +128,7 @@ class PipeWireBackend(CameraBackend):
         """Snapshot via GStreamer pipeline."""
         node_id = camera.extra.get("node_id", camera.device_path)
         try:
-            subprocess.run(
+            spawn.run(
                 [
                     "gst-launch-1.0",
                     "-e",
@@ -2,50 +2,152 @@
 
 from __future__ import annotations
 
-import json
+import fcntl
+import functools
 import logging
 import os
 import re
+import shutil
+import struct
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 from constants import BackendType, ControlCategory, ControlType
 from core.camera_backend import CameraBackend, CameraControl, CameraInfo, VideoFormat
+from utils import spawn
 from utils.i18n import _
 
 log = logging.getLogger(__name__)
 
-# Human-friendly labels for V4L2 control IDs
-_CONTROL_LABELS: dict[str, str] = {
-    "brightness": _("Brightness"),
-    "contrast": _("Contrast"),
-    "saturation": _("Saturation"),
-    "hue": _("Hue"),
-    "sharpness": _("Sharpness"),
-    "gamma": _("Gamma"),
-    "white_balance_automatic": _("Auto White Balance"),
-    "white_balance_temperature": _("White Balance Temperature"),
-    "gain": _("Gain"),
-    "exposure_auto": _("Auto Exposure"),
-    "exposure_absolute": _("Exposure Time"),
-    "exposure_time_absolute": _("Exposure Time"),
-    "exposure_auto_priority": _("Exposure Auto Priority"),
-    "focus_auto": _("Auto Focus"),
-    "focus_absolute": _("Focus Distance"),
-    "zoom_absolute": _("Zoom"),
-    "pan_absolute": _("Pan"),
-    "tilt_absolute": _("Tilt"),
-    "power_line_frequency": _("Power Line Frequency"),
-    "auto_exposure_bias": _("Exposure Bias"),
-    "white_balance_auto_preset": _("WB Preset"),
-    "image_stabilization": _("Image Stabilization"),
-    "iso_sensitivity": _("ISO Sensitivity"),
-    "iso_sensitivity_auto": _("Auto ISO"),
-    "scene_mode": _("Scene Mode"),
-    "3a_lock": _("3A Lock"),
-    "led1_mode": _("LED Mode"),
-    "led1_frequency": _("LED Frequency"),
-}
+# v4l2-ctl output parsers, compiled once at import.  The output is parsed as
+# raw bytes; only the fields that end up in the UI are decoded.
+_BLOCK_SPLIT_RE = re.compile(rb"\n(?=\S)")
+# --list-ctrls-menus: control rows and their menu entries
+# (row patterns match lstripped lines, so none of them walks indentation)
+_CTRL_RE = re.compile(rb"(\w+)\s+0x[0-9a-f]+\s+\((\w+)\)\s*:\s*(.*)")
+_MENU_RE = re.compile(rb"(\d+):\s+(.+)")
+
+# VIDIOC_QUERYCAP = _IOR('V', 0, struct v4l2_capability); the struct is
+# driver[16] card[32] bus_info[32] version capabilities device_caps reserved[3]
+_VIDIOC_QUERYCAP = 0x80685600
+_V4L2_CAPABILITY = struct.Struct("16s32s32sIII12x")
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_VIDEO_CAPTURE_MPLANE = 0x00001000
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+_SYSFS_V4L = "/sys/class/video4linux"
+# sysfs name of a USB interface ("1-2.4:1.0"); its parent is the USB device
+_USB_INTERFACE_RE = re.compile(r"\d+-[\d.]+:\d+\.\d+")
+# Resolved once (a PATH scan, no fork); used as argv[0] for every query
+_V4L2_CTL_PATH = shutil.which("v4l2-ctl")
+_V4L2_CTL = _V4L2_CTL_PATH or "v4l2-ctl"
+
+# Result lifetimes (seconds) for cached v4l2-ctl / pw-dump queries.  Formats
+# never change for a given node; control values do, so they expire quickly.
+_DEVICES_TTL = 5.0
+_PW_DUMP_TTL = 5.0
+_FORMATS_TTL = 30.0
+_CTRLS_TTL = 2.0
+# v4l2-ctl normally answers in milliseconds; a busy device must not stall us
+_QUERY_TIMEOUT = 3.0
+# argv tuple -> (timestamp, successful result)
+_subproc_cache: dict[tuple[str, ...], tuple[float, subprocess.CompletedProcess]] = {}
+_subproc_lock = threading.Lock()
+
+
+def _run_cached(cmd: tuple[str, ...], ttl: float) -> subprocess.CompletedProcess:
+    """Run *cmd*, reusing its last successful result for *ttl* seconds.
+
+    Output is returned undecoded (``bytes``).
+    """
+    with _subproc_lock:
+        hit = _subproc_cache.get(cmd)
+    if hit is not None and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    result = spawn.run(
+        list(cmd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        timeout=_QUERY_TIMEOUT,
+    )
+    if result.returncode == 0:
+        with _subproc_lock:
+            _subproc_cache[cmd] = (time.monotonic(), result)
+    return result
+
+
+def _query_capture(device: str) -> bool | None:
+    """Ask the driver (VIDIOC_QUERYCAP) whether *device* captures video.
+
+    Returns None when the ioctl cannot be issued, e.g. without permission.
+    """
+    try:
+        fd = os.open(device, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return None
+    try:
+        buf = bytearray(_V4L2_CAPABILITY.size)
+        fcntl.ioctl(fd, _VIDIOC_QUERYCAP, buf)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    _driver, _card, _bus, _version, caps, device_caps = _V4L2_CAPABILITY.unpack(buf)
+    if caps & _V4L2_CAP_DEVICE_CAPS:
+        caps = device_caps
+    return bool(caps & (_V4L2_CAP_VIDEO_CAPTURE | _V4L2_CAP_VIDEO_CAPTURE_MPLANE))
+
+
+@functools.lru_cache(maxsize=1)
+def _control_labels() -> dict[str, str]:
+    """Human-friendly labels for V4L2 control IDs.
+
+    Built on first use rather than at import, so the strings are translated
+    with the locale the UI actually runs under.
+    """
+    return {
+        "brightness": _("Brightness"),
+        "contrast": _("Contrast"),
+        "saturation": _("Saturation"),
+        "hue": _("Hue"),
+        "sharpness": _("Sharpness"),
+        "gamma": _("Gamma"),
+        "white_balance_automatic": _("Auto White Balance"),
+        "white_balance_temperature": _("White Balance Temperature"),
+        "gain": _("Gain"),
+        "exposure_auto": _("Auto Exposure"),
+        "exposure_absolute": _("Exposure Time"),
+        "exposure_time_absolute": _("Exposure Time"),
+        "exposure_auto_priority": _("Exposure Auto Priority"),
+        "focus_auto": _("Auto Focus"),
+        "focus_absolute": _("Focus Distance"),
+        "zoom_absolute": _("Zoom"),
+        "pan_absolute": _("Pan"),
+        "tilt_absolute": _("Tilt"),
+        "power_line_frequency": _("Power Line Frequency"),
+        "auto_exposure_bias": _("Exposure Bias"),
+        "white_balance_auto_preset": _("WB Preset"),
+        "image_stabilization": _("Image Stabilization"),
+        "iso_sensitivity": _("ISO Sensitivity"),
+        "iso_sensitivity_auto": _("Auto ISO"),
+        "scene_mode": _("Scene Mode"),
+        "3a_lock": _("3A Lock"),
+        "led1_mode": _("LED Mode"),
+        "led1_frequency": _("LED Frequency"),
+    }
+
+
+def _control_label(ctrl_id: str) -> str:
+    return _control_labels().get(ctrl_id) or ctrl_id.replace("_", " ").title()
+
 
 # Controls hidden from the UI (too technical for end-users)
 _HIDDEN_CONTROLS: set[str] = {
@@ -94,98 +196,157 @@ class V4L2Backend(CameraBackend):
         return BackendType.V4L2
 
     def is_available(self) -> bool:
-        try:
-            subprocess.run(
-                ["v4l2-ctl", "--version"],
-                capture_output=True,
-                check=True,
-                timeout=5,
-            )
-            return True
-        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            return False
+        return _V4L2_CTL_PATH is not None
+
+    def invalidate_cache(self, device: str | None = None) -> None:
+        """Forget cached query results, for every device or just *device*."""
+        with _subproc_lock:
+            if device is None:
+                _subproc_cache.clear()
+                return
+            for cmd in [c for c in _subproc_cache if device in c]:
+                del _subproc_cache[cmd]
 
     # -- detection -----------------------------------------------------------
 
     def detect_cameras(self) -> list[CameraInfo]:
         cameras: list[CameraInfo] = []
         try:
-            result = subprocess.run(
-                ["v4l2-ctl", "--list-devices"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode != 0:
-                return cameras
-            cameras = self._parse_devices(result.stdout)
+            candidates = self._sysfs_candidates()
+            if candidates is None:
+                # No sysfs (e.g. some containers): ask v4l2-ctl instead
+                result = _run_cached((_V4L2_CTL, "--list-devices"), _DEVICES_TTL)
+                if result.returncode != 0:
+                    return cameras
+                candidates = self._parse_devices(result.stdout)
+            cameras = self._probe_candidates(candidates)
         except Exception:
             pass
         return cameras
 
-    def _parse_devices(self, output: str) -> list[CameraInfo]:
-        cameras: list[CameraInfo] = []
-        blocks = re.split(r"\n(?=\S)", output.strip())
+    @staticmethod
+    def _is_virtual_name(name: str) -> bool:
+        # v4l2loopback virtual devices and the proxy ones created by the script
+        lowered = name.lower()
+        return "loopback" in lowered or "(v4l2)" in lowered
+
+    def _sysfs_candidates(self) -> list[tuple[str, str]] | None:
+        """Return (name, primary node) per physical device, read from sysfs.
+
+        Groups /dev/videoN nodes per physical device, keeping the
+        lowest-numbered node.  Like the QUERYCAP bus_info that
+        ``v4l2-ctl --list-devices`` groups by, USB nodes are keyed on the
+        USB device rather than the interface, so a webcam's IR function on
+        a second interface stays hidden behind the main camera.  Returns
+        None when /sys/class/video4linux is unavailable.
+        """
+        if not os.path.isdir(_SYSFS_V4L):
+            return None
+        groups: dict[str, tuple[int, str, str]] = {}
+        try:
+            entries = list(os.scandir("/dev"))
+        except OSError:
+            return None
+        for entry in entries:
+            node = entry.name
+            if not (node.startswith("video") and node[5:].isdigit()):
+                continue
+            sys_path = os.path.realpath(os.path.join(_SYSFS_V4L, node))
+            # Software devices (v4l2loopback) live under /sys/devices/virtual
+            if "/virtual/" in sys_path:
+                continue
+            try:
+                with open(os.path.join(sys_path, "name")) as f:
+                    card = f.read().strip()
+            except OSError:
+                continue
+            if self._is_virtual_name(card):
+                continue
+            parent = os.path.realpath(os.path.join(sys_path, "device"))
+            if _USB_INTERFACE_RE.fullmatch(os.path.basename(parent)):
+                parent = os.path.dirname(parent)
+            num = int(node[5:])
+            if parent not in groups or num < groups[parent][0]:
+                groups[parent] = (num, card.split("(")[0].strip(), entry.path)
+        return [(name, path) for _num, name, path in sorted(groups.values())]
+
+    def _parse_devices(self, output: bytes) -> list[tuple[str, str]]:
+        """Return (name, primary node) pairs from ``v4l2-ctl --list-devices``."""
+        candidates: list[tuple[str, str]] = []
+        blocks = _BLOCK_SPLIT_RE.split(output.strip())
         for block in blocks:
             lines = block.strip().splitlines()
             if len(lines) < 2:
                 continue
-            header = lines[0].rstrip(":")
-            # Skip v4l2loopback virtual devices and the proxy ones created by the script
-            if (
-                "v4l2loopback" in header.lower()
-                or "loopback" in header.lower()
-                or "(v4l2)" in header.lower()
-            ):
+            header = lines[0].rstrip(b":").decode("utf-8", "replace")
+            if self._is_virtual_name(header):
                 continue
             devs = [
-                ln.strip() for ln in lines[1:] if ln.strip().startswith("/dev/video")
+                ln.strip() for ln in lines[1:] if ln.strip().startswith(b"/dev/video")
             ]
             if not devs:
                 continue
             # Use the first /dev/videoX as primary
-            device = devs[0]
+            candidates.append((header.split("(")[0].strip(), devs[0].decode()))
+        return candidates
+
+    def _probe_candidates(self, candidates: list[tuple[str, str]]) -> list[CameraInfo]:
+        devices = [device for _name, device in candidates]
+        if len(devices) <= 1:
+            probes = [self._probe_device(d) for d in devices]
+        else:
+            # Probing waits on v4l2-ctl, so several cameras are probed at once
+            with ThreadPoolExecutor(max_workers=min(8, len(devices))) as pool:
+                probes = list(pool.map(self._probe_device, devices))
+
+        cameras: list[CameraInfo] = []
+        for (name, device), (is_capture, formats) in zip(candidates, probes):
             # Verify it has capture capability
-            if not self._is_capture_device(device):
+            if not is_capture:
                 continue
             cam = CameraInfo(
                 id=f"v4l2:{device}",
-                name=header.split("(")[0].strip(),
+                name=name,
                 backend=BackendType.V4L2,
                 device_path=device,
                 capabilities=["video", "controls"],
-                formats=self._get_formats(device),
+                formats=formats,
             )
             # Check if photo capture is achievable (always yes for v4l2 via gstreamer snapshot)
             cam.capabilities.append("photo")
             cameras.append(cam)
         return cameras
 
-    def _is_capture_device(self, device: str) -> bool:
-        try:
-            result = subprocess.run(
-                ["v4l2-ctl", "-d", device, "--info"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            return "Video Capture" in result.stdout
-        except Exception:
-            return False
+    def _probe_device(self, device: str) -> tuple[bool, list[VideoFormat]]:
+        """Return (is_capture_device, formats) from at most one v4l2-ctl run.
 
-    def _get_formats(self, device: str) -> list[VideoFormat]:
+        Capture capability comes straight from the driver, so metadata and
+        output nodes are rejected without spawning anything; ``--info`` is
+        only asked for when the device cannot be queried directly.
+        """
+        is_capture = _query_capture(device)
+        if is_capture is False:
+            return False, []
+        cmd = (_V4L2_CTL, "-d", device, "--list-formats-ext")
+        if is_capture is None:
+            cmd = (_V4L2_CTL, "-d", device, "--info", "--list-formats-ext")
         try:
-            result = subprocess.run(
-                ["v4l2-ctl", "-d", device, "--list-formats-ext"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            return self._parse_formats_ext(result.stdout)
+            result = _run_cached(cmd, _FORMATS_TTL)
         except Exception:
-            return []
-
-    def _parse_formats_ext(self, output: str) -> list[VideoFormat]:
+            return False, []
+        # --info comes first; the format listing starts at the ENUM_FMT banner
+        info, _sep, listing = result.stdout.partition(b"ioctl: VIDIOC_ENUM_FMT")
+        if is_capture is None and b"Video Capture" not in info:
+            return False, []
+        return True, self._parse_formats_ext(listing if _sep else info)
+
+    def _parse_formats_ext(self, output: bytes) -> list[VideoFormat]:
+        """Parse ``v4l2-ctl --list-formats-ext`` output.
+
+        The listing is strictly nested (format, then Size, then Interval
+        lines), so each line is dispatched on its prefix and picked apart
+        with plain string operations.
+        """
         formats: list[VideoFormat] = []
         current_fmt = ""
         current_desc = ""
@@ -194,46 +355,65 @@ class V4L2Backend(CameraBackend):
         fps_list: list[float] = []
 
         for line in output.splitlines():
-            fmt_match = re.match(r"\s+\[\d+\]:\s+'(\w+)'\s+\((.+)\)", line)
-            if fmt_match:
-                # Save previous if pending
+            stripped = line.lstrip()
+            if stripped.startswith(b"Interval:"):
+                # "Interval: Discrete 0.033s (30.000 fps)"
+                start = stripped.rfind(b"(")
+                end = stripped.find(b" fps)", start)
+                if start != -1 and end != -1:
+                    try:
+                        fps_list.append(float(stripped[start + 1:end]))
+                    except ValueError:
+                        pass
+                continue
+
+            if stripped.startswith(b"Size:"):
+                # "Size: Discrete 640x480"
+                parts = stripped.split(None, 3)
+                if len(parts) < 3:
+                    continue
+                width, _sep, height = parts[2].partition(b"x")
+                if not (width.isdigit() and height.isdigit()):
+                    continue
+                # Save previous size if pending
                 if current_fmt and current_w and fps_list:
                     formats.append(
                         VideoFormat(
                             width=current_w,
                             height=current_h,
-                            fps=list(fps_list),
+                            fps=fps_list,
                             pixel_format=current_fmt,
                             description=current_desc,
                         )
                     )
-                current_fmt = fmt_match.group(1)
-                current_desc = fmt_match.group(2).strip()
-                current_w = current_h = 0
+                current_w = int(width)
+                current_h = int(height)
                 fps_list = []
                 continue
 
-            size_match = re.match(r"\s+Size:\s+\w+\s+(\d+)x(\d+)", line)
-            if size_match:
-                # Save previous size if pending
+            if stripped.startswith(b"["):
+                # "[0]: 'MJPG' (Motion-JPEG, compressed)"
+                parts = stripped.split(b"'", 2)
+                if len(parts) != 3 or not parts[0].rstrip().endswith(b"]:"):
+                    continue
+                desc = parts[2].strip()
+                if not (desc.startswith(b"(") and desc.endswith(b")")):
+                    continue
+                # Save previous if pending
                 if current_fmt and current_w and fps_list:
                     formats.append(
                         VideoFormat(
                             width=current_w,
                             height=current_h,
-                            fps=list(fps_list),
+                            fps=fps_list,
                             pixel_format=current_fmt,
                             description=current_desc,
                         )
                     )
-                current_w = int(size_match.group(1))
-                current_h = int(size_match.group(2))
+                current_fmt = parts[1].strip().decode("ascii", "replace")
+                current_desc = desc[1:-1].strip().decode("utf-8", "replace")
+                current_w = current_h = 0
                 fps_list = []
-                continue
-
-            fps_match = re.match(r"\s+Interval:.*\((\d+\.?\d*)\s+fps\)", line)
-            if fps_match:
-                fps_list.append(float(fps_match.group(1)))
 
         # Flush last
         if current_fmt and current_w and fps_list:
@@ -241,7 +421,7 @@ class V4L2Backend(CameraBackend):
                 VideoFormat(
                     width=current_w,
                     height=current_h,
-                    fps=list(fps_list),
+                    fps=fps_list,
                     pixel_format=current_fmt,
                     description=current_desc,
                 )
@@ -253,29 +433,27 @@ class V4L2Backend(CameraBackend):
     def get_controls(self, camera: CameraInfo) -> list[CameraControl]:
         controls: list[CameraControl] = []
         try:
-            result = subprocess.run(
-                ["v4l2-ctl", "-d", camera.device_path, "--list-ctrls-menus"],
-                capture_output=True,
-                text=True,
-                timeout=5,
+            result = _run_cached(
+                (_V4L2_CTL, "-d", camera.device_path, "--list-ctrls-menus"), _CTRLS_TTL
             )
             controls = self._parse_controls(result.stdout)
         except Exception:
             pass
         return controls
 
-    def _parse_controls(self, output: str) -> list[CameraControl]:
+    def _parse_controls(self, output: bytes) -> list[CameraControl]:
         controls: list[CameraControl] = []
         menu_items: dict[str, list[tuple[int, str]]] = {}
         last_ctrl_id = ""
 
         for line in output.splitlines():
+            stripped = line.lstrip()
+            if not stripped:
+                continue
             # Control line: "brightness 0x00980900 (int)    : min=0 max=255 step=1 default=128 value=128"
-            ctrl_match = re.match(
-                r"\s*(\w+)\s+0x[0-9a-f]+\s+\((\w+)\)\s*:\s*(.*)", line
-            )
+            ctrl_match = _CTRL_RE.match(stripped)
             if ctrl_match:
-                ctrl_id = ctrl_match.group(1)
+                ctrl_id = ctrl_match.group(1).decode()
                 ctrl_type_str = ctrl_match.group(2)
                 params_str = ctrl_match.group(3)
                 last_ctrl_id = ctrl_id
@@ -285,15 +463,15 @@ class V4L2Backend(CameraBackend):
 
                 params = self._parse_ctrl_params(params_str)
                 category = _CATEGORY_MAP.get(ctrl_id, ControlCategory.ADVANCED)
-                label = _CONTROL_LABELS.get(ctrl_id, ctrl_id.replace("_", " ").title())
+                label = _control_label(ctrl_id)
 
-                if ctrl_type_str == "int":
+                if ctrl_type_str == b"int":
                     ctype = ControlType.INTEGER
-                elif ctrl_type_str == "bool":
+                elif ctrl_type_str == b"bool":
                     ctype = ControlType.BOOLEAN
-                elif ctrl_type_str == "menu":
+                elif ctrl_type_str == b"menu":
                     ctype = ControlType.MENU
-                elif ctrl_type_str == "button":
+                elif ctrl_type_str == b"button":
                     ctype = ControlType.BUTTON
                 else:
                     ctype = ControlType.INTEGER
@@ -314,10 +492,15 @@ class V4L2Backend(CameraBackend):
                 continue
 
             # Menu entry:  "                1: Manual Mode"
-            menu_match = re.match(r"\s+(\d+):\s+(.+)", line)
-            if menu_match and last_ctrl_id:
+            if not last_ctrl_id or not stripped[:1].isdigit():
+                continue
+            menu_match = _MENU_RE.match(stripped)
+            if menu_match:
                 menu_items.setdefault(last_ctrl_id, []).append(
-                    (int(menu_match.group(1)), menu_match.group(2).strip())
+                    (
+                        int(menu_match.group(1)),
+                        menu_match.group(2).strip().decode("utf-8", "replace"),
+                    )
                 )
 
         # Attach menu choices with their actual V4L2 indices
@@ -330,29 +513,40 @@ class V4L2Backend(CameraBackend):
         return controls
 
     @staticmethod
-    def _parse_ctrl_params(params_str: str) -> dict[str, Any]:
+    def _parse_ctrl_params(params_str: bytes) -> dict[str, Any]:
+        # "min=0 max=255 step=1 default=128 value=128 flags=inactive"
         params: dict[str, Any] = {}
-        for token in re.findall(r"(\w+)=(-?\d+)", params_str):
-            params[token[0]] = int(token[1])
-        flags_match = re.search(r"flags=(\w+)", params_str)
-        if flags_match:
-            params["flags"] = flags_match.group(1)
+        for token in params_str.split():
+            key, sep, val = token.partition(b"=")
+            if not sep:
+                continue
+            if val.lstrip(b"-").isdigit():
+                params[key.decode()] = int(val)
+            elif key == b"flags":
+                # "flags=inactive, volatile": only the first flag is kept
+                params["flags"] = val.split(b",")[0].decode()
         return params
 
     def set_control(self, camera: CameraInfo, control_id: str, value: Any) -> bool:
         try:
-            subprocess.run(
+            spawn.run(
                 [
-                    "v4l2-ctl",
+                    _V4L2_CTL,
                     "-d",
                     camera.device_path,
                     "--set-ctrl",
                     f"{control_id}={value}",
                 ],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
-                timeout=5,
+                timeout=_QUERY_TIMEOUT,
             )
+            # Only the control values changed; formats stay cached
+            with _subproc_lock:
+                _subproc_cache.pop(
+                    (_V4L2_CTL, "-d", camera.device_path, "--list-ctrls-menus"), None
+                )
             return True
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
             return False
@@ -366,10 +560,11 @@ class V4L2Backend(CameraBackend):
         if not camera.device_path:
             return
         try:
-            result = subprocess.run(
-                ["v4l2-ctl", "-d", camera.device_path,
+            result = spawn.run(
+                [_V4L2_CTL, "-d", camera.device_path,
                  "--get-ctrl", "power_line_frequency"],
-                capture_output=True, text=True, timeout=3,
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, timeout=_QUERY_TIMEOUT,
             )
             if result.returncode != 0:
                 return
@@ -433,21 +628,7 @@ class V4L2Backend(CameraBackend):
         """Build pipewiresrc element — PipeWire allows multi-app camera sharing."""
         # Use 'path' property (object ID), not 'target-object' (serial/name).
         src = f"pipewiresrc path={node_id} do-timestamp=true"
-        if fmt is None:
-            fmt = self._pick_best_format(camera)
-        if fmt:
-            if fmt.pixel_format == "MJPG":
-                caps = f"image/jpeg,width={fmt.width},height={fmt.height}"
-                if fmt.fps:
-                    best_fps = int(max(fmt.fps))
-                    caps += f",framerate={best_fps}/1"
-                return f"{src} ! {caps} ! jpegdec max-errors=-1"
-            caps = f"video/x-raw,width={fmt.width},height={fmt.height}"
-            if fmt.fps:
-                best_fps = int(max(fmt.fps))
-                caps += f",framerate={best_fps}/1"
-            return f"{src} ! {caps}"
-        return src
+        return self._with_caps(src, fmt or self._pick_best_format(camera))
 
     def _v4l2_gst_source(
         self, device: str, camera: CameraInfo, fmt: VideoFormat | None
@@ -458,21 +639,20 @@ class V4L2Backend(CameraBackend):
             f"v4l2src device={device} io-mode=mmap do-timestamp=true"
             f" extra-controls=\"s,power_line_frequency={plf}\""
         )
+        return self._with_caps(src, fmt or self._pick_best_format(camera))
+
+    @staticmethod
+    def _with_caps(src: str, fmt: VideoFormat | None) -> str:
+        """Append the caps (and MJPEG decoder) for *fmt* to a source element."""
         if fmt is None:
-            fmt = self._pick_best_format(camera)
-        if fmt:
-            if fmt.pixel_format == "MJPG":
-                caps = f"image/jpeg,width={fmt.width},height={fmt.height}"
-                if fmt.fps:
-                    best_fps = int(max(fmt.fps))
-                    caps += f",framerate={best_fps}/1"
-                return f"{src} ! {caps} ! jpegdec max-errors=-1"
-            caps = f"video/x-raw,width={fmt.width},height={fmt.height}"
-            if fmt.fps:
-                best_fps = int(max(fmt.fps))
-                caps += f",framerate={best_fps}/1"
-            return f"{src} ! {caps}"
-        return src
+            return src
+        rate = f",framerate={fmt.best_fps}/1" if fmt.best_fps else ""
+        if fmt.pixel_format == "MJPG":
+            return (
+                f"{src} ! image/jpeg,width={fmt.width},height={fmt.height}{rate}"
+                " ! jpegdec max-errors=-1"
+            )
+        return f"{src} ! video/x-raw,width={fmt.width},height={fmt.height}{rate}"
 
     @staticmethod
     def _find_pw_node_id(device_path: str) -> int | None:
@@ -481,15 +661,14 @@ class V4L2Backend(CameraBackend):
         Returns the numeric node ID or None if PipeWire is unavailable.
         """
         try:
-            result = subprocess.run(
-                ["pw-dump"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            # Both orjson and json accept raw bytes, and the substring check
+            # skips parsing entirely when PipeWire doesn't know the node
+            result = _run_cached(("pw-dump",), _PW_DUMP_TTL)
             if result.returncode != 0:
                 return None
-            data = json.loads(result.stdout)
+            if device_path.encode() not in result.stdout:
+                return None
+            data = _json.loads(result.stdout)
             for obj in data:
                 props = obj.get("info", {}).get("props", {})
                 if (
@@ -500,7 +679,7 @@ class V4L2Backend(CameraBackend):
                     if node_id is not None:
                         log.info("PipeWire node %d found for %s", node_id, device_path)
                         return int(node_id)
-        except (FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError):
+        except (FileNotFoundError, subprocess.TimeoutExpired, ValueError):
             pass
         return None
 
@@ -511,21 +690,19 @@ class V4L2Backend(CameraBackend):
         mjpeg = [
             f
             for f in camera.formats
-            if f.pixel_format == "MJPG" and f.fps and max(f.fps) >= 25
+            if f.pixel_format == "MJPG" and f.best_fps >= 25
         ]
         raw = [
             f
             for f in camera.formats
-            if f.pixel_format != "MJPG" and f.fps and max(f.fps) >= 25
+            if f.pixel_format != "MJPG" and f.best_fps >= 25
         ]
         # Prefer MJPEG for higher resolutions (lower USB bandwidth)
         candidates = mjpeg if mjpeg else raw
         if not candidates:
             candidates = camera.formats
-        candidates.sort(
-            key=lambda f: (f.width * f.height, max(f.fps) if f.fps else 0), reverse=True
-        )
-        return candidates[0]
+        # Single pass; also leaves camera.formats in its parsed order
+        return max(candidates, key=lambda f: (f.width * f.height, f.best_fps))
 
     # -- photo ---------------------------------------------------------------
 
@@ -535,7 +712,7 @@ class V4L2Backend(CameraBackend):
     def capture_photo(self, camera: CameraInfo, output_path: str) -> bool:
         """Capture a single JPEG frame via ffmpeg (one-shot)."""
         try:
-            subprocess.run(
+            spawn.run(
                 [
                     "ffmpeg",
                     "-y",
@@ -549,7 +726,8 @@ class V4L2Backend(CameraBackend):
                     "2",
                     output_path,
                 ],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
                 timeout=10,
             )
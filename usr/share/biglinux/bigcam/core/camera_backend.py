@@ -9,7 +9,7 @@ from typing import Any
 from constants import BackendType, ControlCategory, ControlType
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraControl:
     id: str
     name: str
@@ -25,16 +25,21 @@ class CameraControl:
     flags: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoFormat:
     width: int
     height: int
     fps: list[float]
     pixel_format: str
     description: str = ""
+    # Highest frame rate as used in caps strings; derived from fps
+    best_fps: int = field(init=False, default=0)
 
+    def __post_init__(self) -> None:
+        self.best_fps = int(max(self.fps)) if self.fps else 0
 
-@dataclass
+
+@dataclass(slots=True)
 class CameraInfo:
     id: str
     name: str
@@ -75,6 +80,15 @@ class CameraBackend(ABC):
     @abstractmethod
     def capture_photo(self, camera: CameraInfo, output_path: str) -> bool: ...
 
+    def set_controls(
+        self, camera: CameraInfo, items: list[tuple[str, Any]]
+    ) -> dict[str, bool]:
+        """Apply several controls at once; returns success per control id.
+
+        Backends where every write is expensive override this to batch them.
+        """
+        return {cid: self.set_control(camera, cid, value) for cid, value in items}
+
     def reset_control(
         self, camera: CameraInfo, control_id: str, controls: list[CameraControl]
     ) -> bool:
@@ -88,6 +102,11 @@ class CameraBackend(ABC):
         self, camera: CameraInfo, controls: list[CameraControl]
     ) -> None:
         """Reset every control to its default value."""
-        for ctrl in controls:
-            if ctrl.flags not in ("inactive", "read-only"):
-                self.set_control(camera, ctrl.id, ctrl.default)
+        self.set_controls(
+            camera,
+            [
+                (ctrl.id, ctrl.default)
+                for ctrl in controls
+                if ctrl.flags not in ("inactive", "read-only")
+            ],
+        )
@@ -6,9 +6,19 @@ import logging
 import re
 import subprocess
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import glob
+import hashlib
+
+try:
+    import pyudev
+
+    _HAS_PYUDEV = True
+except ImportError:
+    _HAS_PYUDEV = False
 
 log = logging.getLogger(__name__)
 
@@ -21,6 +31,10 @@ from core.backends.gphoto2_backend import GPhoto2Backend
 from core.backends.libcamera_backend import LibcameraBackend
 from core.backends.pipewire_backend import PipeWireBackend
 from core.backends.ip_backend import IPBackend
+from utils import spawn
+
+# Seconds a backend's detection result is reused by the next detection run
+_DETECT_CACHE_TTL = 3.0
 
 
 class CameraManager(GObject.Object):
@@ -34,11 +48,16 @@ class CameraManager(GObject.Object):
     def __init__(self) -> None:
         super().__init__()
         self._backends: list[CameraBackend] = []
+        self._backend_by_type: dict[BackendType, CameraBackend] = {}
+        # (timestamp, cameras) per backend, so back-to-back detections
+        # don't re-probe; dropped on every hotplug event
+        self._detect_cache: dict[BackendType, tuple[float, list[CameraInfo]]] = {}
         self._cameras: list[CameraInfo] = []
         self._detecting = False
         self._first_detection = True
         self._hotplug_timer: int | None = None
-        self._last_lsusb: str = ""
+        # Digest of the last ``lsusb`` listing (polling fallback only)
+        self._last_lsusb_hash: bytes = b""
         self._last_video_devs: str = ""
 
         # Gio.FileMonitor for instant /dev/ changes
@@ -47,11 +66,14 @@ class CameraManager(GObject.Object):
         self._usb_bus_monitors: list[Gio.FileMonitor] = []
         # Debounce timer for batching rapid device events
         self._debounce_timer: int | None = None
+        self._debounce_deadline = 0.0
         # Lock to protect shared polling state across threads
         self._poll_lock = threading.Lock()
         # Stop event for the polling thread
         self._poll_stop_event = threading.Event()
         self._poll_thread: threading.Thread | None = None
+        # udev netlink observer; replaces the lsusb polling when available
+        self._udev_observer: Any = None
 
         self._register_backends()
 
@@ -69,6 +91,7 @@ class CameraManager(GObject.Object):
             try:
                 if b.is_available():
                     self._backends.append(b)
+                    self._backend_by_type[b.get_backend_type()] = b
             except Exception:
                 log.debug("Backend %s check failed", type(b).__name__, exc_info=True)
 
@@ -78,13 +101,17 @@ class CameraManager(GObject.Object):
 
     @property
     def available_backends(self) -> list[BackendType]:
-        return [b.get_backend_type() for b in self._backends]
+        return list(self._backend_by_type)
 
-    def get_backend(self, backend_type: BackendType) -> CameraBackend | None:
+    def _invalidate_backend_caches(self) -> None:
+        """Make the next detection re-probe backends that cache their results."""
+        self._detect_cache.clear()
         for b in self._backends:
-            if b.get_backend_type() == backend_type:
-                return b
-        return None
+            if hasattr(b, "invalidate_cache"):
+                b.invalidate_cache()
+
+    def get_backend(self, backend_type: BackendType) -> CameraBackend | None:
+        return self._backend_by_type.get(backend_type)
 
     # -- detection -----------------------------------------------------------
 
@@ -94,6 +121,9 @@ class CameraManager(GObject.Object):
             return
         self._detecting = True
         self._force_emit = force_emit
+        if force_emit:
+            # Full reload: re-probe even where a cached result is still fresh
+            self._invalidate_backend_caches()
 
         def _normalize_name(name: str) -> str:
             """Strip non-alphanumeric chars for duplicate detection."""
@@ -103,12 +133,37 @@ class CameraManager(GObject.Object):
             all_cameras: list[CameraInfo] = []
             seen_ids: set[str] = set()
             seen_norm: list[str] = []
+            # IP cameras are added manually
+            backends = [
+                b for b in self._backends if b.get_backend_type() != BackendType.IP
+            ]
             try:
-                for b in self._backends:
-                    if b.get_backend_type() == BackendType.IP:
-                        continue  # IP cameras are added manually
+                # Probe backends without a fresh cached result concurrently
+                # (each is subprocess/USB bound), but merge in registration
+                # order so duplicate resolution still prefers the earlier
+                # backend.
+                now = time.monotonic()
+                cached: dict[BackendType, list[CameraInfo]] = {}
+                for b in backends:
+                    entry = self._detect_cache.get(b.get_backend_type())
+                    if entry is not None and now - entry[0] < _DETECT_CACHE_TTL:
+                        cached[b.get_backend_type()] = entry[1]
+                with ThreadPoolExecutor(
+                    max_workers=max(len(backends) - len(cached), 1),
+                    thread_name_prefix="bigcam-detect",
+                ) as pool:
+                    futures = {
+                        b: pool.submit(b.detect_cameras)
+                        for b in backends
+                        if b.get_backend_type() not in cached
+                    }
+                for b in backends:
                     try:
-                        found = b.detect_cameras()
+                        btype = b.get_backend_type()
+                        found = cached.get(btype)
+                        if found is None:
+                            found = futures[b].result()
+                            self._detect_cache[btype] = (time.monotonic(), found)
                         if (
                             not found
                             and hasattr(b, "_streaming_active")
@@ -216,6 +271,14 @@ class CameraManager(GObject.Object):
             return backend.set_control(camera, control_id, value)
         return False
 
+    def set_controls(
+        self, camera: CameraInfo, items: list[tuple[str, Any]]
+    ) -> dict[str, bool]:
+        backend = self.get_backend(camera.backend)
+        if backend:
+            return backend.set_controls(camera, items)
+        return {}
+
     def reset_all_controls(
         self, camera: CameraInfo, controls: list[CameraControl]
     ) -> None:
@@ -255,12 +318,7 @@ class CameraManager(GObject.Object):
     # -- hotplug detection ---------------------------------------------------
 
     def start_hotplug(self, interval_ms: int = 5000) -> None:
-        """Start USB hotplug monitoring using /dev/ inotify + polling fallback."""
-        # Take a baseline snapshot so the first poll doesn't false-trigger
-        self._snapshot_device_state()
-        log.info("Hotplug monitoring started (poll=%dms, baseline=%s)",
-                 interval_ms, self._last_video_devs)
-
+        """Start USB hotplug monitoring using /dev/ inotify + udev or polling fallback."""
         # Start Gio.FileMonitor on /dev/ for instant V4L2 device detection
         if self._dev_monitor is None:
             try:
@@ -287,6 +345,14 @@ class CameraManager(GObject.Object):
             except Exception:
                 log.warning("Failed to start USB bus monitors", exc_info=True)
 
+        # Kernel uevents make the lsusb polling below unnecessary
+        if self._start_udev_observer():
+            return
+
+        # Take a baseline snapshot so the first poll doesn't false-trigger
+        self._snapshot_device_state()
+        log.info("Hotplug polling started (poll=%dms)", interval_ms)
+
         # Keep polling as a safety-net fallback (single persistent thread)
         if self._poll_thread is None or not self._poll_thread.is_alive():
             self._poll_stop_event.clear()
@@ -298,6 +364,41 @@ class CameraManager(GObject.Object):
             )
             self._poll_thread.start()
 
+    def _start_udev_observer(self) -> bool:
+        """Watch USB and video4linux uevents over netlink (needs pyudev)."""
+        if self._udev_observer is not None:
+            return True
+        if not _HAS_PYUDEV:
+            return False
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by("usb", device_type="usb_device")
+            monitor.filter_by("video4linux")
+            observer = pyudev.MonitorObserver(
+                monitor, callback=self._on_udev_event, name="bigcam-udev"
+            )
+            observer.start()
+        except Exception:
+            log.warning("Failed to start udev monitor", exc_info=True)
+            return False
+        self._udev_observer = observer
+        log.info("Started udev monitor for hotplug detection")
+        return True
+
+    def _on_udev_event(self, device: Any) -> None:
+        """udev observer thread: forward add/remove events to the main loop."""
+        if device.action in ("add", "remove"):
+            GLib.idle_add(self._on_udev_changed, device.action, device.subsystem)
+
+    def _on_udev_changed(self, action: str, subsystem: str) -> bool:
+        log.info("udev hotplug: %s %s", action, subsystem)
+        if subsystem == "usb":
+            self._invalidate_backend_caches()
+            self._schedule_debounced_detection(debounce_ms=2000)
+        else:
+            self._schedule_debounced_detection()
+        return False
+
     def stop_hotplug(self) -> None:
         # Cancel pending debounce
         if self._debounce_timer is not None:
@@ -308,6 +409,10 @@ class CameraManager(GObject.Object):
             GLib.source_remove(self._hotplug_timer)
             self._hotplug_timer = None
 
+        if self._udev_observer is not None:
+            self._udev_observer.stop()
+            self._udev_observer = None
+
         # Stop the polling thread
         self._poll_stop_event.set()
         if self._poll_thread is not None:
@@ -324,15 +429,12 @@ class CameraManager(GObject.Object):
 
     def _snapshot_device_state(self) -> None:
         """Capture current USB + video device state as baseline (runs in background)."""
+        if self._udev_observer is not None:
+            return  # only the polling fallback compares snapshots
+
         def _do_snapshot() -> None:
             with self._poll_lock:
-                try:
-                    result = subprocess.run(
-                        ["lsusb"], capture_output=True, text=True, timeout=5
-                    )
-                    self._last_lsusb = result.stdout
-                except Exception:
-                    self._last_lsusb = ""
+                self._last_lsusb_hash = self._lsusb_digest() or b""
                 try:
                     self._last_video_devs = ",".join(
                         sorted(glob.glob("/dev/video*"))
@@ -377,22 +479,44 @@ class CameraManager(GObject.Object):
         ):
             return
         log.info("USB bus hotplug: %s %s", event_type.value_nick, file.get_path())
+        self._invalidate_backend_caches()
         self._schedule_debounced_detection(debounce_ms=2000)
 
     def _schedule_debounced_detection(self, debounce_ms: int = 800) -> None:
-        """Debounce rapid device events into a single detection run."""
+        """Coalesce rapid device events into a single detection run.
+
+        A pending run is only pushed back when this event needs a later
+        deadline, so an event storm can't postpone detection indefinitely.
+        """
+        deadline = time.monotonic() + debounce_ms / 1000.0
         if self._debounce_timer is not None:
+            if deadline <= self._debounce_deadline:
+                return
             GLib.source_remove(self._debounce_timer)
+        self._debounce_deadline = deadline
         self._debounce_timer = GLib.timeout_add(debounce_ms, self._debounced_detect)
 
     def _debounced_detect(self) -> bool:
         """Fire after debounce period expires."""
         self._debounce_timer = None
         log.debug("Debounced hotplug detection triggered")
+        self._detect_cache.clear()
         self._snapshot_device_state()
         self.detect_cameras_async()
         return False  # one-shot
 
+    @staticmethod
+    def _lsusb_digest() -> bytes | None:
+        """16-byte digest of the ``lsusb`` listing; None if it can't be read."""
+        try:
+            result = spawn.run(
+                ["lsusb"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=5
+            )
+        except Exception:
+            log.debug("USB hotplug check failed", exc_info=True)
+            return None
+        return hashlib.blake2b(result.stdout, digest_size=16).digest()
+
     def _poll_hotplug_loop(self, interval_s: float) -> None:
         """Persistent polling thread — checks for USB/video device changes."""
         while not self._poll_stop_event.wait(timeout=interval_s):
@@ -400,16 +524,10 @@ class CameraManager(GObject.Object):
                 continue
             changed = False
             with self._poll_lock:
-                try:
-                    result = subprocess.run(
-                        ["lsusb"], capture_output=True, text=True, timeout=5
-                    )
-                    current_usb = result.stdout
-                    if current_usb != self._last_lsusb:
-                        self._last_lsusb = current_usb
-                        changed = True
-                except Exception:
-                    log.debug("USB hotplug check failed", exc_info=True)
+                current_usb = self._lsusb_digest()
+                if current_usb is not None and current_usb != self._last_lsusb_hash:
+                    self._last_lsusb_hash = current_usb
+                    changed = True
                 try:
                     video_devs = ",".join(sorted(glob.glob("/dev/video*")))
                     if video_devs != self._last_video_devs:
@@ -418,4 +536,5 @@ class CameraManager(GObject.Object):
                 except Exception:
                     log.debug("Video device check failed", exc_info=True)
             if changed:
-                GLib.idle_add(self.detect_cameras_async)
+                self._invalidate_backend_caches()
+                GLib.idle_add(self._schedule_debounced_detection)
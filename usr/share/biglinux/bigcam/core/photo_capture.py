@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import time
+from typing import Callable
 
 from core.camera_backend import CameraInfo
 from core.camera_manager import CameraManager
@@ -13,22 +14,52 @@ from utils import xdg
 class PhotoCapture:
     """Handles photo capture across all backends with filename generation."""
 
-    def __init__(self, camera_manager: CameraManager) -> None:
+    def __init__(
+        self,
+        camera_manager: CameraManager,
+        frame_source: Callable[[str, Callable[[bool], None]], bool] | None = None,
+    ) -> None:
         self._manager = camera_manager
+        # Saves the newest preview frame to a path in the background and
+        # reports the result to a callback (StreamEngine.capture_snapshot)
+        self._frame_source = frame_source
 
     def capture(self, camera: CameraInfo, filename: str | None = None) -> str | None:
         """Capture a photo. Returns the output path on success, None on failure."""
         if not self._manager.can_capture_photo(camera):
             return None
 
+        output_path = self._output_path(filename, "jpg")
+        ok = self._manager.capture_photo(camera, output_path)
+        return output_path if ok else None
+
+    def capture_frame_async(
+        self,
+        on_done: Callable[[str | None], None],
+        filename: str | None = None,
+    ) -> bool:
+        """Save the most recent preview frame without blocking the caller.
+
+        *on_done* runs on the main loop with the output path, or None on
+        failure. Returns False (without calling *on_done*) when there is
+        no frame source.
+        """
+        if self._frame_source is None:
+            return False
+        output_path = self._output_path(filename, "png")
+
+        def _saved(ok: bool) -> None:
+            on_done(output_path if ok else None)
+
+        self._frame_source(output_path, _saved)
+        return True
+
+    @staticmethod
+    def _output_path(filename: str | None, ext: str) -> str:
         if filename is None:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
-            ext = "jpg"
             filename = f"bigcam_{timestamp}.{ext}"
 
         output_dir = xdg.photos_dir()
         os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, filename)
-
-        ok = self._manager.capture_photo(camera, output_path)
-        return output_path if ok else None
+        return os.path.join(output_dir, filename)
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import itertools
+import fcntl
 import logging
 import os
-import subprocess
+import socket
+import struct
+import termios
 import threading
-from typing import Any
+import time
+from typing import Any, Callable
 
 import gi
 
@@ -14,7 +19,7 @@ gi.require_version("Gst", "1.0")
 gi.require_version("GstVideo", "1.0")
 gi.require_version("Gdk", "4.0")
 
-from gi.repository import Gst, Gdk, GLib, GObject
+from gi.repository import Gst, GstVideo, Gdk, GLib, GObject
 
 import numpy as np
 
@@ -27,6 +32,25 @@ try:
 except ImportError:
     _HAS_CV2 = False
 
+try:
+    import cairo
+
+    # GTK >= 4.16: frames can be described as updates of the previous texture
+    _HAS_TEXTURE_UPDATES = hasattr(Gdk, "MemoryTextureBuilder")
+except ImportError:
+    _HAS_TEXTURE_UPDATES = False
+
+try:
+    gi.require_version("GstAllocators", "1.0")
+    from gi.repository import GstAllocators
+
+    # GTK >= 4.14 imports DMA-BUFs, GStreamer >= 1.24 negotiates them as DMA_DRM
+    _HAS_DMABUF = hasattr(Gdk, "DmabufTextureBuilder") and hasattr(
+        GstVideo, "dma_drm_fourcc_from_string"
+    )
+except (ImportError, ValueError):
+    _HAS_DMABUF = False
+
 from constants import BackendType
 from core.camera_backend import CameraInfo, VideoFormat
 from core.camera_manager import CameraManager
@@ -39,6 +63,43 @@ log = logging.getLogger(__name__)
 
 # Backends that stream via UDP (MPEG-TS) need appsink
 _APPSINK_BACKENDS = {BackendType.GPHOTO2, BackendType.IP}
+# A UDP/MPEG-TS stream that has not produced a frame by then has failed
+_APPSINK_STARTUP_TIMEOUT = 15
+# Pause before restarting a pipeline that failed before its first frame
+_APPSINK_RETRY_DELAY_MS = 500
+
+_PREVIEW_MEMORY_FORMAT = Gdk.MemoryFormat.B8G8R8A8_PREMULTIPLIED
+
+# Fixed pipeline tails as (factory, name, properties); only the source in
+# front of them depends on the camera.  Property values use gst-launch syntax.
+_PAINTABLE_TAIL = (
+    ("videoconvert", "conv", {"n_threads": str(min(os.cpu_count() or 2, 4))}),
+    ("capsfilter", None, {"caps": "video/x-raw,format=BGRA"}),
+    ("tee", "t", {}),
+    ("queue", None, {"max_size_buffers": "4", "leaky": "downstream", "silent": "true"}),
+)
+# Live preview: render each frame on arrival, never drop late ones.  The sink
+# itself is kept across pipelines (see StreamEngine._paintable_tail).
+_PAINTABLE_SINK_PROPS = {"sync": "false", "max_lateness": "-1", "qos": "false"}
+_APPSINK_SINK = ("appsink", "sink", {
+    "emit_signals": "true", "drop": "true", "max_buffers": "2",
+    "sync": "false", "max_lateness": "-1", "qos": "false",
+})
+_APPSINK_TAIL = (
+    ("capsfilter", None, {"caps": "video/x-raw,format=BGRA"}),
+    ("tee", "t", {}),
+    ("queue", None, {"max_size_buffers": "2", "leaky": "downstream", "silent": "true"}),
+    _APPSINK_SINK,
+)
+# Hardware-decoded preview: the decoder's DMA-BUFs are handed to GTK as-is
+_DMABUF_APPSINK_TAIL = (
+    ("capsfilter", None, {"caps": "video/x-raw(memory:DMABuf),format=DMA_DRM"}),
+    ("queue", None, {"max_size_buffers": "2", "leaky": "downstream", "silent": "true"}),
+    _APPSINK_SINK,
+)
+# Fixed ring of BGRA frames offered to videoconvert in front of appsink: the
+# one being converted, up to two queued and the one parked for the consumer
+_APPSINK_POOL_BUFFERS = 4
 
 # ── Thread-safe stderr suppression (refcounted) ─────────────────────
 # Native libraries (libjpeg-turbo, V4L2) write warnings directly to fd 2.
@@ -72,37 +133,117 @@ def _stderr_restore() -> None:
             _stderr_orig_fd = None
 
 
+def _make_element(factory: str, name: str | None = None, **props: str) -> Gst.Element | None:
+    """Create a *factory* element, setting *props* the way gst-launch parses them.
+
+    Property names use underscores in place of dashes (``max_size_buffers``).
+    """
+    elem = Gst.ElementFactory.make(factory, name)
+    if elem is None:
+        log.warning("GStreamer element %s is not available", factory)
+        return None
+    for key, value in props.items():
+        Gst.util_set_object_arg(elem, key.replace("_", "-"), value)
+    return elem
+
+
+def _make_tail(spec: tuple[tuple[str, str | None, dict[str, str]], ...]) -> list[Gst.Element] | None:
+    """Create the elements of a tail *spec*; None if any factory is missing."""
+    tail = [_make_element(factory, name, **props) for factory, name, props in spec]
+    return None if any(e is None for e in tail) else tail
+
+
+def _parse_source(source_desc: str) -> Gst.Bin | None:
+    """Parse a backend source description into a bin with a ghost src pad."""
+    try:
+        return Gst.parse_bin_from_description(source_desc, True)
+    except GLib.Error as exc:
+        log.warning("Pipeline parse error: %s", exc)
+        return None
+
+
+def _assemble_pipeline(
+    source_desc: str, tail: list[Gst.Element], source: Gst.Bin | None = None,
+) -> Gst.Pipeline | None:
+    """Build a pipeline from a backend source description plus prebuilt *tail*.
+
+    Only the source part (which differs per backend and camera) goes through
+    the launch-syntax parser; the fixed tail is linked element by element.
+    An already parsed, unparented *source* bin is used as-is.
+    """
+    if source is None:
+        source = _parse_source(source_desc)
+        if source is None:
+            return None
+    pipeline = Gst.Pipeline.new("bigcam")
+    pipeline.add(source)
+    prev = source
+    for elem in tail:
+        pipeline.add(elem)
+        if not prev.link(elem):
+            log.warning("Failed to link %s to %s", prev.get_name(), elem.get_name())
+            pipeline.set_state(Gst.State.NULL)
+            # Hand the tail back unparented; callers may keep its sink
+            for added in tail[: tail.index(elem) + 1]:
+                pipeline.remove(added)
+            return None
+        prev = elem
+    return pipeline
+
+
+def _without_convert(source_desc: str) -> str:
+    """Swap a trailing ``! videoconvert`` for a queue so the decoder output is negotiated as-is.
+
+    The sources end in decodebin, whose pads only appear at runtime; the
+    queue gives the parsed bin a static src pad to ghost.
+    """
+    head, sep, last = source_desc.rpartition("!")
+    if sep and last.strip() == "videoconvert":
+        return f"{head.rstrip()} ! queue"
+    return source_desc
+
+
+# device path -> (monotonic time, process names); errors come in bursts
+_device_users_cache: dict[str, tuple[float, list[str]]] = {}
+_DEVICE_USERS_TTL = 2.0
+
+
 def _find_device_users(device_path: str) -> list[str]:
     """Return list of process names currently using a V4L2 device.
 
     Filters out the current process (BigCam) so we only report *external*
-    applications holding the device.
+    applications holding the device.  Scans /proc/<pid>/fd directly, like
+    fuser does, but without spawning it; may block, call off the main loop.
     """
+    now = time.monotonic()
+    cached = _device_users_cache.get(device_path)
+    if cached is not None and now - cached[0] < _DEVICE_USERS_TTL:
+        return list(cached[1])
+    target = os.path.realpath(device_path)
+    own_pid = str(os.getpid())
+    names: list[str] = []
     try:
-        result = subprocess.run(
-            ["fuser", device_path],
-            capture_output=True,
-            text=True,
-            timeout=3,
-        )
-        pids = result.stdout.strip().split()
-        own_pid = str(os.getpid())
-        names: list[str] = []
-        for pid in pids:
-            pid = pid.strip().rstrip("m")
-            if not pid.isdigit():
-                continue
-            if pid == own_pid:
+        procs = os.scandir("/proc")
+    except OSError:
+        return []
+    with procs:
+        for proc in procs:
+            if not proc.name.isdigit() or proc.name == own_pid:
                 continue
-            comm = f"/proc/{pid}/comm"
-            if os.path.exists(comm):
-                with open(comm) as f:
+            try:
+                with os.scandir(f"/proc/{proc.name}/fd") as fds:
+                    holds = any(os.readlink(fd.path) == target for fd in fds)
+                if not holds:
+                    continue
+                with open(f"/proc/{proc.name}/comm") as f:
                     name = f.read().strip()
-                    if name and name not in names:
-                        names.append(name)
-        return names
-    except Exception:
-        return []
+            except OSError:
+                # Gone, or not ours to inspect
+                continue
+            if name and name not in names:
+                names.append(name)
+    _device_users_cache[device_path] = (now, names)
+    return list(names)
 
 
 class _BgVcamFeeder:
@@ -241,9 +382,55 @@ class StreamEngine(GObject.Object):
         self._current_camera: CameraInfo | None = None
         self._current_fmt: VideoFormat | None = None
         self._gtksink: Any = None
+        # Kept across pipelines so the paintable shown by the preview
+        # (and the sink's GL resources) survive camera switches
+        self._paintable_sink: Gst.Element | None = None
+        self._paintable_source = ""
+        self._texture_builder: Any = None
+        # Textures are built on the appsink consumer thread and, for the
+        # OpenCV/phone paths, on the main thread
+        self._texture_builder_lock = threading.Lock()
+        self._texture_region: Any = None
+        self._texture_region_size: tuple[int, int] = (0, 0)
         self._use_appsink = False
+        # Set up per stream by _build_appsink_pipeline
+        self._appsink_deadline_id: int | None = None
+        self._appsink_connected = False
+        self._appsink_sample_count = 0
+        # Single-slot hand-off from the streaming thread to the consumer
+        self._appsink_slot: Gst.Sample | None = None
+        self._appsink_slot_lock = threading.Lock()
+        self._appsink_slot_event = threading.Event()
+        self._appsink_stop_event: threading.Event | None = None
+        self._appsink_thread: threading.Thread | None = None
+        self._appsink_caps_key = 0
+        self._appsink_size: tuple[int, int] = (0, 0)
+        # DMA-BUF preview (see _try_appsink_pipeline): whether the running
+        # pipeline uses it, whether this stream may still try it, and the
+        # import state used by the consumer thread
+        self._appsink_dmabuf = False
+        self._appsink_dmabuf_ok = False
+        self._dmabuf_caps = False
+        self._dmabuf_format: tuple[int, int] = (0, 0)
+        self._dmabuf_display: Any = None
+        self._dmabuf_builder: Any = None
+        # Samples backing live DMA-BUF textures, released by the textures'
+        # destroy notify once GTK is done with them
+        self._dmabuf_frames: dict[int, Gst.Sample] = {}
+        self._dmabuf_frame_ids = itertools.count()
+        self._dmabuf_leaving = False
+        self._udp_probe_sock: socket.socket | None = None
+        self._udp_probe_deadline = 0.0
+        # Parsed UDP/MPEG-TS source bins, reused across startup retries
+        self._appsink_sources: dict[str, Gst.Bin] = {}
         self._last_texture: Gdk.Texture | None = None
+        # Single-slot hand-off of built textures from the appsink consumer
+        # thread to the main loop
+        self._pending_texture: Gdk.Texture | None = None
+        self._pending_texture_lock = threading.Lock()
         self._frame_count: int = 0
+        # Bumped by stop(): play() continuations started before it are stale
+        self._play_generation = 0
         self._current_fps: float = 0.0
         self._fps_timer_id: int | None = None
         self._mirror: bool = False
@@ -257,6 +444,14 @@ class StreamEngine(GObject.Object):
         self._qr_scan_active: bool = False  # whether QR scanning mode is on
         self._qr_scan_tick: int = 0  # animation counter for scanning guide
         self._video_recorder: Any = None  # set by window to enable phone recording
+        # Extra consumers fed from the paintable pipeline's tee (add_branch)
+        self._tee: Gst.Element | None = None
+        self._branch_pads: dict[Gst.Element, Gst.Pad] = {}
+        # Recording branch while recording a paintable pipeline; frames are
+        # then no longer copied out for VideoRecorder.write_frame
+        self._rec_branch: Gst.Bin | None = None
+        self._rec_branch_pending = False
+        self._rec_branch_unavailable = False
         self._zoom_level: float = 1.0  # 1.0 = no zoom, 2.0 = 2x zoom
         self._sharpness: float = 0.0  # 0.0 = off, positive = sharpen strength
         self._pan: float = 0.0   # -1.0 to 1.0 (left/right offset ratio)
@@ -268,7 +463,8 @@ class StreamEngine(GObject.Object):
         self._vcam_alloc_id: str = ""  # VirtualCamera allocation id for vcam device
         self._vcam_w: int = 0
         self._vcam_h: int = 0
-        self._vcam_bgra_buf: np.ndarray | None = None
+        # BGR -> BGRA scratch frames, one per producer (see _bgra_bytes)
+        self._bgra_pool: dict[str, np.ndarray] = {}
         self._prefer_v4l2: bool = True  # bypass PipeWire, use v4l2src directly
         # OpenCV direct capture (like guvcview) — used when prefer_v4l2 is active
         self._cv_cap: Any = None  # cv2.VideoCapture or None
@@ -297,8 +493,27 @@ class StreamEngine(GObject.Object):
 
     @property
     def last_frame_bgr(self):
-        """Return the last BGR frame (numpy array) from the probe, or None."""
-        return self._last_probe_bgr
+        """Return the last BGR frame (numpy array) from the probe, or None.
+
+        A DMA-BUF preview has no CPU frame; it is read back from the GPU
+        instead (main thread only).
+        """
+        frame = self._last_probe_bgr
+        if frame is None and self._appsink_dmabuf and self._last_texture is not None:
+            try:
+                frame = self._download_bgr(self._last_texture)
+            except Exception:
+                log.debug("DMA-BUF frame download failed", exc_info=True)
+        return frame
+
+    @staticmethod
+    def _download_bgr(texture: Gdk.Texture) -> np.ndarray:
+        downloader = Gdk.TextureDownloader.new(texture)
+        downloader.set_format(Gdk.MemoryFormat.B8G8R8)
+        data, stride = downloader.download_bytes()
+        w, h = texture.get_width(), texture.get_height()
+        rows = np.frombuffer(data.get_data(), dtype=np.uint8).reshape((h, stride))
+        return rows[:, : w * 3].reshape((h, w, 3))
 
     def set_overlay_rects(self, rects: list[tuple]) -> None:
         """Set rectangles to draw on the video feed (e.g. QR bounding boxes)."""
@@ -368,12 +583,6 @@ class StreamEngine(GObject.Object):
         self._frame_count = 0
         return True
 
-    def _on_frame_probe(
-        self, pad: Gst.Pad, info: Gst.PadProbeInfo
-    ) -> Gst.PadProbeReturn:
-        self._frame_count += 1
-        return Gst.PadProbeReturn.OK
-
     # -- shared frame processing ---------------------------------------------
 
     def _apply_frame_processing(self, bgr: np.ndarray) -> np.ndarray:
@@ -450,13 +659,30 @@ class StreamEngine(GObject.Object):
             if bgra_direct is not None and not self._mirror:
                 self._schedule_vcam_push(bgra_direct, w, h)
             else:
-                if self._vcam_bgra_buf is None or self._vcam_bgra_buf.shape[:2] != (h, w):
-                    self._vcam_bgra_buf = np.empty((h, w, 4), dtype=np.uint8)
-                cv2.cvtColor(self._last_probe_bgr, cv2.COLOR_BGR2BGRA, dst=self._vcam_bgra_buf)
-                self._schedule_vcam_push(self._vcam_bgra_buf.tobytes(), w, h)
-        if self._video_recorder and self._video_recorder.is_recording:
+                self._schedule_vcam_push(self._bgra_bytes(self._last_probe_bgr, "vcam"), w, h)
+        if (
+            self._rec_branch is None
+            and self._video_recorder
+            and self._video_recorder.is_recording
+        ):
             self._video_recorder.write_frame(self._last_probe_bgr)
 
+    def _bgra_bytes(self, bgr: np.ndarray, slot: str) -> bytes:
+        """Convert a BGR frame to BGRA bytes through a recycled scratch frame.
+
+        Producers run on different threads, so each *slot* keeps its own
+        frame; it is only reallocated when the frame size changes.
+        GdkMemoryTexture is immutable, so the bytes handed to GLib remain
+        the only per-frame allocation.
+        """
+        h, w = bgr.shape[:2]
+        buf = self._bgra_pool.get(slot)
+        if buf is None or buf.shape[:2] != (h, w):
+            buf = np.empty((h, w, 4), dtype=np.uint8)
+            self._bgra_pool[slot] = buf
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2BGRA, dst=buf)
+        return buf.tobytes()
+
     def _has_processing_work(self) -> bool:
         """Check if any frame processing is needed."""
         return (self._effects.has_active_effects() or self._overlay_rects
@@ -464,14 +690,33 @@ class StreamEngine(GObject.Object):
                 or self._zoom_level > 1.0 or self._sharpness > 0.0
                 or self._pan != 0.0 or self._tilt != 0.0)
 
+    def _needs_cpu_frames(self) -> bool:
+        """Check if anything reads appsink frames on the CPU."""
+        return bool(
+            self._vcam_device
+            or self._has_processing_work()
+            or (self._video_recorder and self._video_recorder.is_recording)
+        )
+
     def _on_paintable_probe(
         self, pad: Gst.Pad, info: Gst.PadProbeInfo
     ) -> Gst.PadProbeReturn:
         """Buffer probe on tee sink — applies OpenCV effects via buffer replacement."""
         self._frame_count += 1
+        # UDP streams: data is flowing, later errors are not startup errors
+        if not self._appsink_connected:
+            self._appsink_connected = True
+            GLib.idle_add(self._on_first_frame_ready)
 
         has_work = self._has_processing_work()
-        is_recording = self._video_recorder and self._video_recorder.is_recording
+        is_recording = bool(self._video_recorder and self._video_recorder.is_recording)
+        if is_recording != (self._rec_branch is not None) and not self._rec_branch_pending:
+            if not is_recording or not self._rec_branch_unavailable:
+                self._rec_branch_pending = True
+                GLib.idle_add(self._sync_recording_branch)
+        # With the recording branch attached the recorder takes its frames
+        # from the tee, not from here
+        is_recording = is_recording and self._rec_branch is None
         # Fast path: no effects/overlays — only grab BGR every 10th frame for photos
         # If virtual camera is active but no effects, process every 2nd frame
         # to reduce memory pressure (~108 MB/s → ~54 MB/s of temp allocations).
@@ -494,9 +739,10 @@ class StreamEngine(GObject.Object):
         if not self._probe_cached_fmt:
             self._probe_cached_fmt = s.get_string("format") or ""
         fmt = self._probe_cached_fmt
-        self._probe_debug_count += 1
-        if self._probe_debug_count <= 3:
-            log.debug(f"paintable_probe: fmt={fmt}, {w}x{h}")
+        if self._probe_debug_count <= 5 and log.isEnabledFor(logging.DEBUG):
+            self._probe_debug_count += 1
+            if self._probe_debug_count <= 3:
+                log.debug("paintable_probe: fmt=%s, %dx%d", fmt, w, h)
 
         ok, map_info = buf.map(Gst.MapFlags.READ)
         if not ok:
@@ -560,8 +806,7 @@ class StreamEngine(GObject.Object):
                             ).tobytes()
                 else:
                     # No effects — fast path: minimise copies
-                    is_rec = self._video_recorder and self._video_recorder.is_recording
-                    need_bgr = is_rec or (self._frame_count % 10 == 0)
+                    need_bgr = is_recording or (self._frame_count % 10 == 0)
                     bgr_copy = bgr.copy() if need_bgr else None
                     if self._vcam_device and fmt in ("BGRA", "BGRx"):
                         bgra_direct = bytes(map_info.data)
@@ -580,7 +825,7 @@ class StreamEngine(GObject.Object):
                         self._distribute_processed_frame(bgr_copy, w, h)
         except Exception as e:
             if self._probe_debug_count <= 5:
-                log.debug(f"paintable_probe error: {e}")
+                log.debug("paintable_probe error: %s", e)
         finally:
             buf.unmap(map_info)
         if result is not None:
@@ -599,6 +844,8 @@ class StreamEngine(GObject.Object):
     @mirror.setter
     def mirror(self, value: bool) -> None:
         self._mirror = value
+        if self._rec_branch is not None:
+            self._video_recorder.set_mirror(value)
 
     @property
     def prefer_v4l2(self) -> bool:
@@ -608,40 +855,70 @@ class StreamEngine(GObject.Object):
     def prefer_v4l2(self, value: bool) -> None:
         self._prefer_v4l2 = value
 
-    def capture_snapshot(self, output_path: str) -> bool:
+    def capture_snapshot(
+        self, output_path: str, callback: Callable[[bool], None] | None = None,
+    ) -> bool:
         """Save the current preview frame as a PNG file.
 
         Works for both paintable and appsink pipelines.
         Prioritizes the probe's BGR frame which has all effects and mirroring applied.
-        """
-        # 1. Try capture from probe's last frame (includes all effects + mirror)
-        if self._last_probe_bgr is not None:
-            try:
-                cv2.imwrite(output_path, self._last_probe_bgr)
-                return True
-            except Exception as exc:
-                log.error("Failed to save probe snapshot: %s", exc)
-                # Fall through to fallback methods
 
-        # 2. Appsink pipeline fallback: stores last texture directly
-        if self._use_appsink and self._last_texture:
+        With *callback* the PNG is encoded on a worker thread and
+        ``callback(ok)`` runs on the main loop once the file is written;
+        the return value then only tells whether a frame was available.
+        """
+        # 1. Probe's last frame (includes all effects + mirror)
+        frame = self._last_probe_bgr
+        # 2. Appsink pipeline fallback: read back the last texture
+        if frame is None and self._use_appsink and self._last_texture:
             try:
-                self._last_texture.save_to_png(output_path)
-                return True
+                frame = self._download_bgr(self._last_texture)
             except Exception as exc:
-                log.error("Failed to save appsink snapshot: %s", exc)
+                log.error("Failed to read appsink snapshot: %s", exc)
+
+        if frame is not None:
+            if callback is None:
+                return self._write_snapshot(frame, output_path)
+            # Frames are never modified once published, so the worker can
+            # encode this one while new frames keep arriving
+            threading.Thread(
+                target=self._snapshot_worker,
+                args=(frame, output_path, callback),
+                daemon=True,
+            ).start()
+            return True
 
         # 3. Last resort: try paintable directly
+        ok = False
         if self._gtksink:
             paintable = self._gtksink.get_property("paintable")
             if paintable and hasattr(paintable, "save_to_png"):
                 try:
-                    paintable.save_to_png(output_path)
-                    return True
+                    ok = paintable.save_to_png(output_path)
                 except Exception:
                     pass
+        if callback is not None:
+            GLib.idle_add(callback, ok)
+        return ok
+
+    @staticmethod
+    def _write_snapshot(frame: np.ndarray, output_path: str) -> bool:
+        try:
+            if cv2.imwrite(output_path, frame):
+                return True
+            log.error("Failed to save snapshot to %s", output_path)
+        except Exception as exc:
+            log.error("Failed to save snapshot: %s", exc)
         return False
 
+    @classmethod
+    def _snapshot_worker(
+        cls, frame: np.ndarray, output_path: str, callback: Callable[[bool], None],
+    ) -> None:
+        # cv2.imwrite releases the GIL for the PNG encode
+        ok = cls._write_snapshot(frame, output_path)
+        GLib.idle_add(callback, ok)
+
     def play(
         self,
         camera: CameraInfo,
@@ -691,6 +968,10 @@ class StreamEngine(GObject.Object):
     def _play_continue(self, camera: CameraInfo, fmt: VideoFormat | None, streaming_ready: bool) -> bool:
         """Continuation of play() — may be deferred via GLib.timeout_add.
         Always returns False so GLib.timeout_add won't repeat."""
+        if self._current_camera is not camera:
+            # Stopped or switched while the continuation was pending
+            return False
+        generation = self._play_generation
         self._use_appsink = camera.backend in _APPSINK_BACKENDS
         log.info(
             "play: camera=%s, backend=%s, use_appsink=%s, streaming_ready=%s",
@@ -709,24 +990,59 @@ class StreamEngine(GObject.Object):
                 and hasattr(backend, "needs_streaming_setup")
                 and backend.needs_streaming_setup()
             ):
-                # For gphoto2: allocate v4l2loopback device BEFORE streaming
-                # so ffmpeg can write directly to it (survives camera switches
-                # and app close with "Keep camera on")
                 if camera.backend == BackendType.GPHOTO2:
                     if not VirtualCamera.is_enabled():
                         VirtualCamera.set_enabled(True)
-                    vcam_dev = VirtualCamera.ensure_ready(
-                        card_label=camera.name,
-                        camera_id=camera.id,
-                    )
-                    if vcam_dev:
-                        camera.extra["vcam_device"] = vcam_dev
-                        log.info("Pre-allocated vcam %s for gphoto2 camera %s", vcam_dev, camera.name)
-
-                if not backend.start_streaming(camera):
-                    self.emit("error", _("Failed to start camera streaming process."))
+
+                def _setup_streaming() -> bool:
+                    try:
+                        # For gphoto2: allocate v4l2loopback device BEFORE streaming
+                        # so ffmpeg can write directly to it (survives camera switches
+                        # and app close with "Keep camera on")
+                        if camera.backend == BackendType.GPHOTO2:
+                            vcam_dev = VirtualCamera.ensure_ready(
+                                card_label=camera.name,
+                                camera_id=camera.id,
+                            )
+                            if vcam_dev:
+                                camera.extra["vcam_device"] = vcam_dev
+                                log.info("Pre-allocated vcam %s for gphoto2 camera %s", vcam_dev, camera.name)
+                        return backend.start_streaming(camera)
+                    except Exception:
+                        log.exception("Failed to start streaming for %s", camera.name)
+                        return False
+
+                def _on_streaming_ready(ok: bool) -> bool:
+                    # Guard: stopped or switched while the script ran
+                    if generation != self._play_generation or self._current_camera is not camera:
+                        current = self._current_camera
+                        if ok and (current is None or current.id != camera.id):
+                            # stop() ran before the session existed; a newer
+                            # play() of the same camera reuses it instead
+                            threading.Thread(
+                                target=backend.stop_streaming, args=(camera,), daemon=True,
+                            ).start()
+                        return False
+                    if not ok:
+                        self.emit("error", _("Failed to start camera streaming process."))
+                        return False
+                    self._resolve_and_build(camera, fmt)
                     return False
 
+                # The streaming script can take seconds (gphoto2 init, ffmpeg
+                # warm-up) — keep the GTK main loop responsive meanwhile.
+                threading.Thread(
+                    target=lambda: GLib.idle_add(_on_streaming_ready, _setup_streaming()),
+                    daemon=True,
+                ).start()
+                return False
+
+        self._resolve_and_build(camera, fmt)
+        return False
+
+    def _resolve_and_build(self, camera: CameraInfo, fmt: VideoFormat | None) -> None:
+        """Resolve the GStreamer source off the main loop, then build the pipeline."""
+        generation = self._play_generation
         # Resolve GStreamer source in background (pw-dump can take seconds)
         def _resolve_source() -> str:
             return self._manager.get_gst_source(
@@ -734,16 +1050,14 @@ class StreamEngine(GObject.Object):
             ) or ""
 
         def _on_source_resolved(gst_source: str) -> None:
-            # Guard: camera may have changed while resolving
-            if self._current_camera is not camera:
+            # Guard: stopped or switched while resolving
+            if generation != self._play_generation or self._current_camera is not camera:
                 return
             if not gst_source:
                 self.emit("error", _("Failed to obtain GStreamer source for this camera."))
                 return
 
-            target_fps = 0
-            if fmt and fmt.fps:
-                target_fps = int(max(fmt.fps))
+            target_fps = fmt.best_fps if fmt else 0
 
             if self._use_appsink:
                 self._build_appsink_pipeline(gst_source)
@@ -754,7 +1068,6 @@ class StreamEngine(GObject.Object):
             target=lambda: GLib.idle_add(_on_source_resolved, _resolve_source()),
             daemon=True,
         ).start()
-        return False
 
     def _build_paintable_pipeline(self, gst_source: str, target_fps: int = 0) -> bool:
         """Direct camera sources — use tee + gtk4paintablesink (recording-ready).
@@ -772,18 +1085,7 @@ class StreamEngine(GObject.Object):
         # than CPU-side GdkMemoryTexture copies (~25 MB/frame).
         is_phone = self._current_camera and self._current_camera.id.startswith("phone:")
 
-        n_threads = min(os.cpu_count() or 2, 4)
-        suffix = (
-            f"videoconvert n-threads={n_threads} name=conv ! "
-            f"video/x-raw,format=BGRA ! "
-            f"tee name=t ! "
-            f"queue max-size-buffers=4 leaky=downstream silent=true ! "
-            f"gtk4paintablesink sync=true max-lateness=-1 qos=false"
-        )
-
-        base_pipeline = f"{gst_source} ! {suffix}"
-
-        if self._try_start_paintable(base_pipeline):
+        if self._try_start_paintable(gst_source):
             # Apply anti-flicker defaults (e.g. power_line_frequency) in background
             self._apply_anti_flicker_async()
             # Disable USB autosuspend to prevent frame drops
@@ -807,8 +1109,7 @@ class StreamEngine(GObject.Object):
                 if camera.formats:
                     fmt_obj = backend._pick_best_format(camera)
                 v4l2_source = backend._v4l2_gst_source(camera.device_path, camera, fmt_obj)
-                fallback_pipeline = f"{v4l2_source} ! {suffix}"
-                if self._try_start_paintable(fallback_pipeline):
+                if self._try_start_paintable(v4l2_source):
                     self._apply_anti_flicker_async()
                     if camera.device_path:
                         self._disable_usb_autosuspend(camera.device_path)
@@ -823,35 +1124,27 @@ class StreamEngine(GObject.Object):
         self.emit("error", _("Failed to start camera stream."))
         return False
 
-    def _try_start_paintable(self, pipeline_str: str) -> bool:
-        """Try to parse and start a paintable pipeline. Returns True on success."""
-        log.info("Pipeline (paintable): %s", pipeline_str)
-        try:
-            pipeline = Gst.parse_launch(pipeline_str)
-        except GLib.Error as exc:
-            log.warning("Pipeline parse error: %s", exc)
+    def _paintable_tail(self) -> list[Gst.Element] | None:
+        """videoconvert ! BGRA ! tee name=t ! queue ! gtk4paintablesink."""
+        sink = self._paintable_sink
+        if sink is None or sink.get_parent() is not None:
+            sink = _make_element("gtk4paintablesink", "sink", **_PAINTABLE_SINK_PROPS)
+            self._paintable_sink = sink
+        tail = _make_tail(_PAINTABLE_TAIL)
+        if tail is None or sink is None:
+            return None
+        return [*tail, sink]
+
+    def _try_start_paintable(self, gst_source: str, source: Gst.Bin | None = None) -> bool:
+        """Try to build and start a paintable pipeline. Returns True on success."""
+        log.info("Pipeline (paintable): %s ! <convert ! tee ! gtk4paintablesink>", gst_source)
+        tail = self._paintable_tail()
+        if tail is None:
             return False
-
-        if not isinstance(pipeline, Gst.Pipeline):
-            pipe = Gst.Pipeline.new("bigcam")
-            pipe.add(pipeline)
-            pipeline = pipe
-
-        gtksink = None
-        it = pipeline.iterate_sinks()
-        while True:
-            ret, elem = it.next()
-            if ret == Gst.IteratorResult.OK:
-                factory = elem.get_factory()
-                if factory and factory.get_name() == "gtk4paintablesink":
-                    gtksink = elem
-                    break
-            else:
-                break
-
-        if gtksink is None:
-            pipeline.set_state(Gst.State.NULL)
+        pipeline = _assemble_pipeline(gst_source, tail, source)
+        if pipeline is None:
             return False
+        tee, gtksink = tail[2], tail[-1]
 
         bus = pipeline.get_bus()
         bus.add_signal_watch()
@@ -862,26 +1155,85 @@ class StreamEngine(GObject.Object):
             bus.disconnect(bus_watch_id)
             bus.remove_signal_watch()
             pipeline.set_state(Gst.State.NULL)
+            pipeline.remove(gtksink)
             return False
 
         self._pipeline = pipeline
         self._gtksink = gtksink
+        self._paintable_source = gst_source
         self._bus_watch_id = bus_watch_id
+        self._tee = tee
         # Install effects/FPS probe on the tee's sink pad so effects
         # are applied to BOTH preview and virtual camera output.
-        tee = pipeline.get_by_name("t")
-        probe_pad = tee.get_static_pad("sink") if tee else None
-        if not probe_pad:
-            # Fallback: probe on the gtk4paintablesink (effects won't reach v4l2)
-            probe_pad = gtksink.get_static_pad("sink")
-        if probe_pad:
-            self._probe_id = probe_pad.add_probe(Gst.PadProbeType.BUFFER, self._on_paintable_probe)
-            self._probe_pad = probe_pad
+        probe_pad = tee.get_static_pad("sink")
+        self._probe_id = probe_pad.add_probe(Gst.PadProbeType.BUFFER, self._on_paintable_probe)
+        self._probe_pad = probe_pad
         self._start_fps_counter()
         self.emit("state-changed", "playing")
 
         return True
 
+    def add_branch(self, branch: Gst.Bin) -> bool:
+        """Feed *branch* (a bin with a ghost sink pad) from the preview tee.
+
+        Only paintable pipelines have a tee after the effects probe, so the
+        branch sees the same processed frames as the preview.
+        """
+        if self._tee is None or self._pipeline is None:
+            return False
+        tee_pad = self._tee.request_pad_simple("src_%u")
+        if tee_pad is None:
+            return False
+        self._pipeline.add(branch)
+        if tee_pad.link(branch.get_static_pad("sink")) != Gst.PadLinkReturn.OK:
+            log.warning("Failed to link branch %s to the preview tee", branch.get_name())
+            self._pipeline.remove(branch)
+            self._tee.release_request_pad(tee_pad)
+            return False
+        branch.sync_state_with_parent()
+        self._branch_pads[branch] = tee_pad
+        return True
+
+    def remove_branch(self, branch: Gst.Bin) -> None:
+        """Detach a branch added with add_branch once no buffer is in flight."""
+        tee_pad = self._branch_pads.pop(branch, None)
+        if tee_pad is None:
+            return
+        pipeline, tee = self._pipeline, self._tee
+
+        def _on_idle(pad: Gst.Pad, _info: Gst.PadProbeInfo) -> Gst.PadProbeReturn:
+            pad.unlink(branch.get_static_pad("sink"))
+            GLib.idle_add(_finish)
+            return Gst.PadProbeReturn.REMOVE
+
+        def _finish() -> bool:
+            branch.set_state(Gst.State.NULL)
+            if branch.get_parent() is pipeline:
+                pipeline.remove(branch)
+            tee.release_request_pad(tee_pad)
+            return False
+
+        tee_pad.add_probe(Gst.PadProbeType.IDLE, _on_idle)
+
+    def _sync_recording_branch(self) -> bool:
+        """Attach or detach VideoRecorder's branch to match recording state."""
+        self._rec_branch_pending = False
+        rec = self._video_recorder
+        recording = bool(rec and rec.is_recording)
+        if recording and self._rec_branch is None:
+            if self._tee is None:
+                return False  # between pipelines; the next probe retries
+            branch = rec.make_branch(self._mirror)
+            if branch is not None and self.add_branch(branch):
+                self._rec_branch = branch
+            else:
+                # Keep recording through write_frame for this pipeline
+                self._rec_branch_unavailable = True
+        elif not recording and self._rec_branch is not None:
+            self.remove_branch(self._rec_branch)
+            self._rec_branch = None
+        return False
+
     def _build_direct_pipeline(self, gst_source: str, target_fps: int = 0) -> bool:
         """OpenCV V4L2 direct capture — flicker-free like guvcview.
 
@@ -1000,23 +1352,39 @@ class StreamEngine(GObject.Object):
 
         # Convert to BGRA for GdkTexture rendering
         # Mirror is handled by MirroredPicture in the GTK layer
-        bgra = cv2.cvtColor(bgr, cv2.COLOR_BGR2BGRA)
-        data = bgra.tobytes()
+        data = self._bgra_bytes(bgr, "opencv")
         stride = w * 4
         glib_bytes = GLib.Bytes.new(data)
         self._update_texture(w, h, stride, glib_bytes)
         return True  # continue timer
 
     def _build_appsink_pipeline(self, gst_source: str) -> bool:
-        """UDP/MPEG-TS sources (gphoto2, IP) — use appsink with manual texture rendering.
+        """UDP/MPEG-TS sources (gphoto2, IP) — render via gtk4paintablesink.
 
-        Starts with a delay to let ffmpeg produce frames, then retries if needed.
+        Starts once ffmpeg produces data and restarts a pipeline that fails
+        before its first frame, until _APPSINK_STARTUP_TIMEOUT runs out.
+        Only without gtk4paintablesink do frames go through appsink and a
+        GdkMemoryTexture per frame.
         """
-        log.debug(f"_build_appsink_pipeline: source={gst_source}")
-        self._appsink_source = gst_source
-        self._appsink_retry_count = 0
-        self._appsink_max_retries = 30  # 30 * 500ms = 15s max wait (like old app)
+        log.debug("_build_appsink_pipeline: source=%s", gst_source)
+        # The paintable sink does the GPU upload itself, and its probe
+        # already drives effects, recording and the virtual camera
+        self._use_appsink = Gst.ElementFactory.find("gtk4paintablesink") is None
+        # Two source variants, exactly as the old working app:
+        # explicit localhost bind, then all interfaces.  Sources without
+        # a udpsrc address (IP cameras) only have the one.
+        self._appsink_variants = tuple(dict.fromkeys((
+            gst_source,
+            gst_source.replace(" address=127.0.0.1 ", " ", 1),
+        )))
         self._appsink_timer_id: int | None = None
+        self._cancel_appsink_deadline()
+        self._appsink_deadline_id = GLib.timeout_add_seconds(
+            _APPSINK_STARTUP_TIMEOUT, self._appsink_startup_timeout
+        )
+        self._appsink_connected = False
+        self._appsink_dmabuf_ok = _HAS_DMABUF
+        self._appsink_sources.clear()
 
         # BigCam is the sole writer to v4l2loopback so that OpenCV effects
         # are always visible on the virtual camera output.  For gPhoto2,
@@ -1037,24 +1405,122 @@ class StreamEngine(GObject.Object):
             if loopback_device and loopback_device != cam_path:
                 self._start_vcam(loopback_device)
 
-        # Wait 2s for ffmpeg to start producing frames, then try
-        self._appsink_timer_id = GLib.timeout_add(2000, self._try_appsink_first)
+        # gPhoto2 streams arrive over UDP from ffmpeg: wait until the first
+        # datagrams are queued (at most the old fixed 2s) before trying.
+        udp_port = (
+            self._current_camera.extra.get("udp_port")
+            if self._current_camera and self._current_camera.backend == BackendType.GPHOTO2
+            else None
+        )
+        if udp_port is None:
+            self._appsink_timer_id = GLib.idle_add(self._try_appsink_first)
+        elif self._open_udp_probe(int(udp_port)):
+            self._udp_probe_deadline = time.monotonic() + 2.0
+            self._appsink_timer_id = GLib.timeout_add(50, self._poll_udp_probe)
+        else:
+            self._appsink_timer_id = GLib.timeout_add(2000, self._try_appsink_first)
         return True
 
+    def _open_udp_probe(self, port: int) -> bool:
+        """Bind a throwaway socket on the stream port to see when data arrives."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("127.0.0.1", port))
+        except OSError as exc:
+            log.debug("UDP readiness probe unavailable on port %d: %s", port, exc)
+            sock.close()
+            return False
+        self._udp_probe_sock = sock
+        return True
+
+    def _close_udp_probe(self) -> None:
+        if self._udp_probe_sock is not None:
+            self._udp_probe_sock.close()
+            self._udp_probe_sock = None
+
+    def _poll_udp_probe(self) -> bool:
+        """50 ms timer: start the pipeline once ffmpeg's datagrams are queued."""
+        if self._current_camera is None:
+            self._close_udp_probe()
+            self._appsink_timer_id = None
+            return False
+        buf = fcntl.ioctl(self._udp_probe_sock, termios.FIONREAD, b"\0\0\0\0")
+        pending = struct.unpack("i", buf)[0]
+        if not pending and time.monotonic() < self._udp_probe_deadline:
+            return True
+        log.debug("UDP readiness probe: %d bytes queued", pending)
+        # Free the port for udpsrc before the first attempt
+        self._close_udp_probe()
+        self._try_appsink_first()
+        return False
+
     def _try_appsink_first(self) -> bool:
-        """First attempt after initial 2s delay, then switch to 500ms retries."""
+        """First attempt once the source is ready; failures retry after a pause."""
         log.debug("_try_appsink_first called")
         self._appsink_timer_id = None
         if self._try_appsink_pipeline():
-            # Need to retry — schedule at 500ms intervals
-            log.debug("First attempt failed, scheduling 500ms retries")
-            self._appsink_timer_id = GLib.timeout_add(500, self._try_appsink_pipeline)
-        else:
-            log.debug("First attempt: done (success or gave up)")
+            log.debug("First attempt failed, retrying in %d ms", _APPSINK_RETRY_DELAY_MS)
+            self._appsink_timer_id = GLib.timeout_add(
+                _APPSINK_RETRY_DELAY_MS, self._try_appsink_pipeline
+            )
         return False  # don't repeat the 2s timer
 
+    def _on_first_frame_ready(self) -> bool:
+        """Main loop: the stream delivered its first frame, drop the deadline."""
+        if self._cancel_appsink_deadline():
+            log.debug("UDP/MPEG-TS stream: first frame received")
+        return False
+
+    def _cancel_appsink_deadline(self) -> bool:
+        if self._appsink_deadline_id is None:
+            return False
+        GLib.source_remove(self._appsink_deadline_id)
+        self._appsink_deadline_id = None
+        return True
+
+    def _appsink_startup_timeout(self) -> bool:
+        """No frame within _APPSINK_STARTUP_TIMEOUT: give up on the stream."""
+        self._appsink_deadline_id = None
+        if self._appsink_connected or self._current_camera is None:
+            return False
+        log.warning(
+            "No frames from %s after %ds", self._current_camera.name, _APPSINK_STARTUP_TIMEOUT
+        )
+        self.stop()
+        self.emit("error", _("Failed to start camera stream."))
+        return False
+
+    def _appsink_source(self, source_desc: str) -> Gst.Bin | None:
+        """Parsed source bin for *source_desc*, detached from any old pipeline.
+
+        Retries only replace the cheap fixed tail; udpsrc and the demuxer
+        chain are parsed once per variant and restarted from NULL.
+        """
+        source = self._appsink_sources.get(source_desc)
+        if source is None:
+            source = _parse_source(source_desc)
+            if source is None:
+                return None
+            self._appsink_sources[source_desc] = source
+        else:
+            # The pipeline it was part of has been set to NULL already
+            parent = source.get_parent()
+            if parent is not None:
+                parent.remove(source)
+        return source
+
+    @staticmethod
+    def _appsink_tail(dmabuf: bool = False) -> list[Gst.Element] | None:
+        """BGRA ! tee name=t ! queue ! appsink name=sink, or the DMA-BUF tail."""
+        return _make_tail(_DMABUF_APPSINK_TAIL if dmabuf else _APPSINK_TAIL)
+
     def _try_appsink_pipeline(self) -> bool:
-        """Attempt to start the appsink pipeline, retry on failure.
+        """Attempt to start the UDP/MPEG-TS pipeline.
+
+        Returns True to be called again after _APPSINK_RETRY_DELAY_MS when
+        no variant could be started and the startup deadline is still
+        pending.
 
         Uses dual pipeline strategy from the old working app:
         Pipeline 1: with address=127.0.0.1 (explicit localhost)
@@ -1065,91 +1531,74 @@ class StreamEngine(GObject.Object):
             self._appsink_timer_id = None
             return False
 
-        self._appsink_retry_count += 1
-        gst_source = self._appsink_source
-        log.debug(
-            f"_try_appsink_pipeline: attempt {self._appsink_retry_count}/{self._appsink_max_retries}"
-        )
-
-        # Two pipeline variants, exactly as the old working app
-        pipeline_attempts = [
-            # Pipeline 1: explicit localhost bind
-            (
-                f"{gst_source} ! "
-                f"video/x-raw,format=BGRA ! "
-                f"tee name=t ! "
-                f"queue max-size-buffers=2 leaky=downstream silent=true ! "
-                f"appsink name=sink emit-signals=True drop=True max-buffers=2 sync=False"
-            ),
-            # Pipeline 2: fallback without address (bind all interfaces)
-            (
-                f"{gst_source.replace('address=127.0.0.1 ', '')} ! "
-                f"video/x-raw,format=BGRA ! "
-                f"tee name=t ! "
-                f"queue max-size-buffers=2 leaky=downstream silent=true ! "
-                f"appsink name=sink emit-signals=True drop=True max-buffers=2 sync=False"
-            ),
-        ]
-
-        for i, pipeline_str in enumerate(pipeline_attempts):
-            log.debug(f"Trying pipeline {i + 1}: {pipeline_str[:80]}...")
-            try:
-                pipeline = Gst.parse_launch(pipeline_str)
-            except GLib.Error as e:
-                log.debug(f"Pipeline {i + 1} parse error: {e}")
+        log.debug("_try_appsink_pipeline: starting")
+
+        # Effects, recording and the virtual camera feed read BGRA pixels on
+        # the CPU.  Without any of them, try to take the decoder's DMA-BUFs
+        # straight to GTK first; software decoders fail to negotiate that,
+        # and the stream falls back to BGRA for good.
+        dmabuf = self._use_appsink and self._appsink_dmabuf_ok and not self._needs_cpu_frames()
+        if dmabuf:
+            self._dmabuf_display = Gdk.Display.get_default()
+        for i, source_desc in enumerate(self._appsink_variants):
+            if not self._use_appsink:
+                self._appsink_connected = False
+                source = self._appsink_source(source_desc)
+                if source is not None and self._try_start_paintable(source_desc, source):
+                    self._appsink_timer_id = None
+                    return False  # stop retrying
                 continue
-
-            if not isinstance(pipeline, Gst.Pipeline):
-                pipe = Gst.Pipeline.new("bigcam")
-                pipe.add(pipeline)
-                pipeline = pipe
-
-            appsink = pipeline.get_by_name("sink")
-            if appsink is None:
-                log.debug(f"Pipeline {i + 1}: no appsink found")
-                pipeline.set_state(Gst.State.NULL)
+            if dmabuf:
+                source_desc = _without_convert(source_desc)
+            log.debug("Trying pipeline %d: %.80s...", i + 1, source_desc)
+            tail = self._appsink_tail(dmabuf)
+            source = self._appsink_source(source_desc) if tail is not None else None
+            pipeline = (
+                _assemble_pipeline(source_desc, tail, source) if source is not None else None
+            )
+            if pipeline is None and dmabuf:
+                # Can't even be linked: this stream goes straight to BGRA
+                log.info("DMA-BUF preview pipeline could not be built, using BGRA")
+                self._appsink_dmabuf_ok = False
+                return self._try_appsink_pipeline()
+            if tail is None:
+                break
+            if pipeline is None:
                 continue
-            appsink.connect("new-sample", self._on_appsink_sample)
 
-            bus = pipeline.get_bus()
-            bus.add_signal_watch()
+            appsink = tail[-1]
+            appsink.connect("new-sample", self._on_appsink_sample)
+            if not dmabuf:
+                appsink.get_static_pad("sink").add_probe(
+                    Gst.PadProbeType.QUERY_DOWNSTREAM, self._on_appsink_allocation_query
+                )
+            self._start_appsink_consumer()
 
+            # Don't wait on the state change here: ASYNC is the normal answer
+            # while udpsrc waits for data. The first sample cancels the
+            # startup deadline; an ERROR before it schedules a retry.
             ret = pipeline.set_state(Gst.State.PLAYING)
             if ret == Gst.StateChangeReturn.FAILURE:
-                log.debug(f"Pipeline {i + 1}: PLAYING failed immediately")
-                pipeline.set_state(Gst.State.NULL)
-                continue
-
-            # Non-blocking state check — accept ASYNC as success
-            ret, state, _ = pipeline.get_state(50 * Gst.MSECOND)
-            log.debug(f"Pipeline {i + 1}: ret={ret}, state={state}")
-            if ret == Gst.StateChangeReturn.FAILURE:
+                log.debug("Pipeline %d: PLAYING failed immediately", i + 1)
                 pipeline.set_state(Gst.State.NULL)
                 continue
 
-            if state == Gst.State.PLAYING or ret in (
-                Gst.StateChangeReturn.SUCCESS,
-                Gst.StateChangeReturn.ASYNC,
-            ):
-                # Pipeline connected!
-                log.debug(f"Pipeline {i + 1}: SUCCESS! Connected.")
-                self._pipeline = pipeline
-                self._bus_watch_id = bus.connect("message", self._on_bus_message)
-                # Install FPS probe on appsink
-                sink_pad = appsink.get_static_pad("sink")
-                if sink_pad:
-                    self._probe_id = sink_pad.add_probe(Gst.PadProbeType.BUFFER, self._on_frame_probe)
-                    self._probe_pad = sink_pad
-                self._start_fps_counter()
-                self.emit("state-changed", "playing")
-                self._appsink_timer_id = None
-                return False  # stop retrying
-
-            pipeline.set_state(Gst.State.NULL)
+            log.debug("Pipeline %d: started (%s)", i + 1, ret.value_nick)
+            self._pipeline = pipeline
+            self._appsink_connected = False
+            self._appsink_dmabuf = dmabuf
+            bus = pipeline.get_bus()
+            bus.add_signal_watch()
+            self._bus_watch_id = bus.connect("message", self._on_bus_message)
+            # Frames are counted in _on_appsink_sample
+            self._start_fps_counter()
+            self.emit("state-changed", "playing")
+            self._appsink_timer_id = None
+            return False  # stop retrying
 
         # All pipelines failed this round
-        if self._appsink_retry_count < self._appsink_max_retries:
-            return True  # retry in 500ms
+        if self._appsink_deadline_id is not None:
+            return True  # retry after _APPSINK_RETRY_DELAY_MS
         self.emit("error", _("Failed to start camera stream."))
         self._appsink_timer_id = None
         return False
@@ -1170,6 +1619,7 @@ class StreamEngine(GObject.Object):
 
     def stop(self, stop_backend: bool = True, keep_vcam: bool = False) -> None:
         camera = self._current_camera
+        self._play_generation += 1
         self._stop_fps_counter()
         self._restore_usb_autosuspend()
 
@@ -1192,6 +1642,9 @@ class StreamEngine(GObject.Object):
         if hasattr(self, "_appsink_timer_id") and self._appsink_timer_id is not None:
             GLib.source_remove(self._appsink_timer_id)
             self._appsink_timer_id = None
+        self._close_udp_probe()
+        self._cancel_appsink_deadline()
+        self._appsink_sources.clear()
 
         # Phone camera: keep forwarding frames to vcam when keep_vcam is active,
         # otherwise disconnect completely.
@@ -1215,10 +1668,13 @@ class StreamEngine(GObject.Object):
         # Release retained frame data to free memory
         self._last_probe_bgr = None
         self._last_texture = None
+        with self._pending_texture_lock:
+            self._pending_texture = None
         self._vcam_latest_frame = None
         self._vcam_pending_frame = None
-        self._vcam_bgra_buf = None
+        self._bgra_pool.clear()
         self._probe_cached_fmt = ""
+        self._appsink_caps_key = 0
         # Remove buffer probe before pipeline teardown
         if self._probe_pad is not None and self._probe_id:
             self._probe_pad.remove_probe(self._probe_id)
@@ -1238,11 +1694,27 @@ class StreamEngine(GObject.Object):
                 bus.disconnect(self._bus_watch_id)
                 bus.remove_signal_watch()
                 self._bus_watch_id = None
+            if self._gtksink is not None and self._gtksink.get_parent() is self._pipeline:
+                self._pipeline.remove(self._gtksink)
             self._pipeline = None
             self._gtksink = None
+            self._paintable_source = ""
+            # Branches go down with the pipeline; the recorder carries on
+            # and gets a new branch from the next one
+            self._tee = None
+            self._branch_pads.clear()
+            self._rec_branch = None
+            self._rec_branch_unavailable = False
             self._current_camera = None
             self._current_fmt = None
             self.emit("state-changed", "stopped")
+        # Also while play() is still setting up, with no pipeline yet
+        self._current_camera = None
+        self._current_fmt = None
+        # After the pipeline is down, so no sample is parked behind our back
+        self._stop_appsink_consumer()
+        self._appsink_dmabuf = False
+        self._dmabuf_builder = None
 
         # Virtual camera: keep alive via background pipeline or stop completely.
         # Done AFTER main pipeline is stopped so UDP port / device is free.
@@ -1278,43 +1750,262 @@ class StreamEngine(GObject.Object):
 
     # -- appsink rendering ---------------------------------------------------
 
-    _appsink_sample_count = 0
-
     def _on_appsink_sample(self, appsink: Any) -> Gst.FlowReturn:
+        """Streaming thread: park the sample for the consumer and return.
+
+        Only the newest sample is kept; one the consumer has not picked up
+        yet is dropped, like appsink's own drop=True.
+        """
         sample = appsink.emit("pull-sample")
         if sample is None:
             return Gst.FlowReturn.OK
+        # Doubles as the FPS counter; no separate buffer probe on the sink
+        self._frame_count += 1
+        if not self._appsink_connected:
+            self._appsink_connected = True
+            GLib.idle_add(self._on_first_frame_ready)
+        with self._appsink_slot_lock:
+            self._appsink_slot = sample
+        self._appsink_slot_event.set()
+        return Gst.FlowReturn.OK
+
+    @staticmethod
+    def _on_appsink_allocation_query(
+        pad: Gst.Pad, info: Gst.PadProbeInfo
+    ) -> Gst.PadProbeReturn:
+        """Answer videoconvert's ALLOCATION query with a fixed-size pool.
+
+        appsink proposes no pool, so videoconvert would size its own; with
+        min == max its frames are recycled from a bounded ring instead and
+        a fast source waits for a free frame rather than allocating.
+        """
+        query = info.get_query()
+        if query.type != Gst.QueryType.ALLOCATION:
+            return Gst.PadProbeReturn.OK
+        caps, _need_pool = query.parse_allocation()
+        if caps is None:
+            return Gst.PadProbeReturn.OK
+        vinfo = GstVideo.VideoInfo.new_from_caps(caps)
+        if vinfo is None:
+            return Gst.PadProbeReturn.OK
+        pool = GstVideo.VideoBufferPool.new()
+        config = pool.get_config()
+        Gst.BufferPool.config_set_params(
+            config, caps, vinfo.size, _APPSINK_POOL_BUFFERS, _APPSINK_POOL_BUFFERS
+        )
+        if not pool.set_config(config):
+            return Gst.PadProbeReturn.OK
+        # Activated by videoconvert once it accepts the proposal
+        query.add_allocation_pool(pool, vinfo.size, _APPSINK_POOL_BUFFERS, _APPSINK_POOL_BUFFERS)
+        return Gst.PadProbeReturn.HANDLED
+
+    def _start_appsink_consumer(self) -> None:
+        if self._appsink_thread is not None:
+            return
+        self._appsink_stop_event = threading.Event()
+        self._appsink_thread = threading.Thread(
+            target=self._appsink_consumer_loop,
+            args=(self._appsink_stop_event,),
+            daemon=True,
+            name="bigcam-appsink",
+        )
+        self._appsink_thread.start()
+
+    def _stop_appsink_consumer(self) -> None:
+        if self._appsink_thread is None:
+            return
+        self._appsink_stop_event.set()
+        self._appsink_slot_event.set()
+        self._appsink_thread.join(timeout=2.0)
+        self._appsink_thread = None
+        with self._appsink_slot_lock:
+            self._appsink_slot = None
+        self._appsink_slot_event.clear()
+
+    def _appsink_consumer_loop(self, stop_event: threading.Event) -> None:
+        """Consumer thread: map, process and hand appsink frames to the UI."""
+        while True:
+            self._appsink_slot_event.wait()
+            if stop_event.is_set():
+                return
+            # Clear before taking so a sample parked meanwhile wakes us again
+            self._appsink_slot_event.clear()
+            with self._appsink_slot_lock:
+                sample = self._appsink_slot
+                self._appsink_slot = None
+            if sample is not None:
+                try:
+                    self._process_appsink_sample(sample)
+                except Exception:
+                    log.debug("appsink frame processing failed", exc_info=True)
+
+    def _process_appsink_sample(self, sample: Gst.Sample) -> None:
         buf = sample.get_buffer()
         caps = sample.get_caps()
         if not buf or not caps:
-            return Gst.FlowReturn.OK
-        s = caps.get_structure(0)
-        w = s.get_value("width")
-        h = s.get_value("height")
+            return
+        # Boxed wrappers hash by pointer: caps only change on renegotiation
+        caps_key = hash(caps)
+        if caps_key != self._appsink_caps_key:
+            s = caps.get_structure(0)
+            self._appsink_size = (s.get_value("width"), s.get_value("height"))
+            self._dmabuf_caps = caps.get_features(0).contains("memory:DMABuf")
+            if self._dmabuf_caps:
+                self._dmabuf_format = GstVideo.dma_drm_fourcc_from_string(
+                    s.get_string("drm-format")
+                )
+            self._appsink_caps_key = caps_key
+        w, h = self._appsink_size
+        if self._dmabuf_caps:
+            self._process_dmabuf_sample(sample, buf, w, h)
+            return
         result, map_info = buf.map(Gst.MapFlags.READ)
-        if result:
-            self._appsink_sample_count += 1
-            if self._appsink_sample_count <= 3 or self._appsink_sample_count % 30 == 0:
-                log.debug(f"appsink sample #{self._appsink_sample_count}: {w}x{h}")
-            data = bytes(map_info.data)
+        if not result:
+            return
+        if log.isEnabledFor(logging.DEBUG):
+            n = self._appsink_sample_count + 1
+            self._appsink_sample_count = n
+            if n <= 3 or n % 30 == 0:
+                log.debug("appsink sample #%d: %dx%d", n, w, h)
+        has_work = self._has_processing_work()
+        is_recording = bool(
+            self._video_recorder and self._video_recorder.is_recording
+        )
+        try:
+            if has_work:
+                # Single copy for processing, read straight from the mapped
+                # buffer; the preview comes from the processed frame
+                data = None
+                bgra = np.frombuffer(map_info.data, dtype=np.uint8).reshape((h, w, 4))
+                bgr = bgra[:, :, :3].copy()
+            else:
+                # One memcpy out of the mapped buffer serves the preview, the
+                # virtual camera and the BGR copy for tools below
+                data = bytes(map_info.data)
+                bgr = None
+        except Exception:
+            data = bgr = None
+        finally:
+            # Release the buffer to the decoder pool before any Python-side
+            # processing; everything below works on our own copies
             buf.unmap(map_info)
-            # Store BGR frame for tools (QR, smile detection)
+        if data is not None and (
+            is_recording or self._vcam_device or self._frame_count % 10 == 0
+        ):
+            # Fast path: tools and photos only need every 10th frame
             try:
                 bgra = np.frombuffer(data, dtype=np.uint8).reshape((h, w, 4))
-                bgr = bgra[:, :, :3].copy()
+                self._distribute_processed_frame(
+                    bgra[:, :, :3].copy(), w, h, bgra_direct=data
+                )
+            except Exception:
+                pass
+        elif bgr is not None:
+            try:
                 bgr = self._apply_frame_processing(bgr)
                 self._distribute_processed_frame(bgr, w, h)
             except Exception:
                 pass
+        if data is None:
             # Reconstruct BGRA from processed BGR for preview
-            if self._has_processing_work() and self._last_probe_bgr is not None:
-                display_bgr = cv2.flip(self._last_probe_bgr, 1) if self._mirror else self._last_probe_bgr
-                bgra_out = cv2.cvtColor(display_bgr, cv2.COLOR_BGR2BGRA)
-                data = bgra_out.tobytes()
-            stride = len(data) // h
-            glib_bytes = GLib.Bytes.new(data)
-            GLib.idle_add(self._update_texture, w, h, stride, glib_bytes)
-        return Gst.FlowReturn.OK
+            if self._last_probe_bgr is None:
+                return
+            display_bgr = cv2.flip(self._last_probe_bgr, 1) if self._mirror else self._last_probe_bgr
+            data = self._bgra_bytes(display_bgr, "appsink")
+        stride = len(data) // h
+        # GLib.Bytes.new borrows a bytes object's storage for its single copy
+        glib_bytes = GLib.Bytes.new(data)
+        # Build the texture here too, leaving only the emit to the UI thread
+        self._schedule_texture(self._build_texture(w, h, stride, glib_bytes))
+
+    def _process_dmabuf_sample(self, sample: Gst.Sample, buf: Gst.Buffer, w: int, h: int) -> None:
+        """Show a hardware-decoded frame without copying it to system memory."""
+        if self._needs_cpu_frames():
+            # Effects, recording or the virtual camera were switched on
+            self._request_cpu_preview()
+            return
+        # The texture doesn't own the buffer: hold the sample until GTK
+        # releases the texture
+        key = next(self._dmabuf_frame_ids)
+        self._dmabuf_frames[key] = sample
+
+        def _release(*_args: Any) -> None:
+            self._dmabuf_frames.pop(key, None)
+
+        try:
+            texture = self._build_dmabuf_texture(buf, w, h, _release)
+        except Exception:
+            self._dmabuf_frames.pop(key, None)
+            log.info("DMA-BUF preview import failed, using BGRA", exc_info=True)
+            self._request_cpu_preview()
+            return
+        self._schedule_texture(texture)
+
+    def _build_dmabuf_texture(
+        self, buf: Gst.Buffer, w: int, h: int, release: Callable[..., None],
+    ) -> Gdk.Texture:
+        meta = GstVideo.buffer_get_video_meta(buf)
+        if meta is None:
+            raise ValueError("DMA-BUF frame without video meta")
+        builder = self._dmabuf_builder
+        if builder is None:
+            builder = Gdk.DmabufTextureBuilder.new()
+            builder.set_display(self._dmabuf_display)
+            self._dmabuf_builder = builder
+        fourcc, modifier = self._dmabuf_format
+        builder.set_width(w)
+        builder.set_height(h)
+        builder.set_fourcc(fourcc)
+        builder.set_modifier(modifier)
+        builder.set_n_planes(meta.n_planes)
+        for plane in range(meta.n_planes):
+            found, idx, _length, skip = buf.find_memory(meta.offset[plane], 1)
+            mem = buf.peek_memory(idx) if found else None
+            if mem is None or not GstAllocators.is_dmabuf_memory(mem):
+                raise ValueError("frame plane %d is not in a DMA-BUF" % plane)
+            builder.set_fd(plane, GstAllocators.dmabuf_memory_get_fd(mem))
+            builder.set_offset(plane, mem.offset + skip)
+            builder.set_stride(plane, meta.stride[plane])
+        return builder.build(release, None)
+
+    def _request_cpu_preview(self) -> None:
+        """Consumer thread: ask the main loop to restart the stream in BGRA."""
+        if not self._dmabuf_leaving:
+            self._dmabuf_leaving = True
+            GLib.idle_add(self._leave_dmabuf_preview)
+
+    def _leave_dmabuf_preview(self) -> bool:
+        self._dmabuf_leaving = False
+        if not self._appsink_dmabuf or self._pipeline is None:
+            return False
+        log.info("Switching appsink preview from DMA-BUF to BGRA")
+        self._appsink_dmabuf_ok = False
+        self._drop_appsink_pipeline()
+        self._try_appsink_first()
+        return False
+
+    def _schedule_texture(self, texture: Gdk.Texture) -> None:
+        """Hand the newest texture to the main loop, dropping any unshown one.
+
+        Called from the appsink consumer thread. Only the empty -> full
+        transition of the slot queues an idle callback, so a slow main loop
+        never accumulates a backlog of frames.
+        """
+        with self._pending_texture_lock:
+            was_empty = self._pending_texture is None
+            self._pending_texture = texture
+        if was_empty:
+            GLib.idle_add(self._flush_pending_texture, priority=GLib.PRIORITY_HIGH_IDLE)
+
+    def _flush_pending_texture(self) -> bool:
+        """GLib idle callback: show the latest appsink frame."""
+        with self._pending_texture_lock:
+            texture = self._pending_texture
+            self._pending_texture = None
+        # Discard stale appsink frames if pipeline mode changed to paintable
+        if texture is not None and self._use_appsink:
+            self._show_texture(texture)
+        return False
 
     def _update_texture(
         self, w: int, h: int, stride: int, glib_bytes: GLib.Bytes
@@ -1323,15 +2014,57 @@ class StreamEngine(GObject.Object):
         if not self._use_appsink:
             return False
         try:
-            texture = Gdk.MemoryTexture.new(
-                w, h, Gdk.MemoryFormat.B8G8R8A8_PREMULTIPLIED, glib_bytes, stride
-            )
-            self._last_texture = texture
-            self.emit("new-texture", texture)
+            self._show_texture(self._build_texture(w, h, stride, glib_bytes))
         except Exception:
             pass
         return False
 
+    def _show_texture(self, texture: Gdk.Texture) -> None:
+        self._last_texture = texture
+        self.emit("new-texture", texture)
+
+    def _build_texture(
+        self, w: int, h: int, stride: int, glib_bytes: GLib.Bytes
+    ) -> Gdk.Texture:
+        """Wrap a BGRA frame as a texture.
+
+        Where supported, the frame is marked as a full update of the previous
+        texture of the same size, so the renderer can refill the GPU texture
+        it already holds instead of allocating a new one per frame.
+        """
+        if not _HAS_TEXTURE_UPDATES:
+            return Gdk.MemoryTexture.new(w, h, _PREVIEW_MEMORY_FORMAT, glib_bytes, stride)
+        with self._texture_builder_lock:
+            return self._build_updated_texture(w, h, stride, glib_bytes)
+
+    def _build_updated_texture(
+        self, w: int, h: int, stride: int, glib_bytes: GLib.Bytes
+    ) -> Gdk.Texture:
+        builder = self._texture_builder
+        if builder is None:
+            builder = Gdk.MemoryTextureBuilder.new()
+            builder.set_format(_PREVIEW_MEMORY_FORMAT)
+            self._texture_builder = builder
+        builder.set_width(w)
+        builder.set_height(h)
+        builder.set_stride(stride)
+        builder.set_bytes(glib_bytes)
+        prev = self._last_texture
+        if prev is not None and prev.get_width() == w and prev.get_height() == h:
+            if self._texture_region_size != (w, h):
+                self._texture_region = cairo.Region(cairo.RectangleInt(0, 0, w, h))
+                self._texture_region_size = (w, h)
+            builder.set_update_texture(prev)
+            builder.set_update_region(self._texture_region)
+        else:
+            builder.set_update_texture(None)
+            builder.set_update_region(None)
+        texture = builder.build()
+        # Don't keep the frame alive through the builder
+        builder.set_bytes(None)
+        builder.set_update_texture(None)
+        return texture
+
     # -- async helpers for non-blocking pipeline setup -----------------------
 
     def _apply_anti_flicker_async(self) -> None:
@@ -1425,8 +2158,12 @@ class StreamEngine(GObject.Object):
             daemon=True,
         ).start()
 
-    def _check_device_busy_async(self, device_path: str) -> None:
-        """Check if a device is busy in a background thread."""
+    def _check_device_busy_async(self, device_path: str, error_text: str = "") -> None:
+        """Check if a device is busy in a background thread.
+
+        Emits device-busy with the holding processes, or error with
+        *error_text* (a generic message by default) when there are none.
+        """
         def _worker() -> list[str]:
             return _find_device_users(device_path)
 
@@ -1434,7 +2171,7 @@ class StreamEngine(GObject.Object):
             if users:
                 self.emit("device-busy", device_path, users)
             else:
-                self.emit("error", _("Failed to start camera stream."))
+                self.emit("error", error_text or _("Failed to start camera stream."))
 
         threading.Thread(
             target=lambda: GLib.idle_add(_on_done, _worker()),
@@ -2048,23 +2785,23 @@ class StreamEngine(GObject.Object):
             self._push_phone_v4l2(bgr, w, h)
 
         # BGR → BGRA using OpenCV SIMD (much faster than numpy manual copy)
-        bgra = cv2.cvtColor(bgr, cv2.COLOR_BGR2BGRA)
-        data = bgra.tobytes()
+        data = self._bgra_bytes(bgr, "phone")
 
         stride = w * 4
         glib_bytes = GLib.Bytes.new(data)
-        GLib.idle_add(self._update_phone_texture, w, h, stride, glib_bytes)
+        # Same priority as the appsink slot: ahead of GDK's redraw
+        # (HIGH_IDLE + 20), so the frame lands in the paint it was meant for
+        GLib.idle_add(
+            self._update_phone_texture, w, h, stride, glib_bytes,
+            priority=GLib.PRIORITY_HIGH_IDLE,
+        )
 
     def _update_phone_texture(
         self, w: int, h: int, stride: int, glib_bytes: GLib.Bytes
     ) -> bool:
         self._phone_frame_pending = False
         try:
-            texture = Gdk.MemoryTexture.new(
-                w, h, Gdk.MemoryFormat.B8G8R8A8_PREMULTIPLIED, glib_bytes, stride
-            )
-            self._last_texture = texture
-            self.emit("new-texture", texture)
+            self._show_texture(self._build_texture(w, h, stride, glib_bytes))
         except Exception:
             pass
         return False
@@ -2095,6 +2832,9 @@ class StreamEngine(GObject.Object):
         elif msg.type == Gst.MessageType.ERROR:
             err, dbg = msg.parse_error()
             error_text = err.message if err else _("Unknown GStreamer error")
+            if self._retry_appsink_startup():
+                log.debug("appsink startup error, retrying: %s", error_text)
+                return
             log.error("GStreamer error: %s (debug: %s)", error_text, dbg)
 
             # Save device_path before stop() clears _current_camera
@@ -2127,26 +2867,19 @@ class StreamEngine(GObject.Object):
                     GLib.timeout_add(500, self._play_continue, cam, fmt, False)
                     return
                 self._play_busy_retries = 0
-                users = _find_device_users(dev_path)
-                if users:
-                    self.stop()
-                    self.emit("device-busy", dev_path, users)
-                    return
 
-            # PipeWire async failure (e.g. unhandled format): retry with v4l2src
-            if self._try_pw_fallback():
+            # PipeWire async failure (e.g. unhandled format): retry with
+            # v4l2src.  Pointless for a busy device, v4l2src would be too.
+            if not busy and self._try_pw_fallback():
                 return
 
+            self.stop()
             # Even without explicit busy keywords, check if the device is
-            # actually held by another process before reporting a generic error.
+            # actually held by another process before reporting a generic
+            # error.  The /proc scan runs off the main loop.
             if dev_path:
-                users = _find_device_users(dev_path)
-                if users:
-                    self.stop()
-                    self.emit("device-busy", dev_path, users)
-                    return
-
-            self.stop()
+                self._check_device_busy_async(dev_path, error_text)
+                return
             self.emit("error", error_text)
         elif msg.type == Gst.MessageType.WARNING:
             err, dbg = msg.parse_warning()
@@ -2155,6 +2888,53 @@ class StreamEngine(GObject.Object):
             if "descartada" not in wmsg and "dropping" not in wmsg.lower():
                 log.warning("GStreamer warning: %s", wmsg)
 
+    def _retry_appsink_startup(self) -> bool:
+        """Drop a UDP/MPEG-TS pipeline that failed before its first sample.
+
+        Schedules the next attempt after _APPSINK_RETRY_DELAY_MS. Returns
+        False when the error should be handled normally (stream already
+        running, not a gPhoto2/IP pipeline, or startup deadline passed).
+        """
+        camera = self._current_camera
+        if (
+            camera is None
+            or camera.backend not in _APPSINK_BACKENDS
+            or self._appsink_connected
+            or self._pipeline is None
+            or self._appsink_deadline_id is None
+        ):
+            return False
+        if self._appsink_dmabuf:
+            # Typically a software decoder that can't produce DMA-BUFs
+            self._appsink_dmabuf_ok = False
+        self._drop_appsink_pipeline()
+        self._appsink_timer_id = GLib.timeout_add(
+            _APPSINK_RETRY_DELAY_MS, self._try_appsink_pipeline
+        )
+        return True
+
+    def _drop_appsink_pipeline(self) -> None:
+        """Tear down the UDP/MPEG-TS pipeline, keeping the consumer and vcam."""
+        pipeline = self._pipeline
+        self._pipeline = None
+        self._appsink_dmabuf = False
+        if self._probe_pad is not None and self._probe_id:
+            self._probe_pad.remove_probe(self._probe_id)
+        self._probe_pad = None
+        self._probe_id = 0
+        bus = pipeline.get_bus()
+        if self._bus_watch_id is not None:
+            bus.disconnect(self._bus_watch_id)
+            self._bus_watch_id = None
+        bus.remove_signal_watch()
+        pipeline.set_state(Gst.State.NULL)
+        # Keep the paintable sink reusable for the next attempt
+        if self._gtksink is not None and self._gtksink.get_parent() is pipeline:
+            pipeline.remove(self._gtksink)
+        self._gtksink = None
+        self._paintable_source = ""
+        self._tee = None
+
     def _try_pw_fallback(self) -> bool:
         """If the current pipeline uses pipewiresrc, retry with v4l2src.
 
@@ -2166,19 +2946,7 @@ class StreamEngine(GObject.Object):
         # Only fallback if the failing pipeline uses pipewiresrc
         if not self._pipeline:
             return False
-        pipe_str = self._pipeline.get_name()
-        has_pw = False
-        it = self._pipeline.iterate_sources()
-        while True:
-            ret, elem = it.next()
-            if ret == Gst.IteratorResult.OK:
-                factory = elem.get_factory()
-                if factory and factory.get_name() == "pipewiresrc":
-                    has_pw = True
-                    break
-            else:
-                break
-        if not has_pw:
+        if "pipewiresrc" not in self._paintable_source:
             return False
 
         log.warning(
@@ -2199,16 +2967,7 @@ class StreamEngine(GObject.Object):
         v4l2_source = backend._v4l2_gst_source(
             camera.device_path, camera, fmt_obj
         )
-        n_threads = min(os.cpu_count() or 2, 4)
-        suffix = (
-            f"videoconvert n-threads={n_threads} name=conv ! "
-            f"video/x-raw,format=BGRA ! "
-            f"tee name=t ! "
-            f"queue max-size-buffers=4 leaky=downstream silent=true ! "
-            f"gtk4paintablesink sync=true max-lateness=-1 qos=false"
-        )
-        fallback_pipeline = f"{v4l2_source} ! {suffix}"
-        if self._try_start_paintable(fallback_pipeline):
+        if self._try_start_paintable(v4l2_source):
             self._current_camera = camera
             if camera.device_path:
                 self._disable_usb_autosuspend(camera.device_path)
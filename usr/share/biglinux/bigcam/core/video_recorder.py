@@ -26,6 +26,12 @@ from core.camera_manager import CameraManager
 from utils import xdg
 
 log = logging.getLogger(__name__)
+
+# Hardware encoders take NV12; pinning it keeps videoconvert on its direct
+# BGR -> NV12 path instead of whatever format negotiation lands on
+_HW_ENCODER_CAPS = "video/x-raw,format=NV12"
+
+
 class VideoRecorder:
     """Records video+audio using a unified GStreamer pipeline fed by appsrc.
 
@@ -46,6 +52,11 @@ class VideoRecorder:
         self._h = 0
         self._start_time = 0
         self._finalize_thread: threading.Thread | None = None
+        # Frames arrive from the preview probe (write_frame) and from the
+        # preview tee branch (make_branch) on different streaming threads
+        self._pipeline_lock = threading.Lock()
+        self._branch_flip: Gst.Element | None = None
+        self._branch_caps: Gst.Element | None = None
         # Configurable codec/container/bitrate
         self._video_codec = "h264"
         self._audio_codec = "opus"
@@ -141,11 +152,13 @@ class VideoRecorder:
             hw = [
                 ("vaapih265enc", f"rate-control=2 bitrate={br}"),
                 ("vah265enc", f"rate-control=2 bitrate={br}"),
+                ("nvh265enc", f"bitrate={br}"),
+                ("qsvh265enc", f"bitrate={br}"),
             ]
             for name, props in hw:
                 if Gst.ElementFactory.find(name):
                     log.info("Using hardware H.265 encoder: %s", name)
-                    return f"{name} {props} ! h265parse"
+                    return f"{_HW_ENCODER_CAPS} ! {name} {props} ! h265parse"
             log.info("Using software H.265 encoder: x265enc")
             return f"x265enc bitrate={br} speed-preset=3 ! h265parse"
 
@@ -158,14 +171,18 @@ class VideoRecorder:
             return "jpegenc quality=90"
 
         # Default: H.264
+        # VA-API (Intel/AMD), NVENC, Quick Sync, then V4L2 M2M (ARM SoCs)
         hw = [
             ("vaapih264enc", f"rate-control=2 bitrate={br}"),
             ("vah264enc", f"rate-control=2 bitrate={br}"),
+            ("nvh264enc", f"bitrate={br} zerolatency=true"),
+            ("qsvh264enc", f"bitrate={br} gop-size=60"),
+            ("v4l2h264enc", f'extra-controls="controls,video_bitrate={br * 1000}"'),
         ]
         for name, props in hw:
             if Gst.ElementFactory.find(name):
                 log.info("Using hardware H.264 encoder: %s", name)
-                return f"{name} {props} ! h264parse"
+                return f"{_HW_ENCODER_CAPS} ! {name} {props} ! h264parse"
         log.info("Using software H.264 encoder: x264enc")
         return f"x264enc tune=4 speed-preset=3 bitrate={br} key-int-max=60 bframes=0 threads=0 ! h264parse"
 
@@ -214,7 +231,10 @@ class VideoRecorder:
     def _ensure_pipeline(self, w: int, h: int) -> bool:
         if self._pipeline:
             return True
+        with self._pipeline_lock:
+            return self._pipeline is not None or self._create_pipeline(w, h)
 
+    def _create_pipeline(self, w: int, h: int) -> bool:
         self._w = w
         self._h = h
         enc_str = self._pick_encoder_str()
@@ -271,7 +291,7 @@ class VideoRecorder:
             f"appsrc name=vsrc format=time is-live=true do-timestamp=true "
             f"caps=video/x-raw,format=BGR,width={w},height={h},framerate=30/1 ! "
             f"queue max-size-buffers=30 max-size-time=1000000000 leaky=downstream ! "
-            f"videoconvert ! {enc_str} ! "
+            f"videoconvert ! videoscale ! video/x-raw,width={w},height={h} ! {enc_str} ! "
             f"{muxer} name=mux ! filesink location=\"{escaped}\" "
             f"{audio_str}"
         )
@@ -389,6 +409,69 @@ class VideoRecorder:
             if ret != Gst.FlowReturn.OK:
                 log.warning("Recording appsrc push error: %s", ret)
 
+    def make_branch(self, mirror: bool = False) -> Gst.Bin | None:
+        """Build a bin for StreamEngine.add_branch that feeds this recording.
+
+        Frames are converted to the appsrc's BGR caps inside the preview
+        pipeline, so no frame is copied out to numpy for write_frame and
+        write_frame can still take over after a camera switch.  The
+        recording pipeline stays separate and survives camera switches;
+        the branch scales to the size the recording started with.
+        """
+        try:
+            branch = Gst.parse_bin_from_description(
+                "queue max-size-buffers=30 max-size-time=1000000000 leaky=downstream ! "
+                "videoflip name=flip ! videoconvert ! videoscale ! "
+                "capsfilter name=reccaps caps=video/x-raw,format=BGR ! "
+                "appsink name=recsink emit-signals=true sync=false drop=true max-buffers=4",
+                True,
+            )
+        except GLib.Error as exc:
+            log.warning("Failed to create recording branch: %s", exc)
+            return None
+        self._branch_flip = branch.get_by_name("flip")
+        self._branch_caps = branch.get_by_name("reccaps")
+        self.set_mirror(mirror)
+        branch.get_by_name("recsink").connect("new-sample", self._on_branch_sample)
+        return branch
+
+    def set_mirror(self, mirror: bool) -> None:
+        """Mirror frames arriving through the branch, like the preview."""
+        if self._branch_flip is not None:
+            Gst.util_set_object_arg(
+                self._branch_flip, "video-direction", "horiz" if mirror else "identity"
+            )
+
+    def _on_branch_sample(self, appsink: Any) -> Gst.FlowReturn:
+        sample = appsink.emit("pull-sample")
+        if sample is None or not self._recording:
+            return Gst.FlowReturn.OK
+        s = sample.get_caps().get_structure(0)
+        w, h = s.get_value("width"), s.get_value("height")
+        if not self._ensure_pipeline(w, h):
+            return Gst.FlowReturn.OK
+        if (w, h) != (self._w, self._h):
+            # New camera: scale in the branch from the next frame on
+            caps_el = self._branch_caps
+            if caps_el is not None:
+                caps_el.set_property("caps", Gst.Caps.from_string(
+                    f"video/x-raw,format=BGR,width={self._w},height={self._h}"
+                ))
+            return Gst.FlowReturn.OK
+        # Shallow copy without the preview's running time, so appsrc
+        # (do-timestamp=true) stamps it against the recording's clock like
+        # write_frame buffers
+        buf = sample.get_buffer().copy()
+        buf.pts = Gst.CLOCK_TIME_NONE
+        buf.dts = Gst.CLOCK_TIME_NONE
+        buf.duration = Gst.CLOCK_TIME_NONE
+        vsrc = self._vsrc
+        if vsrc:
+            ret = vsrc.emit("push-buffer", buf)
+            if ret != Gst.FlowReturn.OK:
+                log.warning("Recording appsrc push error: %s", ret)
+        return Gst.FlowReturn.OK
+
     def _on_error(self, _bus, msg):
         err, dbg = msg.parse_error()
         log.error("Recording pipeline error: %s (%s)", err.message, dbg)
@@ -113,14 +113,17 @@ class VirtualCamera:
             )
             if result.returncode != 0:
                 return devices
-            lines = result.stdout.splitlines()
-            for i, line in enumerate(lines):
-                if "v4l2loopback" in line.lower() or "bigcam" in line.lower():
-                    for j in range(i + 1, len(lines)):
-                        dev = lines[j].strip()
-                        if not dev.startswith("/dev/video"):
-                            break
+            # Single pass: a card header opens a group, its /dev/video*
+            # lines follow, and any other line closes it.
+            in_loopback = False
+            for line in result.stdout.splitlines():
+                dev = line.strip()
+                if dev.startswith("/dev/video"):
+                    if in_loopback:
                         devices.append(dev)
+                    continue
+                lower = line.lower()
+                in_loopback = "v4l2loopback" in lower or "bigcam" in lower
         except Exception:
             log.debug("v4l2loopback device scan failed", exc_info=True)
         return devices
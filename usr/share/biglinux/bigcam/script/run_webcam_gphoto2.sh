@@ -126,8 +126,9 @@ for attempt in $(seq 1 "$MAX_ATTEMPTS"); do
       \"udp://127.0.0.1:${UDP_PORT}?pkt_size=1316\""
   fi
 
+  # Detach from our stdout so the caller sees EOF as soon as this script exits
   nohup bash -c "gphoto2 --stdout --capture-movie --port '$USB_PORT' 2>\"$ERR_LOG\" | \
-    $FFMPEG_CMD >\"$LOG\" 2>&1" &
+    $FFMPEG_CMD >\"$LOG\" 2>&1" </dev/null >/dev/null 2>&1 &
   PID=$!
   disown
 
@@ -12,7 +12,7 @@ gi.require_version("Adw", "1")
 
 from gi.repository import Adw, Gtk, GLib
 
-from constants import ControlCategory, ControlType
+from constants import BackendType, ControlCategory, ControlType
 from core.camera_backend import CameraControl, CameraInfo
 from core.camera_manager import CameraManager
 from core import camera_profiles
@@ -28,6 +28,10 @@ _CATEGORY_LABELS = {
     ControlCategory.ADVANCED: _("Advanced"),
 }
 
+# Coalesce control writes for backends where each write is a slow PTP
+# transaction (ms); other backends flush on the next main-loop iteration.
+_BATCH_DELAY_MS = {BackendType.GPHOTO2: 150}
+
 _CATEGORY_ICONS = {
     ControlCategory.IMAGE: "applications-graphics-symbolic",
     ControlCategory.EXPOSURE: "camera-photo-symbolic",
@@ -52,6 +56,9 @@ class CameraControlsPage(Gtk.ScrolledWindow):
         self._camera: CameraInfo | None = None
         self._controls: list[CameraControl] = []
         self._debounce_sources: dict[str, int] = {}
+        self._pending_values: dict[str, Any] = {}
+        self._pending_camera: CameraInfo | None = None
+        self._pending_source: int | None = None
         self._ctrl_widgets: dict[str, tuple[str, Any]] = {}
         self._ctrl_rows: dict[str, Gtk.Widget] = {}
         self._resetting = False
@@ -101,12 +108,14 @@ class CameraControlsPage(Gtk.ScrolledWindow):
         controls: list[CameraControl],
     ) -> None:
         """Set camera and display pre-fetched controls (avoids USB conflict)."""
+        self._flush_pending()
         self._camera = camera
         self._controls = controls
         self._clear_content()
         self._populate(controls)
 
     def set_camera(self, camera: CameraInfo | None) -> None:
+        self._flush_pending()
         self._camera = camera
         self._clear_content()
         if camera is None:
@@ -199,7 +208,7 @@ class CameraControlsPage(Gtk.ScrolledWindow):
             if not ctrls:
                 continue
             group = Adw.PreferencesGroup(
-                title=_CATEGORY_LABELS.get(cat, cat.value),
+                title=_CATEGORY_LABELS.get(cat, cat.label),
             )
             group.set_header_suffix(self._make_reset_button(cat, ctrls))
             for ctrl in ctrls:
@@ -395,6 +404,7 @@ class CameraControlsPage(Gtk.ScrolledWindow):
         if not values:
             return
         self._resetting = True
+        items: list[tuple[str, Any]] = []
         for ctrl in self._controls:
             if ctrl.id in values:
                 val = values[ctrl.id]
@@ -411,12 +421,14 @@ class CameraControlsPage(Gtk.ScrolledWindow):
                             pass
                     elif kind == "int":
                         widget.set_value(float(val))
-                threading.Thread(
-                    target=lambda c=ctrl, v=val: self._manager.set_control(
-                        self._camera, c.id, v
-                    ),
-                    daemon=True,
-                ).start()
+                items.append((ctrl.id, val))
+        if items:
+            camera = self._camera
+            self._discard_pending([cid for cid, _val in items])
+            threading.Thread(
+                target=lambda: self._manager.set_controls(camera, items),
+                daemon=True,
+            ).start()
         self._resetting = False
         self._update_all_dependencies(self._controls)
 
@@ -470,6 +482,8 @@ class CameraControlsPage(Gtk.ScrolledWindow):
             return
         import threading
 
+        self._discard_pending([c.id for c in self._controls])
+
         def _apply():
             self._manager.reset_all_controls(self._camera, self._controls)
             # Re-apply anti-flicker after reset (power_line_frequency defaults to 0)
@@ -568,14 +582,50 @@ class CameraControlsPage(Gtk.ScrolledWindow):
         self._apply(ctrl, int(adj.get_value()))
         return False
 
-    def _apply(self, ctrl: CameraControl, value: Any) -> None:
-        if self._camera:
-            # Run v4l2-ctl subprocess in background to avoid blocking UI
-            camera = self._camera
+    def _flush_pending(self) -> bool:
+        """Send queued control writes to the camera they were made for."""
+        if self._pending_source is not None:
+            GLib.source_remove(self._pending_source)
+            self._pending_source = None
+        camera = self._pending_camera
+        items = list(self._pending_values.items())
+        self._pending_values.clear()
+        self._pending_camera = None
+        if camera and items:
+            # Run backend subprocesses in background to avoid blocking UI
             threading.Thread(
-                target=lambda: self._manager.set_control(camera, ctrl.id, value),
+                target=lambda: self._manager.set_controls(camera, items),
                 daemon=True,
             ).start()
+        return False
+
+    def _discard_pending(self, ids: list[str]) -> None:
+        """Drop queued writes for *ids*; a direct write is about to replace them."""
+        for cid in ids:
+            source = self._debounce_sources.pop(cid, None)
+            if source is not None:
+                GLib.source_remove(source)
+            if self._pending_camera is self._camera:
+                self._pending_values.pop(cid, None)
+
+    def _on_pending_timeout(self) -> bool:
+        self._pending_source = None
+        return self._flush_pending()
+
+    def _apply(self, ctrl: CameraControl, value: Any) -> None:
+        if self._camera:
+            # Queue the write; changes made in quick succession (several
+            # sliders, a profile) reach the backend as one batch.
+            camera = self._camera
+            if self._pending_camera is not camera:
+                self._flush_pending()
+                self._pending_camera = camera
+            self._pending_values[ctrl.id] = value
+            if self._pending_source is None:
+                self._pending_source = GLib.timeout_add(
+                    _BATCH_DELAY_MS.get(camera.backend, 0),
+                    self._on_pending_timeout,
+                )
             # Apply software zoom as fallback for cameras where V4L2 zoom is ineffective
             if ctrl.id == "zoom_absolute" and self._engine is not None:
                 v4l_min = ctrl.minimum or 0
@@ -626,6 +676,7 @@ class CameraControlsPage(Gtk.ScrolledWindow):
     def _on_reset(self, _btn: Gtk.Button, ctrls: list[CameraControl]) -> None:
         if self._camera:
             self._resetting = True
+            self._discard_pending([c.id for c in ctrls])
             self._manager.reset_all_controls(self._camera, ctrls)
             # Re-apply anti-flicker after reset (power_line_frequency defaults to 0)
             self._manager.apply_anti_flicker(self._camera)
@@ -18,14 +18,25 @@ from utils.i18n import _
 
 log = logging.getLogger(__name__)
 
-_BACKEND_ICONS = {
+_DEFAULT_ICON = "camera-web-symbolic"
+
+
+def _icon_table(icons: dict[BackendType, str]) -> tuple[str, ...]:
+    """Flatten *icons* into a tuple indexed by the BackendType value."""
+    table = [_DEFAULT_ICON] * (max(BackendType) + 1)
+    for backend, icon in icons.items():
+        table[backend] = icon
+    return tuple(table)
+
+
+_BACKEND_ICONS = _icon_table({
     BackendType.V4L2: "camera-web-symbolic",
     BackendType.GPHOTO2: "camera-photo-symbolic",
     BackendType.LIBCAMERA: "camera-video-symbolic",
     BackendType.PIPEWIRE: "audio-card-symbolic",
     BackendType.IP: "network-server-symbolic",
     BackendType.PHONE: "phone-symbolic",
-}
+})
 
 
 class _CameraItem(GObject.Object):
@@ -38,7 +49,7 @@ class _CameraItem(GObject.Object):
         super().__init__()
         self.camera = camera
         self.name = camera.name
-        self.icon = _BACKEND_ICONS.get(camera.backend, "camera-web-symbolic")
+        self.icon = _BACKEND_ICONS[camera.backend]
 
 
 class CameraSelector(Gtk.Box):
@@ -52,6 +63,7 @@ class CameraSelector(Gtk.Box):
         super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         self._manager = camera_manager
         self._cameras: list[CameraInfo] = []
+        self._prev_ids: tuple[str, ...] = ()
         self._model = Gio.ListStore.new(_CameraItem)
 
         factory = Gtk.SignalListItemFactory()
@@ -112,13 +124,16 @@ class CameraSelector(Gtk.Box):
     def _on_cameras_changed(self, _manager: CameraManager) -> None:
         old_cam = self.selected_camera
         self._cameras = self._manager.cameras
+        new_ids = tuple(c.id for c in self._cameras)
+        if new_ids == self._prev_ids:
+            # Spurious refresh (udev churn): same cameras in the same order
+            return
+        self._prev_ids = new_ids
         log.info("_on_cameras_changed: %d cameras, old=%s", len(self._cameras), old_cam.name if old_cam else None)
 
         # Block handler completely during rebuild
         self._dropdown.handler_block(self._sig_selected)
-        self._model.remove_all()
-        for cam in self._cameras:
-            self._model.append(_CameraItem(cam))
+        self._splice_changed(self._cameras)
         if self._cameras:
             restore_idx = 0
             if old_cam:
@@ -126,12 +141,44 @@ class CameraSelector(Gtk.Box):
                     (i for i, c in enumerate(self._cameras) if c.id == old_cam.id),
                     0,
                 )
-            self._dropdown.set_selected(restore_idx)
+            if self._dropdown.get_selected() != restore_idx:
+                self._dropdown.set_selected(restore_idx)
             # Mark this as the confirmed selection — any bounce back to this is ignored
             self._confirmed_cam_id = self._cameras[restore_idx].id
         self._dropdown.handler_unblock(self._sig_selected)
         log.info("_on_cameras_changed: done, confirmed=%s", self._confirmed_cam_id)
 
+    def _splice_changed(self, cameras: list[CameraInfo]) -> None:
+        """Replace only the range of model items whose camera changed.
+
+        Items in the unchanged prefix and suffix (matched by camera id) are
+        kept, so their rows and active markers survive a hotplug event.
+        """
+        old_n = self._model.get_n_items()
+        new_n = len(cameras)
+        start = 0
+        while start < min(old_n, new_n):
+            item = self._model.get_item(start)
+            if item.camera.id != cameras[start].id:
+                break
+            item.camera = cameras[start]
+            start += 1
+        end_old, end_new = old_n, new_n
+        while end_old > start and end_new > start:
+            item = self._model.get_item(end_old - 1)
+            if item.camera.id != cameras[end_new - 1].id:
+                break
+            item.camera = cameras[end_new - 1]
+            end_old -= 1
+            end_new -= 1
+        if start == end_old and start == end_new:
+            return
+        self._model.splice(
+            start,
+            end_old - start,
+            [_CameraItem(cam) for cam in cameras[start:end_new]],
+        )
+
     def set_selected_silent(self, idx: int) -> None:
         """Set dropdown selection without emitting camera-selected signal."""
         self._dropdown.handler_block(self._sig_selected)
@@ -6,6 +6,8 @@ import os
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Callable
 
 import gi
 
@@ -18,6 +20,9 @@ from utils import xdg
 from utils.i18n import _
 
 
+_PHOTO_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+
 def _human_size(nbytes: int) -> str:
     for unit in ("B", "KB", "MB", "GB"):
         if nbytes < 1024:
@@ -30,6 +35,44 @@ def _human_date(timestamp: float) -> str:
     return time.strftime("%d/%m/%Y  %H:%M", time.localtime(timestamp))
 
 
+def _thumb_cache_path(path: str, size: int) -> str | None:
+    """Cached thumbnail file for *path*, keyed on its mtime and size."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    name = f"{st.st_mtime_ns}-{st.st_size}-{size}-{os.path.basename(path)}.png"
+    return os.path.join(xdg.photo_thumbs_dir(), name)
+
+
+def _decode_scaled(path: str, size: int, cache_path: str | None) -> GdkPixbuf.Pixbuf | None:
+    """Worker thread: decode *path* at thumbnail size and store it in the cache."""
+    try:
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size, size, True)
+    except GLib.Error:
+        return None
+    if cache_path:
+        # Write aside and rename, so a concurrent refresh never reads half a file
+        tmp = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            pixbuf.savev(tmp, "png", [], [])
+            os.replace(tmp, cache_path)
+        except (GLib.Error, OSError):
+            pass
+    return pixbuf
+
+
+def _drop_cached_thumbs(path: str) -> None:
+    suffix = f"-{os.path.basename(path)}.png"
+    try:
+        with os.scandir(xdg.photo_thumbs_dir()) as it:
+            for entry in it:
+                if entry.name.endswith(suffix):
+                    os.remove(entry.path)
+    except OSError:
+        pass
+
+
 class PhotoGallery(Gtk.Box):
     """Gallery of captured photo thumbnails with grid/list and bulk selection."""
 
@@ -43,7 +86,11 @@ class PhotoGallery(Gtk.Box):
         self._selected: set[str] = set()
         self._view = "grid"
         self._items: list[str] = []
-        self._thumb_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="thumb")
+        # Shown photos: path -> (mtime_ns, widget), in the current view
+        self._current: dict[str, tuple[int, Gtk.Widget]] = {}
+        self._thumb_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4, thread_name_prefix="thumb"
+        )
 
         # ── Header ───────────────────────────────────────────────────
         header = Gtk.Box(
@@ -165,14 +212,14 @@ class PhotoGallery(Gtk.Box):
         if not btn.get_active():
             return
         self._view = mode
-        self.refresh()
+        self._rebuild()
 
     def _on_select_toggled(self, btn: Gtk.ToggleButton) -> None:
         self._selection_mode = btn.get_active()
         self._selected.clear()
         self._action_bar.set_visible(self._selection_mode)
         self._update_sel_label()
-        self.refresh()
+        self._rebuild()
 
     def _update_sel_label(self) -> None:
         n = len(self._selected)
@@ -186,50 +233,63 @@ class PhotoGallery(Gtk.Box):
         self.refresh()
 
     def refresh(self) -> None:
-        # Clear grid
-        child = self._flowbox.get_first_child()
-        while child:
-            nxt = child.get_next_sibling()
-            self._flowbox.remove(child)
-            child = nxt
-        # Clear list
-        child = self._listbox.get_first_child()
-        while child:
-            nxt = child.get_next_sibling()
-            self._listbox.remove(child)
-            child = nxt
-
-        self._items = self._list_photos()
-        has = len(self._items) > 0
+        """Sync the view with the photos folder.
+
+        Only photos that were added, changed or deleted since the last
+        refresh get their widgets created or removed.
+        """
+        photos = self._list_photos()
+        self._items = [path for path, _mtime in photos]
+        has = len(photos) > 0
         self._empty.set_visible(not has)
         self._scroll.set_visible(has)
 
         self._stack.set_visible_child_name(self._view)
 
-        for path in self._items[:100]:
+        shown = photos[:100]
+        wanted = dict(shown)
+        container = self._flowbox if self._view == "grid" else self._listbox
+        for path, (mtime, widget) in list(self._current.items()):
+            if wanted.get(path) != mtime:
+                container.remove(widget)
+                del self._current[path]
+
+        # Newest first: unchanged photos keep their relative order, so each
+        # new one goes in at its index in the sorted list
+        for position, (path, mtime) in enumerate(shown):
+            if path in self._current:
+                continue
             if self._view == "grid":
                 w = self._make_grid_item(path)
             else:
                 w = self._make_list_item(path)
             if w:
-                if self._view == "grid":
-                    self._flowbox.append(w)
-                else:
-                    self._listbox.append(w)
+                container.insert(w, position)
+                self._current[path] = (mtime, w)
+
+    def _rebuild(self) -> None:
+        """Recreate every item, for view and selection mode changes."""
+        for container in (self._flowbox, self._listbox):
+            child = container.get_first_child()
+            while child:
+                nxt = child.get_next_sibling()
+                container.remove(child)
+                child = nxt
+        self._current.clear()
+        self.refresh()
 
-    def _list_photos(self) -> list[str]:
+    def _list_photos(self) -> list[tuple[str, int]]:
+        """Photos as (path, mtime_ns), newest first."""
         if not os.path.isdir(self._photos_dir):
             return []
-        files: list[str] = []
-        for entry in sorted(
-            os.scandir(self._photos_dir),
-            key=lambda e: e.stat().st_mtime,
-            reverse=True,
-        ):
-            if entry.is_file() and entry.name.lower().endswith(
-                (".jpg", ".jpeg", ".png", ".webp")
-            ):
-                files.append(entry.path)
+        # One stat per photo, taken before sorting
+        with os.scandir(self._photos_dir) as it:
+            files = [
+                (entry.path, entry.stat().st_mtime_ns)
+                for entry in it
+                if entry.name.lower().endswith(_PHOTO_EXTENSIONS) and entry.is_file()
+            ]
+        files.sort(key=itemgetter(1), reverse=True)
         return files
 
     # ── Grid item ────────────────────────────────────────────────────
@@ -240,21 +300,11 @@ class PhotoGallery(Gtk.Box):
         picture.set_size_request(self.THUMB_SIZE, self.THUMB_SIZE)
         picture.add_css_class("card")
 
-        # Load thumbnail asynchronously
-        def _load():
-            try:
-                return GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    path, self.THUMB_SIZE, self.THUMB_SIZE, True
-                )
-            except Exception:
-                return None
-
-        def _on_loaded(pixbuf):
-            if pixbuf:
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        def _on_loaded(texture: Gdk.Texture | None) -> None:
+            if texture:
                 picture.set_paintable(texture)
 
-        self._thumb_pool.submit(lambda: GLib.idle_add(_on_loaded, _load()))
+        self._load_thumbnail(path, self.THUMB_SIZE, _on_loaded)
 
         overlay = Gtk.Overlay()
 
@@ -321,24 +371,15 @@ class PhotoGallery(Gtk.Box):
         frame.set_child(pic)
         row.add_prefix(frame)
 
-        def _load_list_thumb():
-            try:
-                return GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    path, self.LIST_THUMB, self.LIST_THUMB, True
-                )
-            except Exception:
-                return None
-
-        def _on_list_thumb(pixbuf):
-            if pixbuf:
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        def _on_list_thumb(texture: Gdk.Texture | None) -> None:
+            if texture:
                 pic.set_paintable(texture)
             else:
                 icon = Gtk.Image.new_from_icon_name("image-x-generic-symbolic")
                 icon.set_pixel_size(self.LIST_THUMB)
                 frame.set_child(icon)
 
-        self._thumb_pool.submit(lambda: GLib.idle_add(_on_list_thumb, _load_list_thumb()))
+        self._load_thumbnail(path, self.LIST_THUMB, _on_list_thumb)
 
         if self._selection_mode:
             check = Gtk.CheckButton(active=path in self._selected)
@@ -360,6 +401,32 @@ class PhotoGallery(Gtk.Box):
     def _on_row_activated(self, _row: Adw.ActionRow, path: str) -> None:
         self._on_open_photo(None, path)
 
+    # ── Thumbnails ───────────────────────────────────────────────────
+
+    def _load_thumbnail(
+        self, path: str, size: int, on_loaded: Callable[[Gdk.Texture | None], None]
+    ) -> None:
+        """Pass *path*'s thumbnail to *on_loaded* on the main thread.
+
+        Cached thumbnails are small PNGs and load right away; anything else
+        is decoded on the thumbnail pool and cached for the next time.
+        """
+        cache_path = _thumb_cache_path(path, size)
+        if cache_path:
+            try:
+                on_loaded(Gdk.Texture.new_from_filename(cache_path))
+                return
+            except GLib.Error:
+                pass
+
+        def _on_decoded(pixbuf: GdkPixbuf.Pixbuf | None) -> bool:
+            on_loaded(Gdk.Texture.new_for_pixbuf(pixbuf) if pixbuf else None)
+            return False
+
+        self._thumb_pool.submit(
+            lambda: GLib.idle_add(_on_decoded, _decode_scaled(path, size, cache_path))
+        )
+
     # ── Selection ────────────────────────────────────────────────────
 
     def _on_check_toggled(self, check: Gtk.CheckButton, path: str) -> None:
@@ -373,7 +440,7 @@ class PhotoGallery(Gtk.Box):
         all_selected = len(self._selected) == len(self._items[:100])
         self._selected = set() if all_selected else set(self._items[:100])
         self._update_sel_label()
-        self.refresh()
+        self._rebuild()
 
     def _on_delete_selected(self, _btn: Gtk.Button) -> None:
         if not self._selected:
@@ -399,6 +466,7 @@ class PhotoGallery(Gtk.Box):
                 os.remove(p)
             except OSError:
                 pass
+            _drop_cached_thumbs(p)
         self._selected.clear()
         self._update_sel_label()
         self.refresh()
@@ -436,4 +504,5 @@ class PhotoGallery(Gtk.Box):
             os.remove(path)
         except OSError:
             pass
+        _drop_cached_thumbs(path)
         self.refresh()
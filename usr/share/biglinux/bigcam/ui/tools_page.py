@@ -135,7 +135,7 @@ class ToolsPage(Gtk.ScrolledWindow):
 
     def _on_qr_toggled(self, row: Adw.SwitchRow, _pspec: Any) -> None:
         self._qr_active = row.get_active()
-        log.debug(f"QR toggle: active={self._qr_active}")
+        log.debug("QR toggle: active=%s", self._qr_active)
         self._engine.set_qr_scanning(self._qr_active)
         if self._qr_active:
             self._init_qr_detector()
@@ -209,7 +209,7 @@ class ToolsPage(Gtk.ScrolledWindow):
             return True
         self._qr_scanning = True
         frame_copy = frame.copy()
-        log.debug(f"QR scan starting, frame shape: {frame_copy.shape}")
+        log.debug("QR scan starting, frame shape: %s", frame_copy.shape)
         threading.Thread(
             target=self._scan_qr_worker, args=(frame_copy,), daemon=True
         ).start()
@@ -220,7 +220,7 @@ class ToolsPage(Gtk.ScrolledWindow):
         try:
             # Try original frame first
             data, points = self._try_detect_qr(frame)
-            log.debug(f"QR worker: original result='{data[:30] if data else ''}'")
+            log.debug("QR worker: original result='%.30s'", data or "")
 
             # Try upscaled for small QR codes
             if not data:
@@ -282,7 +282,7 @@ class ToolsPage(Gtk.ScrolledWindow):
         self._qr_scanning = False
         self._engine.set_overlay_rects(rects)
         if rects:
-            log.debug(f"QR overlay rects: {rects}")
+            log.debug("QR overlay rects: %s", rects)
         if data and data != self._last_qr_text:
             self._last_qr_text = data
             self.emit("qr-detected", data)
@@ -391,12 +391,14 @@ class ToolsPage(Gtk.ScrolledWindow):
         os.makedirs(output_dir, exist_ok=True)
         output_path = os.path.join(output_dir, f"bigcam_smile_{timestamp}.png")
 
-        ok = self._engine.capture_snapshot(output_path)
-        if ok:
-            self._smile_status.set_text(_("Photo saved!"))
-            self.emit("smile-captured", output_path)
-        else:
-            self._smile_status.set_text(_("Capture failed."))
+        def _on_saved(ok: bool) -> None:
+            if ok:
+                self._smile_status.set_text(_("Photo saved!"))
+                self.emit("smile-captured", output_path)
+            else:
+                self._smile_status.set_text(_("Capture failed."))
+
+        self._engine.capture_snapshot(output_path, _on_saved)
 
         # Cooldown 3 seconds before next capture
         GLib.timeout_add(3000, self._reset_smile_cooldown)
@@ -60,7 +60,9 @@ class BigDigicamWindow(Adw.ApplicationWindow):
         self._stream_engine = StreamEngine(self._camera_manager)
         self._stream_engine.mirror = bool(self._settings.get("mirror_preview"))
         self._stream_engine.prefer_v4l2 = bool(self._settings.get("prefer-v4l2"))
-        self._photo_capture = PhotoCapture(self._camera_manager)
+        self._photo_capture = PhotoCapture(
+            self._camera_manager, self._stream_engine.capture_snapshot
+        )
         self._video_recorder = VideoRecorder(self._camera_manager)
         self._video_recorder.configure(
             video_codec=self._settings.get("recording-video-codec"),
@@ -1367,7 +1369,8 @@ class BigDigicamWindow(Adw.ApplicationWindow):
         )
 
         log.debug(
-            f"Camera selected: {camera.name}, backend={camera.backend}, needs_setup={needs_setup}"
+            "Camera selected: %s, backend=%s, needs_setup=%s",
+            camera.name, camera.backend, needs_setup,
         )
 
         if needs_setup:
@@ -1387,14 +1390,15 @@ class BigDigicamWindow(Adw.ApplicationWindow):
             cached_controls = self._controls_cache.get(camera.id)
 
             log.debug(
-                f"already_streaming={already_streaming}, cached_controls={cached_controls is not None}, camera.id={camera.id}"
+                "already_streaming=%s, cached_controls=%s, camera.id=%s",
+                already_streaming, cached_controls is not None, camera.id,
             )
             if hasattr(backend, "_active_streams"):
-                log.debug(f"_active_streams={dict(backend._active_streams)}")
+                log.debug("_active_streams=%s", backend._active_streams)
 
             if already_streaming and cached_controls is not None:
                 # Hot-swap: camera already streaming, just switch the GStreamer pipeline
-                log.debug(f"Hot-swap to {camera.name} (already streaming)")
+                log.debug("Hot-swap to %s (already streaming)", camera.name)
                 self._stream_engine.stop(stop_backend=False, keep_vcam=True)
                 self._controls_page.set_camera_with_controls(camera, cached_controls)
                 self._stream_engine.play(camera, streaming_ready=True)
@@ -1441,7 +1445,7 @@ class BigDigicamWindow(Adw.ApplicationWindow):
                     if controls is None:
                         log.debug("Fetching gPhoto2 controls before streaming...")
                         controls = self._camera_manager.get_controls(camera)
-                        log.debug(f"Got {len(controls)} controls")
+                        log.debug("Got %d controls", len(controls))
 
                     if already_streaming:
                         log.debug("Camera already streaming, skipping start")
@@ -1449,7 +1453,7 @@ class BigDigicamWindow(Adw.ApplicationWindow):
 
                     log.debug("Starting streaming...")
                     success = backend.start_streaming(camera)
-                    log.debug(f"Streaming result: {success}")
+                    log.debug("Streaming result: %s", success)
                     if success:
                         GLib.idle_add(
                             lambda: (
@@ -1465,7 +1469,7 @@ class BigDigicamWindow(Adw.ApplicationWindow):
 
             def on_done(result: tuple[bool, list]) -> None:
                 success, controls = result
-                log.debug(f"on_done: success={success}, controls={len(controls)}")
+                log.debug("on_done: success=%s, controls=%d", success, len(controls))
                 self._dismiss_notification()
                 if success:
                     self._controls_cache[camera.id] = controls
@@ -1816,16 +1820,12 @@ class BigDigicamWindow(Adw.ApplicationWindow):
         self._trigger_flash()
         self._show_notification(_("Capturing photo…"), "info", 1500)
 
-        import time as _time
-        from utils import xdg
-
-        timestamp = _time.strftime("%Y%m%d_%H%M%S")
-        output_dir = xdg.photos_dir()
-        os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, f"bigcam_{timestamp}.png")
+        # Newest preview frame, no backend round-trip; the PNG is encoded
+        # off the main thread
+        self._photo_capture.capture_frame_async(self._on_webcam_frame_saved)
 
-        ok = self._stream_engine.capture_snapshot(output_path)
-        if ok:
+    def _on_webcam_frame_saved(self, output_path: str | None) -> None:
+        if output_path:
             self._show_notification(_("Photo saved!"), "success")
             self._gallery.refresh()
             self._update_last_media_thumbnail(output_path)
@@ -2584,8 +2584,7 @@ class BigDigicamWindow(Adw.ApplicationWindow):
         values = camera_profiles.load_profile(camera, name)
 
         def _apply() -> None:
-            for ctrl_id, value in values.items():
-                self._camera_manager.set_control(camera, ctrl_id, value)
+            self._camera_manager.set_controls(camera, list(values.items()))
 
         def _on_applied(_result: None = None) -> None:
             self._controls_page.set_camera(camera)
@@ -0,0 +1,31 @@
+"""Subprocess helpers – launch short-lived tools with a cached $PATH lookup."""
+
+from __future__ import annotations
+
+import functools
+import shutil
+import subprocess
+from typing import Any, Sequence
+
+
+@functools.lru_cache(maxsize=64)
+def _executable(name: str) -> str | None:
+    """Absolute path of *name* on $PATH (None if missing or already a path)."""
+    if "/" in name:
+        return None
+    return shutil.which(name)
+
+
+def run(cmd: Sequence[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """``subprocess.run()`` with the executable resolved once per name.
+
+    Descriptors are still closed in the child (close_fds=True): libraries
+    such as OpenCV's V4L2 backend open camera nodes without O_CLOEXEC, and
+    helpers like v4l2-ctl or gphoto2 must not keep those open.  CPython
+    closes them with close_range() after vfork, so this costs little.
+    """
+    if "executable" not in kwargs:
+        exe = _executable(cmd[0])
+        if exe is not None:
+            kwargs["executable"] = exe
+    return subprocess.run(cmd, **kwargs)
@@ -59,3 +59,7 @@ def profiles_dir() -> str:
 
 def thumbs_dir() -> str:
     return _ensure(os.path.join(cache_dir(), "thumbs"))
+
+
+def photo_thumbs_dir() -> str:
+    return _ensure(os.path.join(thumbs_dir(), "photos"))